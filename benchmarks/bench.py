@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+# benchmarks/bench.py
+# Fixed-workload benchmarks for the core engines — calls/sec, p50/p99, JSON results, baseline comparison
+#
+# Usage:
+#   python benchmarks/bench.py                         # run every workload, compare against the baseline
+#   python benchmarks/bench.py observe scan_year       # run selected workloads (prefix match)
+#   python benchmarks/bench.py --quick                 # shrink workloads ~10x for a smoke run
+#   python benchmarks/bench.py --update-baseline       # run and store the results as the new baseline
+#   python benchmarks/bench.py --list                  # list workloads
+#
+# Defaults:
+#   results   = benchmarks/results/<timestamp>.json
+#   baseline  = benchmarks/baseline.json
+#   threshold = 0.10  (p50 more than 10% slower than baseline → regression, exit status 1)
+
+# Standard Modules
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.client import HTTPConnection
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+# Internal Modules
+from atlas.core.atlas import Atlas
+from atlas.core.observatory import Observatory
+from atlas.models.aspect import build_aspects, build_transit_aspects
+from atlas.models.celestial_state import CelestialState
+from atlas.models.location import Location
+from atlas.utils.chrono import convert_to_utc
+from atlas.utils.config import load_config
+from atlas.utils.constellation import identify_constellation, identify_constellations
+
+# External Modules
+import numpy as np
+
+
+_BENCH_DIR   = Path(__file__).resolve().parent
+_RESULTS_DIR = _BENCH_DIR / "results"
+_BASELINE    = _BENCH_DIR / "baseline.json"
+
+_EPOCH    = datetime(2026, 1, 1)
+_LOCATION = Location(lat=51.4779, lon=-0.0015, alt=46.0)  # Greenwich
+_N_BODIES = 20
+_SEED     = 1875
+
+
+ #=========#
+# HARNESS #
+ #=========#
+
+@dataclass
+class Workload:
+    name:        str
+    description: str
+    setup:       Callable[[bool], tuple[Callable[[], object], int]]  # quick → (call, ops per call)
+    calls:       int = 1     # timed calls per run (per-call latency → p50/p99)
+    quick_calls: int = 1
+    warmup:      int = 1
+
+
+@dataclass
+class Result:
+    name:        str
+    description: str
+    calls:       int
+    ops:         int
+    samples:     list[float] = field(repr=False)
+
+    @property
+    def total(self) -> float:
+        return sum(self.samples)
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.samples, q))
+
+    def to_json(self) -> dict:
+        return {
+            "description":  self.description,
+            "calls":        self.calls,
+            "ops_per_call": self.ops,
+            "total_s":      self.total,
+            "calls_per_s":  self.calls / self.total,
+            "ops_per_s":    self.calls * self.ops / self.total,
+            "mean_s":       statistics.fmean(self.samples),
+            "p50_s":        self.percentile(50),
+            "p99_s":        self.percentile(99),
+            "min_s":        min(self.samples),
+            "max_s":        max(self.samples),
+        }
+
+
+WORKLOADS: dict[str, Workload] = {}
+
+
+def workload(name: str, description: str, calls: int = 1, quick_calls: Optional[int] = None, warmup: int = 1):
+    def register(setup):
+        WORKLOADS[name] = Workload(name, description, setup, calls, quick_calls or max(1, calls // 10), warmup)
+        return setup
+    return register
+
+
+# Resources a workload's setup holds open for its run (servers, connections) — closed when the run ends
+_TEARDOWN = contextlib.ExitStack()
+
+
+# Time each call individually so p50/p99 reflect per-call latency, not the batch average
+def run_workload(w: Workload, quick: bool) -> Result:
+    with _TEARDOWN:
+        call, ops = w.setup(quick)
+        for _ in range(w.warmup):
+            call()
+
+        calls   = w.quick_calls if quick else w.calls
+        samples = []
+        clock   = time.perf_counter
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(calls):
+                t0 = clock()
+                call()
+                samples.append(clock() - t0)
+        finally:
+            gc.enable()
+    return Result(w.name, w.description, calls, ops, samples)
+
+
+ #==========#
+# FIXTURES #
+ #==========#
+
+_ATLAS: Optional[Atlas] = None
+_BODIES: Optional[list[str]] = None
+
+
+def _atlas() -> Atlas:
+    global _ATLAS
+    if _ATLAS is None:
+        ephe_path = load_config().get("ephemeris", {}).get("path", "")
+        _ATLAS    = Atlas(observatory=Observatory(ephe_path=ephe_path, dt=_EPOCH, location=_LOCATION))
+    return _ATLAS
+
+
+# First N configured non-star bodies that resolve with the installed ephemeris files
+def _bodies() -> list[str]:
+    global _BODIES
+    if _BODIES is None:
+        atlas = _atlas()
+        atlas._observatory.set(dt=_EPOCH, location=_LOCATION).align(zodiac="tropical")
+        _BODIES = []
+        for key, info in atlas._config.get("celestials", {}).items():
+            if info.get("type") == "star" and key != "sun":
+                continue
+            try:
+                atlas._sample(key, ["position", "phenomenon"], ["ecliptic"])
+            except Exception:
+                print(f"  skipping {key}: not available with the installed ephemeris files", file=sys.stderr)
+                continue
+            _BODIES.append(key)
+            if len(_BODIES) == _N_BODIES:
+                break
+    return _BODIES
+
+
+# Synthetic states spread over the ecliptic — pure-geometry inputs for the aspect workloads
+def _synthetic_states(n: int, rng: random.Random) -> list[CelestialState]:
+    states = []
+    for i in range(n):
+        c = CelestialState(id=i, glyph="*", name=f"body{i}", type="superior", dt=_EPOCH, location=_LOCATION)
+        c.lon, c.lat, c.dlon = rng.uniform(0, 360), rng.uniform(-5, 5), rng.uniform(-1, 1)
+        states.append(c)
+    return states
+
+
+ #===========#
+# WORKLOADS #
+ #===========#
+
+@workload("observe", "Observatory.observe — one body, dt advanced 1 min per call (no calc-cache hits)", calls=20_000)
+def _observe(quick: bool):
+    obs = _atlas()._observatory
+    obs.set(dt=_EPOCH, location=_LOCATION).align(zodiac="tropical").project("ecliptic").orient("geocentric")
+    step = timedelta(minutes=1)
+
+    def call():
+        obs.shift(t_delta=step)
+        obs.observe(1)
+    return call, 1
+
+
+@workload("sample", "Atlas._sample — 20 bodies, position + phenomenon, ecliptic", calls=2_000)
+def _sample(quick: bool):
+    atlas, bodies = _atlas(), _bodies()
+    obs  = atlas._observatory
+    obs.set(dt=_EPOCH, location=_LOCATION).align(zodiac="tropical")
+    step = timedelta(minutes=1)
+
+    def call():
+        obs.shift(t_delta=step)
+        for b in bodies:
+            atlas._sample(b, ["position", "phenomenon"], ["ecliptic"])
+    return call, len(bodies)
+
+
+@workload("trace_year", "build_celestial_trace — Moon, 1 year hourly", calls=5)
+def _trace_year(quick: bool):
+    atlas = _atlas()
+    end   = _EPOCH + (timedelta(days=36) if quick else timedelta(days=365))
+    n     = int((end - _EPOCH) / timedelta(hours=1)) + 1
+
+    def call():
+        atlas.build_celestial_trace("moon", _EPOCH, end, timedelta(hours=1), _LOCATION)
+    return call, n
+
+
+@workload("frame_year", "build_celestial_frame — 20 bodies, 1 year hourly", calls=3)
+def _frame_year(quick: bool):
+    atlas, bodies = _atlas(), _bodies()
+    end = _EPOCH + (timedelta(days=36) if quick else timedelta(days=365))
+    n   = int((end - _EPOCH) / timedelta(hours=1)) + 1
+
+    def call():
+        atlas.build_celestial_frame(bodies, _EPOCH, end, timedelta(hours=1), _LOCATION, "tropical")
+    return call, n * len(bodies)
+
+
+@workload("scan_year", "Scanner.scan_events — 20 bodies, 1 year hourly, all event types except diurnal", calls=1, warmup=0)
+def _scan_year(quick: bool):
+    atlas, bodies = _atlas(), _bodies()
+    end   = _EPOCH + (timedelta(days=7) if quick else timedelta(days=365))
+    types = ["aspect", "ingress", "station", "phase", "elongation"]
+    n     = int((end - _EPOCH) / timedelta(hours=1)) + 1
+
+    def call():
+        atlas.build_events(bodies, _EPOCH, end, _LOCATION, event_types=types)
+    return call, n * len(bodies)
+
+
+# One workload per event type — 30 days hourly; diurnal uses the Sun/Moon only (it needs horizontal coordinates)
+def _scan_type(event_type: str):
+    def setup(quick: bool):
+        atlas = _atlas()
+        bodies = ["sun", "moon"] if event_type == "diurnal" else _bodies()
+        end    = _EPOCH + (timedelta(days=3) if quick else timedelta(days=30))
+        n      = int((end - _EPOCH) / timedelta(hours=1)) + 1
+
+        def call():
+            atlas.build_events(bodies, _EPOCH, end, _LOCATION, event_types=[event_type])
+        return call, n * len(bodies)
+    return setup
+
+
+for _type in ("aspect", "ingress", "station", "phase", "elongation", "diurnal"):
+    workload(f"scan_{_type}", f"Scanner.scan_events — {_type} only, 30 days hourly", calls=3, warmup=0)(_scan_type(_type))
+
+
+@workload("aspects_20", "build_aspects — 20 bodies (190 pairs)", calls=20_000)
+def _aspects_20(quick: bool):
+    states = _synthetic_states(20, random.Random(_SEED))
+
+    def call():
+        build_aspects(states)
+    return call, 190
+
+
+@workload("aspect_grid_10k", "build_transit_aspects — 100 natal × 100 transit bodies (10k-cell grid)", calls=200)
+def _aspect_grid_10k(quick: bool):
+    rng     = random.Random(_SEED)
+    natal   = _synthetic_states(100, rng)
+    transit = _synthetic_states(100, rng)
+
+    def call():
+        build_transit_aspects(natal, transit)
+    return call, 10_000
+
+
+@workload("constellation", "identify_constellation — uniformly random sky positions", calls=10_000)
+def _constellation(quick: bool):
+    rng    = random.Random(_SEED)
+    points = [(rng.uniform(0, 360), np.degrees(np.arcsin(rng.uniform(-1, 1)))) for _ in range(1024)]
+    it     = iter(range(1 << 62))
+
+    def call():
+        ra, dec = points[next(it) & 1023]
+        identify_constellation(ra, dec)
+    return call, 1
+
+
+@workload("constellations_100k", "identify_constellations — 100k random sky positions in one call", calls=50)
+def _constellations_100k(quick: bool):
+    rng = np.random.default_rng(_SEED)
+    ra  = rng.uniform(0, 360, 100_000)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 100_000)))
+
+    def call():
+        identify_constellations(ra, dec)
+    return call, 100_000
+
+
+@workload("convert_to_utc", "convert_to_utc — random land/sea locations", calls=1_000)
+def _convert_to_utc(quick: bool):
+    rng  = random.Random(_SEED)
+    locs = [Location(lat=rng.uniform(-60, 70), lon=rng.uniform(-180, 180), alt=0.0) for _ in range(64)]
+    it   = iter(range(1 << 62))
+
+    def call():
+        convert_to_utc(_EPOCH, locs[next(it) & 63])
+    return call, 1
+
+
+# One chart ring per call, as in live playback: 60 bodies crowded into a third of the wheel, drifting a little each frame
+@workload("label_layout", "_resolve_collisions — 60 crowded labels, drifting 0.02°/frame, cached layout", calls=5_000)
+def _label_layout(quick: bool):
+    from atlas.view.chart import _LabelLayout, _LabelNode, _resolve_collisions
+
+    rng    = random.Random(_SEED)
+    base   = [rng.uniform(0, 120) for _ in range(60)]
+    rates  = [rng.uniform(-1, 1) * 0.02 for _ in base]
+    layout = _LabelLayout()
+    frame  = iter(range(1 << 62))
+
+    def call():
+        f     = next(frame)
+        nodes = [_LabelNode(lon=(x + r * f) % 360, chart_lon=0.0, data=None) for x, r in zip(base, rates)]
+        _resolve_collisions(nodes, layout=layout)
+    return call, 1
+
+
+# The HTTP app served by uvicorn in a background thread on a free local port; yields the port, stops on exit
+@contextlib.contextmanager
+def _serving() -> Iterator[int]:
+    import uvicorn
+    from atlas.serve import create_app
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(create_app(), host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    try:
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("uvicorn exited before serving")
+            time.sleep(0.01)
+        yield port
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+# /observe over a real socket: uvicorn in a background thread, one keep-alive client connection
+@workload("serve_observe", "GET /observe — 1k requests, default bodies, position + phenomenon", calls=1_000, warmup=10)
+def _serve_observe(quick: bool):
+    port    = _TEARDOWN.enter_context(_serving())
+    targets = ",".join(b for b in _bodies() if b in ("sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn"))
+    conn    = _TEARDOWN.enter_context(contextlib.closing(HTTPConnection("127.0.0.1", port)))
+    minute  = iter(range(1 << 62))
+
+    def call():
+        at = (_EPOCH + timedelta(minutes=next(minute))).strftime("%Y-%m-%dT%H:%M:%S")
+        conn.request("GET", f"/observe?targets={targets}&at={at}")
+        resp = conn.getresponse()
+        resp.read()
+        if resp.status != 200:
+            raise RuntimeError(f"/observe returned {resp.status}")
+    return call, 1
+
+
+# Offscreen chart rendering on one warm context — cusps rotated per call so every image is rebuilt
+@workload("chart_png", "render_chart_png — 900px radix chart, 20 synthetic bodies, PNG encode included", calls=200)
+def _chart_png(quick: bool):
+    from atlas.view.offscreen import render_chart_png
+
+    states = _synthetic_states(_N_BODIES, random.Random(_SEED))
+    for c in states:
+        c.glyph = "☉"
+    aspects = build_aspects(states)
+    turn    = iter(range(1 << 62))
+
+    def call():
+        base = next(turn) % 360
+        render_chart_png([(base + 30 * i) % 360 for i in range(12)], states, aspects, size=900)
+    return call, 1
+
+
+# One comparison sheet per call: 24 charts with rotated cusps in a 6 × 4 grid
+@workload("chart_grid", "OffscreenRenderer.render_chart_grid — 24 radix charts, 400px tiles, one framebuffer", calls=20, warmup=2)
+def _chart_grid(quick: bool):
+    from atlas.view.offscreen import default_renderer
+
+    states = _synthetic_states(_N_BODIES, random.Random(_SEED))
+    for c in states:
+        c.glyph = "☉"
+    aspects = build_aspects(states)
+    charts  = [([(7 * k + 30 * i) % 360 for i in range(12)], states, aspects, f"Chart {k}") for k in range(24)]
+
+    def call():
+        default_renderer().render_chart_grid(charts, cols=6, tile=400)
+    return call, 24
+
+
+# /chart.png misses: a new minute per request so the image cache never hits
+@workload("serve_chart_png", "GET /chart.png — 600px, 7 bodies, cache misses", calls=100, warmup=2)
+def _serve_chart_png(quick: bool):
+    port    = _TEARDOWN.enter_context(_serving())
+    targets = ",".join(b for b in _bodies() if b in ("sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn"))
+    conn    = _TEARDOWN.enter_context(contextlib.closing(HTTPConnection("127.0.0.1", port)))
+    minute  = iter(range(1 << 62))
+
+    def call():
+        at = (_EPOCH + timedelta(minutes=next(minute))).strftime("%Y-%m-%dT%H:%M:%S")
+        conn.request("GET", f"/chart.png?targets={targets}&at={at}&size=600")
+        resp = conn.getresponse()
+        resp.read()
+        if resp.status != 200:
+            raise RuntimeError(f"/chart.png returned {resp.status}")
+    return call, 1
+
+
+ #==========#
+# BASELINE #
+ #==========#
+
+# Compare p50 per workload; returns names that regressed beyond the threshold
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    print(f"\n{'workload':<18} {'p50':>12} {'baseline':>12} {'change':>9}")
+    for name, r in results["workloads"].items():
+        b = baseline.get("workloads", {}).get(name)
+        if b is None or b.get("ops_per_call") != r["ops_per_call"]:
+            print(f"{name:<18} {_fmt(r['p50_s']):>12} {'—':>12} {'new':>9}")
+            continue
+        change = r["p50_s"] / b["p50_s"] - 1.0
+        flag   = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"{name:<18} {_fmt(r['p50_s']):>12} {_fmt(b['p50_s']):>12} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def _fmt(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1.0:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _environment() -> dict:
+    import swisseph as swe
+    return {
+        "python":    platform.python_version(),
+        "platform":  platform.platform(),
+        "machine":   platform.machine(),
+        "cpus":      os.cpu_count(),
+        "numpy":     np.__version__,
+        "swisseph":  getattr(swe, "version", "?"),
+        "bodies":    _bodies(),
+    }
+
+
+ #======#
+# MAIN #
+ #======#
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="bench", description="atlas core benchmarks")
+    parser.add_argument("workloads",         help="workload names or prefixes (default: all)", nargs="*")
+    parser.add_argument("--quick",           help="shrink workloads ~10x for a smoke run",     action="store_true")
+    parser.add_argument("--out",             help="results JSON path",                         default=None)
+    parser.add_argument("--baseline",        help="baseline JSON path",                        default=str(_BASELINE))
+    parser.add_argument("--update-baseline", help="store these results as the new baseline",   action="store_true")
+    parser.add_argument("--threshold",       help="allowed p50 slowdown before failing",       type=float, default=0.10)
+    parser.add_argument("--list",            help="list workloads and exit",                   action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for w in WORKLOADS.values():
+            print(f"{w.name:<18} {w.description}")
+        return 0
+
+    selected = [w for w in WORKLOADS.values() if not args.workloads or any(w.name.startswith(p) for p in args.workloads)]
+    if not selected:
+        print(f"Error: no workload matches {args.workloads} — see --list")
+        return 2
+
+    results = {
+        "created":     datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "quick":       args.quick,
+        "environment": _environment(),
+        "workloads":   {},
+    }
+
+    print(f"{'workload':<18} {'calls':>7} {'calls/s':>11} {'ops/s':>12} {'p50':>12} {'p99':>12}")
+    for w in selected:
+        r = run_workload(w, args.quick).to_json()
+        results["workloads"][w.name] = r
+        print(f"{w.name:<18} {r['calls']:>7,} {r['calls_per_s']:>11,.1f} {r['ops_per_s']:>12,.0f} "
+              f"{_fmt(r['p50_s']):>12} {_fmt(r['p99_s']):>12}")
+
+    out = Path(args.out) if args.out else _RESULTS_DIR / f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(results, indent=2))
+    print(f"\nresults → {out}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        # Merge so a partial run only replaces the workloads it measured
+        merged = json.loads(baseline_path.read_text()) if baseline_path.exists() else {"workloads": {}}
+        merged.update({k: v for k, v in results.items() if k != "workloads"})
+        merged["workloads"].update(results["workloads"])
+        baseline_path.write_text(json.dumps(merged, indent=2))
+        print(f"baseline updated → {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"no baseline at {baseline_path} — run with --update-baseline to create one")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("quick") != args.quick:
+        print("baseline was recorded with a different --quick setting; comparison skipped")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# scripts/build_constellations.py
+# Build step: constellations.dat (Roman 1987 strips) → atlas binary boundary file (constellations.npy)
+#
+# Usage:
+#   python scripts/build_constellations.py [dat_path] [out_path]
+#
+# Defaults:
+#   dat_path = src/atlas/data/constellations.dat
+#   out_path = src/atlas/data/constellations.npy
+#
+# Re-run whenever constellations.dat or constellation.FORMAT_VERSION changes.
+
+# Standard Modules
+import sys
+from pathlib import Path
+
+# Internal Modules
+from atlas.utils.constellation import build_constellation_data
+
+# External Modules
+import numpy as np
+
+
+if __name__ == "__main__":
+    root     = Path(__file__).parent.parent
+    dat_path = Path(sys.argv[1]) if len(sys.argv) > 1 else root / "src/atlas/data/constellations.dat"
+    out_path = Path(sys.argv[2]) if len(sys.argv) > 2 else root / "src/atlas/data/constellations.npy"
+
+    data = build_constellation_data(dat_path)
+    np.save(out_path, data)
+
+    print(f"{len(data['strips'][0])} strips, {len(data['abbrs'][0])} constellations, "
+          f"{len(data['segments'][0])} boundary segments → {out_path} ({out_path.stat().st_size / 1024:.0f} KB)")
@@ -1,68 +1,131 @@
 #!/usr/bin/env python3
 # scripts/convert_hyg.py
-# One-time conversion: HYG catalog CSV → atlas binary star catalog (stars.npy)
+# One-time conversion: HYG catalog CSV → atlas tiled star catalog (stars.tiled.npy + stars.index.npy)
 #
 # Usage:
-#   python scripts/convert_hyg.py <path/to/hygdata_v41.csv> [out_path] [mag_limit]
+#   python scripts/convert_hyg.py <path/to/hygdata_v41.csv> [out_dir] [mag_limit] [--precompute] [--chunk N]
 #
 # Defaults:
-#   out_path  = src/atlas/data/stars.npy
-#   mag_limit = 99.0  (keep everything; dome filters at render time)
+#   out_dir   = src/atlas/data   (a path ending in .npy is taken to mean its directory)
+#   mag_limit = 99.0  (keep everything; the dome streams faint tiles in on demand)
+#
+# The CSV is parsed in fixed-size chunks straight into structured arrays, then sorted by (sky tile, magnitude)
+# and written with an index of tile offsets and magnitude cutoffs. --precompute also stores J2000 unit
+# vectors, RGB colours and point sizes so the dome derives nothing at load time.
 
 # Standard Modules
+import argparse
 import csv
-import sys
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
+
+# Internal Modules
+from atlas.utils.star_catalog import (
+    INDEX_NAME, RENDER_DTYPE, STAR_DTYPE, TILED_NAME,
+    build_tiled_catalog, fill_render_fields, write_tiled_catalog,
+)
 
 # External Modules
 import numpy as np
 
 
-DTYPE = np.dtype([
-    ("ra",    np.float32),   # RA in degrees (converted from hours)
-    ("dec",   np.float32),   # Dec in degrees
-    ("mag",   np.float32),   # Apparent magnitude
-    ("ci",    np.float32),   # B-V color index (star color)
-    ("name",  "S20"),        # Proper name, ASCII, up to 20 chars (empty if unnamed)
-    ("spect", "S8"),         # Spectral type, ASCII, up to 8 chars
-])
+# Columns read from the HYG header; anything else in the file is ignored
+_COLUMNS = ("ra", "dec", "mag", "ci", "proper", "spect")
 
 
-# Convert HYG CSV to numpy binary
-def convert(csv_path: str, out_path: str, mag_limit: float = 99.0) -> None:
-    records = []
-
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+# Parse a column of CSV strings as floats — empty cells become `default`, malformed cells NaN
+def _floats(values: list[str], default: float) -> np.ndarray:
+    text = np.char.strip(np.array(values, dtype=str))
+    text = np.where(text == "", str(default), text)
+    try:
+        return text.astype(np.float64)
+    except ValueError:
+        out = np.empty(len(text))
+        for i, v in enumerate(text.tolist()):
             try:
-                mag = float(row["mag"]) if row["mag"].strip() else 99.0
-                if mag > mag_limit:
-                    continue
+                out[i] = float(v)
+            except ValueError:
+                out[i] = np.nan
+        return out
+
+
+def _ascii(values: list[str], width: int) -> np.ndarray:
+    return np.array([v.strip()[:width].encode("ascii", errors="replace") for v in values], dtype=f"S{width}")
+
+
+# Yield lists of at most `size` CSV rows
+def _chunks(reader: Iterator[list[str]], size: int) -> Iterator[list[list[str]]]:
+    while block := list(islice(reader, size)):
+        yield block
 
-                ra_deg = float(row["ra"]) * 15.0
-                dec    = float(row["dec"])
-                ci     = float(row["ci"])    if row["ci"].strip()    else 0.6
-                name   = row["proper"].strip()[:20].encode("ascii", errors="replace")
-                spect  = row["spect"].strip()[:8].encode("ascii",  errors="replace")
 
-                records.append((ra_deg, dec, mag, ci, name, spect))
+# One chunk of CSV rows → structured rows (malformed and fainter-than-limit rows dropped)
+def _parse_chunk(block: list[list[str]], cols: dict[str, int], mag_limit: float) -> np.ndarray:
+    block = [r for r in block if len(r) > max(cols.values())]
+    col   = {name: [r[i] for r in block] for name, i in cols.items()}
 
-            except (ValueError, KeyError):
-                continue
+    ra  = _floats(col["ra"], np.nan) * 15.0   # hours → degrees
+    dec = _floats(col["dec"], np.nan)
+    mag = _floats(col["mag"], 99.0)
+    ci  = _floats(col["ci"], 0.6)
+    ok  = ~(np.isnan(ra) | np.isnan(dec) | np.isnan(mag) | np.isnan(ci)) & (mag <= mag_limit)
 
-    arr = np.array(records, dtype=DTYPE)
-    Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-    np.save(out_path, arr)
+    part = np.empty(len(block), dtype=STAR_DTYPE)
+    part["ra"], part["dec"], part["mag"], part["ci"] = ra, dec, mag, ci
+    part["name"]  = _ascii(col["proper"], 20)
+    part["spect"] = _ascii(col["spect"], 8)
+    return part[ok]
 
-    named   = np.count_nonzero(arr["name"])
-    print(f"Saved {len(arr):,} stars ({named:,} named) → {out_path}")
-    print(f"Magnitude range: {arr['mag'].min():.2f} to {arr['mag'].max():.2f}")
-    print(f"File size: {Path(out_path).stat().st_size / 1024:.1f} KB")
+
+# Convert HYG CSV to the tiled catalog
+def convert(csv_path: str, out_dir: str, mag_limit: float = 99.0, precompute: bool = False, chunk: int = 65536) -> None:
+    out   = np.empty(chunk, dtype=STAR_DTYPE)
+    count = 0
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        cols   = {name: header.index(name) for name in _COLUMNS}
+        for block in _chunks(reader, chunk):
+            part = _parse_chunk(block, cols, mag_limit)
+            if count + len(part) > len(out):
+                grown        = np.empty(max(2 * len(out), count + len(part)), dtype=STAR_DTYPE)
+                grown[:count] = out[:count]
+                out          = grown
+            out[count:count + len(part)] = part
+            count += len(part)
+
+    rows, index = build_tiled_catalog(out[:count])
+    del out
+    if precompute:
+        full = np.empty(len(rows), dtype=RENDER_DTYPE)
+        for name in STAR_DTYPE.names:
+            full[name] = rows[name]
+        for i in range(0, len(full), chunk):
+            fill_render_fields(full[i:i + chunk])
+        rows = full
+
+    write_tiled_catalog(Path(out_dir), rows, index)
+
+    size  = sum((Path(out_dir) / name).stat().st_size for name in (TILED_NAME, INDEX_NAME))
+    named = np.count_nonzero(rows["name"])
+    print(f"Saved {len(rows):,} stars ({named:,} named) in {len(index['starts'][0]) - 1} tiles → {out_dir}/{TILED_NAME}")
+    if len(rows):
+        print(f"Magnitude range: {rows['mag'].min():.2f} to {rows['mag'].max():.2f}")
+    print(f"File size: {size / 1024:.1f} KB{' (with unit vectors, RGB, sizes)' if precompute else ''}")
 
 
 if __name__ == "__main__":
-    csv_path  = sys.argv[1] if len(sys.argv) > 1 else "hygdata_v41.csv"
-    out_path  = sys.argv[2] if len(sys.argv) > 2 else "src/atlas/data/stars.npy"
-    mag_limit = float(sys.argv[3]) if len(sys.argv) > 3 else 99.0
-    convert(csv_path, out_path, mag_limit)
+    parser = argparse.ArgumentParser(description="HYG CSV → atlas tiled star catalog")
+    parser.add_argument("csv_path",  nargs="?", default="hygdata_v41.csv")
+    parser.add_argument("out_dir",   nargs="?", default="src/atlas/data")
+    parser.add_argument("mag_limit", nargs="?", default=99.0, type=float)
+    parser.add_argument("--precompute", action="store_true", help="also store unit vectors, RGB and point sizes")
+    parser.add_argument("--chunk",      type=int, default=65536, help="CSV rows parsed per chunk")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out_dir)
+    if out_dir.suffix == ".npy":
+        out_dir = out_dir.parent
+    convert(args.csv_path, str(out_dir), args.mag_limit, args.precompute, args.chunk)
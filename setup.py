@@ -21,6 +21,9 @@ setup(
         "numpy",
         "glfw",
     ],
+    extras_require={
+        "export": ["pyarrow"],
+    },
     entry_points={
         "console_scripts": [
             "atlas=atlas.cli:main"
@@ -1,8 +1,14 @@
 # Standard Modules
-from typing import TYPE_CHECKING, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, TextIO
 from datetime import datetime, timedelta, timezone
 import argparse
+import csv
+import json
 import logging
+import os
+import sys
+import time
 import traceback
 
 # Internal Modules
@@ -14,6 +20,7 @@ from atlas.models.aspect import ASPECT_GLYPHS, build_aspects, build_transit_aspe
 from atlas.models.event import Event
 from atlas.utils.config import load_config
 from atlas.utils.chrono import convert_to_utc, utc_to_local
+from atlas.utils.export import BINARY_FORMATS, event_columns, frame_columns, write_columns
 
 if TYPE_CHECKING:
     from atlas.models.location import Location
@@ -21,6 +28,7 @@ if TYPE_CHECKING:
 # External Modules
 from rich.table import Table
 from rich.console import Console
+from rich.live import Live
 from rich import box
 
 
@@ -47,13 +55,22 @@ cli_atlas = None
 def _resolve_save_path(base: Optional[str], ext: str) -> Optional[str]:
     if not base:
         return None
-    import os
     if not os.path.splitext(base)[1]:
         stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         return os.path.join(base, f"atlas_{stamp}{ext}")
     return base
 
 
+# --save without a window: render through the shared offscreen context; False if no headless GL is available
+def _save_headless(render: Callable[[], Any]) -> bool:
+    try:
+        render()
+        return True
+    except Exception as e:
+        logging.warning("headless render failed (%s), falling back to a window", e)
+        return False
+
+
 # Initialize the CLI components
 def _initialize_cli(verbose: bool = False) -> Atlas:
     ephe_path   = config.get("ephemeris", {}).get("path", "")
@@ -96,6 +113,8 @@ def _build_parser() -> argparse.ArgumentParser:
     observe_parser.add_argument("-a", "--attributes",help="extra attributes: phase, aspects, transits, elongation, mag",  choices=["phase", "aspects", "transits", "elongation", "mag"], nargs="*", default=None)
     observe_parser.add_argument("-s", "--system",    help="coordinate systems: ecliptic, equatorial, horizontal",        nargs="*", default=["ecliptic"])
     observe_parser.add_argument("-c", "--concise",   help="compact output",                                              action="store_true")
+    observe_parser.add_argument("-f", "--format",    help="output format: table, live, tsv, csv, ndjson (streamed per step), npy, parquet, arrow", choices=["table", "live", "tsv", "csv", "ndjson", "npy", "parquet", "arrow"], default="table")
+    observe_parser.add_argument("-o", "--out",       help="write output to a file instead of stdout (required for npy, parquet, arrow)", nargs="?", default=None)
 
     # chart subparser
     chart_parser = subparsers.add_parser(
@@ -164,6 +183,8 @@ def _build_parser() -> argparse.ArgumentParser:
     seek_parser.add_argument("-l", "--location", help="location '(lat,lon,alt)'",                           nargs="?", default=default_location_str)
     seek_parser.add_argument("-z", "--zodiac",   help="zodiac type",                                         choices=["tropical", "sidereal"], default="tropical")
     seek_parser.add_argument("-c", "--concise",  help="compact output",                                      action="store_true")
+    seek_parser.add_argument("-f", "--format",   help="output format: table, tsv, csv, ndjson, npy, parquet, arrow", choices=["table", "tsv", "csv", "ndjson", "npy", "parquet", "arrow"], default="table")
+    seek_parser.add_argument("-o", "--out",      help="write output to a file instead of stdout (required for npy, parquet, arrow)", nargs="?", default=None)
 
     # dome subparser
     dome_parser = subparsers.add_parser(
@@ -173,9 +194,13 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     dome_parser.add_argument("targets",           help="planet targets to overlay (default: all configured)", nargs="*", default=None)
     dome_parser.add_argument("--at",              help="observation datetime 'YYYY-MM-DD [HH:MM[:SS]]'",     nargs="?", default=None)
+    dome_parser.add_argument("--from",            help="time-lapse start datetime",                          nargs="?", default=None, dest="from_dt")
+    dome_parser.add_argument("--to",              help="time-lapse end datetime",                            nargs="?", default=None, dest="to_dt")
+    dome_parser.add_argument("--step",            help="time-lapse step e.g. 10M, 1h, 1d (default 10M)",     nargs="?", default="10M")
+    dome_parser.add_argument("--speed",           help="time-lapse steps per second (default 10.0)",         type=float, default=10.0)
     dome_parser.add_argument("--mag",             help="magnitude cutoff for star display (default 6.5)",    type=float, default=6.5)
     dome_parser.add_argument("--brightness",      help="star brightness multiplier 0.0–2.0 (default 1.0)",  type=float, default=1.0)
-    dome_parser.add_argument("--save",            help="save initial frame as PNG",                          nargs="?", const="", default=None)
+    dome_parser.add_argument("--save",            help="save path — .png for a snapshot, .mp4 for a time-lapse", nargs="?", const="", default=None)
     dome_parser.add_argument("-l", "--location",  help="location '(lat,lon,alt)'",                          nargs="?", default=default_location_str)
     dome_parser.add_argument("-z", "--zodiac",    help="zodiac type",                                        choices=["tropical", "sidereal"], default="tropical")
     dome_parser.add_argument("-T", "--title",     help="window title",                                       nargs="?", default=None)
@@ -442,10 +467,8 @@ def _display_aspects(states: list["CelestialState"]):
 
 
 # Display a time-series trace for multiple targets
-def _display_trace(traces: list[list["CelestialState"]], targets: list[str], concise: bool = False):
-    # traces[i] = list of states (one per target) at timestep i
-    if not traces:
-        return
+def _display_trace(traces: Iterable[list["CelestialState"]], targets: list[str], concise: bool = False):
+    # traces yields one list of states (one per target) per timestep
     if concise:
         for step_states in traces:
             dt_str = step_states[0].dt.strftime("%Y-%m-%d %H:%M") if step_states else ""
@@ -458,21 +481,110 @@ def _display_trace(traces: list[list["CelestialState"]], targets: list[str], con
                     parts.append(state.name)
             print(f"{dt_str}  " + "  ".join(parts))
     else:
-        table = Table(show_header=True, title=None, box=box.SIMPLE, show_edge=False, pad_edge=False)
-        table.add_column("Date/Time", no_wrap=True)
-        for target in targets:
-            table.add_column(target.capitalize(), no_wrap=True)
+        table = _trace_table(targets)
         for step_states in traces:
-            dt_str = step_states[0].dt.strftime("%Y-%m-%d %H:%M") if step_states else ""
-            cells  = [dt_str]
-            for state in step_states:
-                try:
-                    sg, sn = state.sign
-                    cells.append(f"{sg} {sn}  {state.orb:.1f}°")
-                except Exception:
-                    cells.append("?")
+            table.add_row(*_trace_cells(step_states))
+        if table.row_count:
+            Console().print(table)
+
+
+def _trace_table(targets: list[str]) -> Table:
+    table = Table(show_header=True, title=None, box=box.SIMPLE, show_edge=False, pad_edge=False)
+    table.add_column("Date/Time", no_wrap=True)
+    for target in targets:
+        table.add_column(target.capitalize(), no_wrap=True)
+    return table
+
+
+def _trace_cells(step_states: list["CelestialState"]) -> list[str]:
+    cells = [step_states[0].dt.strftime("%Y-%m-%d %H:%M") if step_states else ""]
+    for state in step_states:
+        try:
+            sg, sn = state.sign
+            cells.append(f"{sg} {sn}  {state.orb:.1f}°")
+        except Exception:
+            cells.append("?")
+    return cells
+
+
+# Trace record fields per coordinate system, in output column order
+_TRACE_FIELDS: dict[str, list[str]] = {
+    "ecliptic":   ["lon", "lat", "dist", "dlon", "sign", "orb", "retrograde"],
+    "equatorial": ["ra", "dec", "dist"],
+    "horizontal": ["alt", "az", "ha"],
+}
+
+
+def _trace_fields(systems: list[str]) -> list[str]:
+    fields = ["dt", "target", "name"]
+    for system in systems:
+        fields += [f for f in _TRACE_FIELDS.get(system, []) if f not in fields]
+    return fields
+
+
+# Flatten one state into a record keyed by _trace_fields (None for missing values)
+def _trace_record(state: "CelestialState", target: str, fields: list[str]) -> dict:
+    record: dict = {}
+    for f in fields:
+        match f:
+            case "dt":         record[f] = state.dt.strftime("%Y-%m-%dT%H:%M:%S")
+            case "target":     record[f] = target
+            case "sign":       record[f] = state.sign[1] if state.lon is not None else None
+            case "orb":        record[f] = round(state.orb, 6) if state.lon is not None else None
+            case "retrograde": record[f] = state.retrograde if state.dlon is not None else None
+            case _:            record[f] = getattr(state, f)
+    return record
+
+
+# Stream a trace as it is computed — one row per target per timestep, constant memory
+def _stream_trace(traces: Iterable[list["CelestialState"]], targets: list[str], systems: list[str], fmt: str, out: Optional[TextIO] = None):
+    fields = _trace_fields(systems)
+
+    if fmt == "live":
+        _live_trace(traces, targets)
+        return
+
+    out = out or sys.stdout
+    try:
+        if fmt in ("tsv", "csv"):
+            writer = csv.writer(out, delimiter="\t" if fmt == "tsv" else ",", lineterminator="\n")
+            writer.writerow(fields)
+            for step_states in traces:
+                for target, state in zip(targets, step_states):
+                    record = _trace_record(state, target, fields)
+                    writer.writerow(["" if record[f] is None else record[f] for f in fields])
+        else:
+            for step_states in traces:
+                for target, state in zip(targets, step_states):
+                    out.write(json.dumps(_trace_record(state, target, fields), ensure_ascii=False) + "\n")
+        out.flush()
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) closed the pipe — silence the interpreter's final flush
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+# Rich live view of a trace: a rolling window of the most recent timesteps. Steps arrive far faster than the
+# screen refreshes, so the table is rebuilt at most once per refresh rather than once per step
+def _live_trace(traces: Iterable[list["CelestialState"]], targets: list[str], refresh_per_second: float = 10.0):
+    console = Console()
+    window  = max(1, console.size.height - 4)
+    rows: deque[list[str]] = deque(maxlen=window)
+
+    def _render() -> Table:
+        table = _trace_table(targets)
+        for cells in rows:
             table.add_row(*cells)
-        Console().print(table)
+        return table
+
+    interval = 1.0 / refresh_per_second
+    with Live(_render(), console=console, refresh_per_second=refresh_per_second) as live:
+        due = time.monotonic()
+        for step_states in traces:
+            rows.append(_trace_cells(step_states))
+            if time.monotonic() >= due:
+                live.update(_render())
+                due = time.monotonic() + interval
+        live.update(_render())
 
 
 # Display detected transit events
@@ -570,7 +682,10 @@ def _handle_command(args):
     elif args.command == "serve":
         _handle_serve(args)
     elif args.command == "dome":
-        _handle_dome(args)
+        if getattr(args, "from_dt", None) and getattr(args, "to_dt", None):
+            _handle_dome_timelapse(args)
+        else:
+            _handle_dome(args)
     elif args.command == "chart":
         if getattr(args, "targets", None) == ["live"]:
             _handle_live(args)
@@ -582,6 +697,16 @@ def _handle_command(args):
             _handle_chart(args)
 
 
+# Properties needed by `observe -a` attributes — phase and mag read phenomena, mag also reads magnitudes
+def _observe_properties(attributes: list[str]) -> list[str]:
+    properties = ["position"]
+    if "phase" in attributes or "mag" in attributes:
+        properties.append("phenomenon")
+    if "mag" in attributes:
+        properties.append("magnitude")
+    return properties
+
+
 def _handle_observe(args):
     global cli_atlas
     if cli_atlas is None:
@@ -591,32 +716,48 @@ def _handle_observe(args):
     attributes  = args.attributes or []
 
     try:
-        if has_range:
-            # Time-series trace mode — one trace per target, zipped by timestep
-            traces_by_target = [
-                cli_atlas.build_celestial_trace(
-                    target   = target,
-                    start_dt = args.from_dt,
-                    end_dt   = args.to_dt,
-                    step     = args.step,
-                    location = args.location,
-                    zodiac   = args.zodiac,
-                    systems  = args.system,
-                )
-                for target in args.targets
-            ]
-            # Zip into list-of-lists: traces[step_i] = [state_target_0, state_target_1, ...]
-            traces = [list(step) for step in zip(*traces_by_target)]
-            _display_trace(traces, args.targets, concise=args.concise)
+        if args.format in BINARY_FORMATS:
+            if not args.out:
+                raise ValueError(f"--format {args.format} requires --out PATH")
+            # Columnar export — sample straight into a frame and write it in one go
+            frame = cli_atlas.build_celestial_frame(
+                targets    = args.targets,
+                start_dt   = args.from_dt if has_range else args.datetime,
+                end_dt     = args.to_dt   if has_range else args.datetime,
+                step       = args.step,
+                location   = args.location,
+                zodiac     = args.zodiac,
+                properties = _observe_properties(attributes),
+                systems    = args.system,
+            )
+            write_columns(frame_columns(frame), args.out, args.format)
+            print(f"Wrote {frame.shape[0] * frame.shape[1]:,} rows → {args.out}")
+
+        elif args.out and args.format in ("table", "live"):
+            raise ValueError(f"--out needs a file format (tsv, csv, ndjson, npy, parquet, arrow), not {args.format}")
+
+        elif has_range:
+            # Time-series trace mode — all targets sampled together per timestep
+            steps = cli_atlas.iter_celestial_states(
+                targets  = args.targets,
+                start_dt = args.from_dt,
+                end_dt   = args.to_dt,
+                step     = args.step,
+                location = args.location,
+                zodiac   = args.zodiac,
+                systems  = args.system,
+            )
+            if args.format == "table":
+                _display_trace(steps, args.targets, concise=args.concise)
+            elif args.out:
+                with open(args.out, "w", newline="", encoding="utf-8") as f:
+                    _stream_trace(steps, args.targets, args.system, fmt=args.format, out=f)
+            else:
+                _stream_trace(steps, args.targets, args.system, fmt=args.format)
 
         else:
             # Single-moment observation
-            properties: list[str] = ["position"]
-            if "phase" in attributes or "mag" in attributes:
-                properties.append("phenomenon")
-            if "mag" in attributes:
-                properties.append("magnitude")
-
+            properties = _observe_properties(attributes)
             states: list[CelestialState] = []
             for target in args.targets:
                 state = cli_atlas.build_celestial_state(
@@ -629,13 +770,21 @@ def _handle_observe(args):
                 )
                 states.append(state)
 
+            if args.format != "table" and args.out:
+                with open(args.out, "w", newline="", encoding="utf-8") as f:
+                    _stream_trace([states], args.targets, args.system, fmt=args.format, out=f)
+                return
+            if args.format != "table":
+                _stream_trace([states], args.targets, args.system, fmt=args.format)
+                return
+
             _display_celestial_states(states, concise=args.concise, attributes=attributes)
 
             if "aspects" in attributes:
                 print()
                 _display_aspects(states)
 
-    except ValueError as e:
+    except (ValueError, ImportError) as e:
         print(f"Error: {e}")
     except Exception:
         logging.error("failed to handle observation command")
@@ -644,6 +793,7 @@ def _handle_observe(args):
 
 def _handle_chart(args):
     from atlas.view.chart import RadixChart
+    from atlas.view.offscreen import render_chart_png
 
     global cli_atlas
     if cli_atlas is None:
@@ -665,7 +815,10 @@ def _handle_chart(args):
         cusps    = cli_atlas.build_houses(dt=args.datetime, location=args.location, zodiac=args.zodiac)
         aspects  = build_aspects(celestials)
         title    = args.title or args.datetime.strftime("%Y-%m-%d  %H:%M")
-        RadixChart.configure(cusps=cusps, celestials=celestials, aspects=aspects, title=title, save_path=_resolve_save_path(args.save or default_image_path if args.save is not None else None, ".png"))
+        save     = _resolve_save_path(args.save or default_image_path if args.save is not None else None, ".png")
+        if save and _save_headless(lambda: render_chart_png(cusps, celestials, aspects, title=title, path=save)):
+            return
+        RadixChart.configure(cusps=cusps, celestials=celestials, aspects=aspects, title=title, save_path=save)
         RadixChart.show()
 
     except ValueError as e:
@@ -677,6 +830,7 @@ def _handle_chart(args):
 
 def _handle_transit_chart(args):
     from atlas.view.chart import TransitChart
+    from atlas.view.offscreen import render_transit_png
 
     global cli_atlas
     if cli_atlas is None:
@@ -702,12 +856,17 @@ def _handle_transit_chart(args):
         transit_cusps    = cli_atlas.build_houses(dt=transit_dt, location=args.location, zodiac=args.zodiac)
         transit_aspects  = build_transit_aspects(natal_celestials, transit_celestials)
         title = args.title or f"{natal_dt.strftime('%Y-%m-%d')} → {transit_dt.strftime('%Y-%m-%d')}"
+        save  = _resolve_save_path(args.save or default_image_path if args.save is not None else None, ".png")
+        if save and _save_headless(lambda: render_transit_png(
+            natal_cusps, natal_celestials, transit_cusps, transit_celestials, transit_aspects, title=title, path=save,
+        )):
+            return
 
         TransitChart.configure_transit(
             cusps=natal_cusps, celestials=natal_celestials,
             transit_cusps=transit_cusps, transit_celestials=transit_celestials,
             transit_aspects=transit_aspects,
-            title=title, save_path=_resolve_save_path(args.save or default_image_path if args.save is not None else None, ".png"),
+            title=title, save_path=save,
         )
         TransitChart.show()
 
@@ -720,12 +879,14 @@ def _handle_transit_chart(args):
 
 def _handle_playback(args):
     from atlas.view.chart import PlaybackChart
+    from atlas.view.offscreen import render_playback_video
 
     global cli_atlas
     if cli_atlas is None:
         cli_atlas = _initialize_cli(verbose=False)
 
     try:
+        save = _resolve_save_path(args.save or default_video_path if args.save is not None else None, ".mp4")
         PlaybackChart.configure_playback(
             atlas = cli_atlas,
             location   = args.location,
@@ -735,8 +896,11 @@ def _handle_playback(args):
             end_dt     = args.to_dt,
             step       = args.step,
             speed      = args.speed,
-            save_path  = _resolve_save_path(args.save or default_video_path if args.save is not None else None, ".mp4"),
+            save_path  = save,
         )
+        # Saved playbacks export offscreen at a fixed timestep; the window records only as a fallback
+        if save and _save_headless(lambda: render_playback_video(save)):
+            return
         PlaybackChart.show()
     except Exception:
         logging.error("failed to handle playback command")
@@ -777,6 +941,8 @@ def _handle_seek(args):
     event_types = [args.type] if args.type else ["aspect", "ingress", "station", "phase", "elongation", "diurnal"]
 
     try:
+        if args.format in BINARY_FORMATS and not args.out:
+            raise ValueError(f"--format {args.format} requires --out PATH")
         event_details = args.detail or None
 
         if has_range:
@@ -801,8 +967,15 @@ def _handle_seek(args):
                 limit           = args.limit,
             )
 
-        _display_seek_results(events, location=args.location, concise=args.concise)
+        if args.format == "table":
+            _display_seek_results(events, location=args.location, concise=args.concise)
+        else:
+            write_columns(event_columns(events), args.out or sys.stdout, args.format)
+            if args.out:
+                print(f"Wrote {len(events):,} events → {args.out}")
 
+    except (ValueError, ImportError) as e:
+        print(f"Error: {e}")
     except Exception:
         logging.error("failed to handle seek command")
         traceback.print_exc()
@@ -810,6 +983,7 @@ def _handle_seek(args):
 
 def _handle_dome(args):
     from atlas.view.experimental.dome import DomeView
+    from atlas.view.offscreen import render_dome_png
 
     global cli_atlas
     if cli_atlas is None:
@@ -860,6 +1034,8 @@ def _handle_dome(args):
             save_path  = save_path,
             title      = title,
         )
+        if save_path and _save_headless(lambda: render_dome_png(args.datetime, args.location, planets, title=title, path=save_path)):
+            return
         DomeView.show()
 
     except ValueError as e:
@@ -869,6 +1045,64 @@ def _handle_dome(args):
         traceback.print_exc()
 
 
+def _handle_dome_timelapse(args):
+    from atlas.view.experimental.dome import DomeTimelapse, DomeTracks
+    from atlas.view.offscreen import render_dome_video
+
+    global cli_atlas
+    if cli_atlas is None:
+        cli_atlas = _initialize_cli(verbose=False)
+
+    targets = args.targets or list(config.get("celestials", {}).keys())
+
+    try:
+        # Planet tracks for the whole range up front; playback then never touches the ephemeris
+        tracks = DomeTracks(
+            atlas    = cli_atlas,
+            targets  = targets,
+            location = args.location,
+            zodiac   = args.zodiac,
+            start_dt = args.from_dt,
+            end_dt   = args.to_dt,
+            step     = args.step,
+        )
+
+        # Closure: called by the dome on click to fetch a full state for a named body at the instant on screen
+        atlas = cli_atlas
+
+        def fetch_at(name: str, dt: datetime) -> "CelestialState":
+            return atlas.build_celestial_state(
+                dt         = dt,
+                location   = args.location,
+                target     = name,
+                zodiac     = args.zodiac,
+                properties = ["position", "phenomenon", "magnitude"],
+                systems    = ["ecliptic", "equatorial", "horizontal"],
+            )
+
+        save = _resolve_save_path(args.save or default_video_path if args.save is not None else None, ".mp4")
+        DomeTimelapse.configure_timelapse(
+            tracks     = tracks,
+            location   = args.location,
+            fetch_at   = fetch_at,
+            mag_limit  = args.mag,
+            brightness = args.brightness,
+            speed      = args.speed,
+            save_path  = save,
+            title      = args.title or "",
+        )
+        # Saved time-lapses export offscreen at a fixed timestep; the window records only as a fallback
+        if save and _save_headless(lambda: render_dome_video(save)):
+            return
+        DomeTimelapse.show()
+
+    except ValueError as e:
+        print(f"Error: {e}")
+    except Exception:
+        logging.error("failed to handle dome time-lapse command")
+        traceback.print_exc()
+
+
 def _handle_serve(args):
     try:
         from atlas.serve import run
@@ -1,14 +1,19 @@
 # atlas/src/core/atlas.py
 
 # Standard Modules
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 from datetime import datetime, timedelta
+import logging
 
 # Internal Modules
 from atlas.utils.config import load_config
 from atlas.models.celestial_state import CelestialState
+from atlas.models.celestial_frame import CelestialFrame
 from atlas.models.event import Event
 
+# External Modules
+import numpy as np
+
 if TYPE_CHECKING:
     from atlas.core.observatory import Observatory
     from atlas.models.location import Location
@@ -21,23 +26,19 @@ class Atlas:
         self._verbose     = verbose
 
 
-    # Reads dt and location from observatory; caller must configure observatory first
-    def _sample(self, target: str, properties: list[str], systems: list[str]) -> CelestialState:
-        target_info = self._config["celestials"].get(target.lower()) or {
+    # Resolve a target key to its config entry; unknown names fall back to a fixed star lookup
+    def _resolve(self, target: str) -> dict:
+        return self._config["celestials"].get(target.lower()) or {
             "id":    target,
             "glyph": "✦",
             "name":  target.capitalize(),
             "type": "star",
         }
 
-        c = CelestialState(
-            id    = target_info["id"],
-            glyph = target_info["glyph"],
-            name  = target_info["name"],
-            type  = target_info.get("type", "superior"),
-            dt       = self._observatory.dt,          # type: ignore[arg-type]
-            location = self._observatory._location,   # type: ignore[arg-type]
-        )
+    # Yield raw (kind, values) observations at the observatory's current dt/location
+    # kind is a coordinate system name, "phenomenon" or "magnitude"
+    def _observe(self, target_info: dict, properties: list[str], systems: list[str]) -> Iterator[tuple[str, tuple]]:
+        body_type = target_info.get("type", "superior")
 
         if "position" in properties:
             for system in systems:
@@ -47,29 +48,49 @@ class Atlas:
                     self._observatory.orient(system)
 
                 # Derived planets (e.g. south node): compute from source + offset
-                if c.type == "derived":
+                if body_type == "derived":
                     source_info = self._config["celestials"][target_info["source"]]
                     source_pos  = self._observatory.observe(source_info["id"])
                     offset      = target_info.get("lon_offset", 0)
                     pos         = ((source_pos[0] + offset) % 360, *source_pos[1:])
                 else:
-                    pos = self._observatory.observe(c.id)
+                    pos = self._observatory.observe(target_info["id"])
 
-                c.apply_pos(pos, system)
                 if self._verbose:
                     logging.info("celestial position: system=%s, pos=%s", system, pos)
+                yield system, pos
 
-        if "phenomenon" in properties and c.type not in ("star", "node", "derived"):
-            pheno = self._observatory.profile(int(c.id))
-            c.apply_pheno(pheno)
+        if "phenomenon" in properties and body_type not in ("star", "node", "derived"):
+            pheno = self._observatory.profile(int(target_info["id"]))
             if self._verbose:
                 logging.info("celestial phenomenon: pheno=%s", pheno)
+            yield "phenomenon", pheno
 
-        if "magnitude" in properties and c.type == "star":
-            c.app_mag = self._observatory.measure(str(c.id), "star_magnitude")
+        if "magnitude" in properties and body_type == "star":
+            yield "magnitude", (self._observatory.measure(str(target_info["id"]), "star_magnitude"),)
 
-        return c
+    # Reads dt and location from observatory; caller must configure observatory first
+    def _sample(self, target: str, properties: list[str], systems: list[str]) -> CelestialState:
+        target_info = self._resolve(target)
 
+        c = CelestialState(
+            id    = target_info["id"],
+            glyph = target_info["glyph"],
+            name  = target_info["name"],
+            type  = target_info.get("type", "superior"),
+            dt       = self._observatory.dt,          # type: ignore[arg-type]
+            location = self._observatory._location,   # type: ignore[arg-type]
+        )
+
+        for kind, values in self._observe(target_info, properties, systems):
+            if kind == "phenomenon":
+                c.apply_pheno(values)
+            elif kind == "magnitude":
+                c.app_mag = values[0]
+            else:
+                c.apply_pos(values, kind)
+
+        return c
 
     # Build states for multiple targets
     def build_celestial_states(
@@ -117,6 +138,60 @@ class Atlas:
             self._observatory.shift(t_delta=step)
         return trace
 
+    # Yield the states of all targets per timestep over a date range, one step at a time
+    # The observatory is re-pinned to each step's dt, so callers may interleave other time queries
+    def iter_celestial_states(
+        self,
+        targets:    list[str],
+        start_dt:   datetime,
+        end_dt:     datetime,
+        step:       timedelta,
+        location:   "Location",
+        zodiac:     str = "tropical",
+        properties: list[str] = ["position"],
+        systems:    list[str] = ["ecliptic"],
+    ) -> Iterator[list[CelestialState]]:
+        if step <= timedelta(0):
+            raise ValueError(f"step must be positive, got {step}")
+        self._observatory.set(location=location)
+        dt = start_dt
+        while dt <= end_dt:
+            self._observatory.set(dt=dt).align(zodiac)
+            yield [self._sample(t, properties, systems) for t in targets]
+            dt += step
+
+    # Sample every target at each timestep into one columnar frame (time × body)
+    def build_celestial_frame(
+        self,
+        targets:    list[str],
+        start_dt:   datetime,
+        end_dt:     datetime,
+        step:       timedelta,
+        location:   "Location",
+        zodiac:     str = "tropical",
+        properties: list[str] = ["position"],
+        systems:    list[str] = ["ecliptic"],
+    ) -> CelestialFrame:
+        if step <= timedelta(0):
+            raise ValueError(f"step must be positive, got {step}")
+        n_steps = int((end_dt - start_dt) / step) + 1 if end_dt >= start_dt else 0
+        infos   = [self._resolve(t) for t in targets]
+        frame   = CelestialFrame(jd=np.empty(n_steps), targets=targets, bodies=infos, location=location)
+
+        self._observatory.set(dt=start_dt, location=location).align(zodiac)
+        for i in range(n_steps):
+            frame.jd[i] = self._observatory._jd
+            for j, info in enumerate(infos):
+                for kind, values in self._observe(info, properties, systems):
+                    if kind == "phenomenon":
+                        frame.apply_pheno(i, j, values)
+                    elif kind == "magnitude":
+                        frame.apply_mag(i, j, values[0])
+                    else:
+                        frame.apply_pos(i, j, values, kind)
+            self._observatory.shift(t_delta=step)
+        return frame
+
     # Cast the 12 house cusps for a given dt and location
     def build_houses(
         self,
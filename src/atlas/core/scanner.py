@@ -60,6 +60,9 @@ class Scanner:
                 if "elongation" in event_types: events += _keep(self._scan_elongation(states, prev_states, targets, prev_dt, current))
                 if "diurnal"    in event_types: events += _keep(self._scan_diurnal(states, prev_states, targets, prev_dt, current))
 
+                # Bisection moves the observatory; put the scan cursor back before stepping
+                self._obs.set(dt=current)
+
             prev_states = states
             if limit and len(events) >= limit:
                 break
@@ -80,12 +83,12 @@ class Scanner:
                 if e.type == type_key:
                     by_body.setdefault(e.body, []).append(e)
             for body_events in by_body.values():
-                body_events.sort(key=lambda e: e.at)
+                body_events.sort(key=lambda e: e.at_jd)
                 for i, e in enumerate(body_events):
-                    e.start = body_events[i - 1].at if i > 0 else None
-                    e.end   = body_events[i + 1].at if i < len(body_events) - 1 else None
+                    e.start_jd = body_events[i - 1].at_jd if i > 0 else None
+                    e.end_jd   = body_events[i + 1].at_jd if i < len(body_events) - 1 else None
 
-        events.sort(key=lambda e: e.at)
+        events.sort(key=lambda e: e.at_jd)
         return events[:limit] if limit else events
 
 
@@ -0,0 +1,174 @@
+# atlas/src/core/timeline.py
+# Precomputed playback timeline: ecliptic positions, speeds and house cusps for every step of a range, as arrays
+
+# Standard Modules
+import logging
+import threading
+from copy import copy
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional
+
+# Internal Modules
+from atlas.models.celestial_state import CelestialState
+
+# External Modules
+import numpy as np
+
+if TYPE_CHECKING:
+    from atlas.core.atlas import Atlas
+    from atlas.models.location import Location
+
+
+class Timeline:
+    # Step i of the range is start + i * step. A worker thread fills the arrays in chunks — the chunk under the
+    # cursor first, then onward in the playback direction, then the rest — so seeking only waits when it lands
+    # on a chunk not computed yet, and then that chunk jumps the queue. The worker is the only user of the
+    # Atlas (and its SwissEph state) while the timeline is filling.
+
+    def __init__(
+        self,
+        atlas:    "Atlas",
+        targets:  list[str],
+        location: "Location",
+        zodiac:   str,
+        start_dt: datetime,
+        step:     timedelta,
+        n_steps:  int,
+        chunk:    int = 64,
+    ):
+        if step <= timedelta(0):
+            raise ValueError(f"step must be positive, got {step}")
+        self._atlas    = atlas
+        self._location = location
+        self._zodiac   = zodiac
+        self.start_dt  = start_dt
+        self.step      = step
+        self.n_steps   = max(1, n_steps)
+        self._chunk    = max(1, chunk)
+
+        # Probe each target once: unavailable bodies are dropped, the rest are templates for states()
+        self.targets: list[str]            = []
+        self.bodies:  list[CelestialState] = []
+        for target in targets:
+            try:
+                state = atlas.build_celestial_state(
+                    dt=start_dt, location=location, target=target, zodiac=zodiac,
+                    properties=["position"], systems=["ecliptic"],
+                )
+            except Exception:
+                logging.info("timeline: skipping %s (not available)", target)
+                continue
+            self.targets.append(target)
+            self.bodies.append(state)
+
+        shape      = (self.n_steps, len(self.bodies))
+        self.lon   = np.full(shape, np.nan)
+        self.dlon  = np.full(shape, np.nan)
+        self.cusps = np.full((self.n_steps, 12), np.nan)
+
+        n_chunks        = -(-self.n_steps // self._chunk)
+        self._ready     = np.zeros(n_chunks, dtype=bool)
+        self._cursor    = 0
+        self._direction = 1
+        self._wanted:  Optional[int] = None
+        self._closed   = False
+        self._cond     = threading.Condition()
+        self._thread   = threading.Thread(target=self._worker, name="atlas-timeline", daemon=True)
+        self._thread.start()
+
+    def __len__(self) -> int:
+        return self.n_steps
+
+    def dt(self, i: int) -> datetime:
+        return self.start_dt + self.step * i
+
+    # Step index of a datetime (nearest, clamped to the range)
+    def index(self, dt: datetime) -> int:
+        return max(0, min(self.n_steps - 1, round((dt - self.start_dt) / self.step)))
+
+    @property
+    def complete(self) -> bool:
+        return bool(self._ready.all())
+
+    # Move the read-ahead cursor; direction is the playback direction (+1 forward, -1 reverse)
+    def seek(self, i: int, direction: int = 1) -> None:
+        with self._cond:
+            self._cursor    = max(0, min(self.n_steps - 1, i))
+            self._direction = 1 if direction >= 0 else -1
+            self._cond.notify_all()
+
+    # Block until step i is computed; returns False on timeout
+    def wait(self, i: int, timeout: Optional[float] = None) -> bool:
+        k = max(0, min(self.n_steps - 1, i)) // self._chunk
+        with self._cond:
+            if not self._ready[k]:
+                self._wanted = k
+                self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._ready[k] or self._closed, timeout)
+
+    # Bodies at step i as CelestialStates (copies of the probed templates with this step's lon / dlon)
+    def states(self, i: int) -> list[CelestialState]:
+        self.wait(i)
+        out = []
+        for j, body in enumerate(self.bodies):
+            c      = copy(body)
+            c.lon  = float(self.lon[i, j])
+            c.dlon = float(self.dlon[i, j])
+            out.append(c)
+        return out
+
+    def cusps_at(self, i: int) -> list[float]:
+        self.wait(i)
+        return self.cusps[i].tolist()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    # Next chunk to fill: an explicit wait() first, then from the cursor onward in the playback direction,
+    # then back toward the other end
+    def _next_chunk(self) -> Optional[int]:
+        if self._wanted is not None and not self._ready[self._wanted]:
+            return self._wanted
+        c     = self._cursor // self._chunk
+        n     = len(self._ready)
+        ahead = range(c, n) if self._direction > 0 else range(c, -1, -1)
+        back  = range(c - 1, -1, -1) if self._direction > 0 else range(c + 1, n)
+        for k in (*ahead, *back):
+            if not self._ready[k]:
+                return k
+        return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                k = self._next_chunk()
+                while k is None and not self._closed:
+                    self._cond.wait()
+                    k = self._next_chunk()
+                if self._closed:
+                    return
+
+            lo = k * self._chunk
+            hi = min(self.n_steps, lo + self._chunk)
+            try:
+                if self.targets:
+                    frame = self._atlas.build_celestial_frame(
+                        targets=self.targets, start_dt=self.dt(lo), end_dt=self.dt(hi - 1), step=self.step,
+                        location=self._location, zodiac=self._zodiac, properties=["position"], systems=["ecliptic"],
+                    )
+                    n = min(len(frame), hi - lo)
+                    self.lon[lo:lo + n]  = frame["lon"][:n]
+                    self.dlon[lo:lo + n] = frame["dlon"][:n]
+                for i in range(lo, hi):
+                    self.cusps[i] = self._atlas.build_houses(dt=self.dt(i), location=self._location, zodiac=self._zodiac)
+            except Exception as e:
+                logging.error("timeline: failed to compute steps %d–%d: %s", lo, hi - 1, e)
+
+            with self._cond:
+                self._ready[k] = True
+                if self._wanted == k:
+                    self._wanted = None
+                self._cond.notify_all()
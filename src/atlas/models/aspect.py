@@ -26,7 +26,7 @@ ASPECT_GLYPHS: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Aspect:
     name:     str
     body_one: "CelestialState"
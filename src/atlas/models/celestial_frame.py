@@ -0,0 +1,204 @@
+# atlas/src/models/celestial_frame.py
+# Columnar (time × body) store of celestial states — struct-of-arrays, NaN for missing
+
+# Standard libraries
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+# Internal libraries
+from atlas.models.celestial_state import CelestialState
+from atlas.utils.chrono import jd_to_datetime
+
+if TYPE_CHECKING:
+    from atlas.models.location import Location
+
+# External libraries
+import numpy as np
+
+
+# Columns a frame can hold — names mirror the CelestialState attributes they replace
+FRAME_COLUMNS: tuple[str, ...] = (
+    "dist", "ddist",
+    "lon", "lat", "dlon", "dlat",
+    "ra", "dec", "dra", "ddec",
+    "alt", "az", "ha",
+    "phase_angle", "phase_illuminated", "elong", "app_diam", "app_mag",
+    "phase_waxing", "elong_waxing",
+)
+
+# Boolean state flags, stored as float64 (1.0 / 0.0 / NaN) so every column shares one layout
+BOOL_COLUMNS: frozenset[str] = frozenset({"phase_waxing", "elong_waxing"})
+
+# Column order of the raw SwissEph tuples accepted by apply_pos / apply_pheno
+_POS_COLUMNS: dict[str, tuple[str, ...]] = {
+    "ecliptic":   ("lon", "lat", "dist", "dlon", "dlat", "ddist"),
+    "equatorial": ("ra",  "dec", "dist", "dra",  "ddec", "ddist"),
+    "horizontal": ("alt", "az",  "ha"),
+}
+_PHENO_COLUMNS: tuple[str, ...] = (
+    "phase_angle", "phase_illuminated", "elong", "app_diam", "app_mag", "phase_waxing", "elong_waxing",
+)
+
+# Body types that never report retrograde motion (matches CelestialState.retrograde)
+_FIXED_TYPES: tuple[str, ...] = ("star", "node", "derived")
+
+
+class CelestialFrame:
+    # Columns are allocated on first write as (n_times, n_bodies) float64 arrays; unset cells stay NaN
+
+    def __init__(self, jd: np.ndarray, targets: list[str], bodies: list[dict], location: Optional["Location"] = None):
+        if len(targets) != len(bodies):
+            raise ValueError(f"expected one body entry per target, got {len(bodies)} for {len(targets)} targets")
+        self.jd       = np.asarray(jd, dtype=np.float64)
+        self.targets  = list(targets)
+        self.ids      = [b["id"] for b in bodies]
+        self.glyphs   = [b["glyph"] for b in bodies]
+        self.names    = [b["name"] for b in bodies]
+        self.types    = [b.get("type", "superior") for b in bodies]
+        self.location = location
+
+        self._columns: dict[str, np.ndarray] = {}
+        self._moving  = np.array([t not in _FIXED_TYPES for t in self.types], dtype=bool)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self.jd), len(self.targets))
+
+    def __len__(self) -> int:
+        return len(self.jd)
+
+    @property
+    def columns(self) -> list[str]:
+        return [c for c in FRAME_COLUMNS if c in self._columns]
+
+    @property
+    def nbytes(self) -> int:
+        return self.jd.nbytes + sum(a.nbytes for a in self._columns.values())
+
+    # Return a column as a (n_times, n_bodies) array; unset columns read as all-NaN
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in FRAME_COLUMNS:
+            raise KeyError(f"unknown frame column: '{name}'")
+        col = self._columns.get(name)
+        if col is None:
+            col = np.full(self.shape, np.nan)
+            col.flags.writeable = False
+        return col
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    # Writable column, allocated on first use
+    def _column(self, name: str) -> np.ndarray:
+        col = self._columns.get(name)
+        if col is None:
+            col = self._columns[name] = np.full(self.shape, np.nan)
+        return col
+
+    # Index of a target key (e.g. "moon") along the body axis
+    def index(self, target: str) -> int:
+        for j, t in enumerate(self.targets):
+            if t.lower() == target.lower():
+                return j
+        raise KeyError(f"target not in frame: '{target}'")
+
+
+     #=======#
+    # WRITERS #
+     #=======#
+
+    # Apply a raw SwissEph position tuple at (time i, body j) — mirrors CelestialState.apply_pos
+    def apply_pos(self, i: int, j: int, pos: tuple[float, ...], frame: str) -> None:
+        names = _POS_COLUMNS.get(frame)
+        if names is None:
+            return
+        if len(pos) != len(names):
+            raise ValueError(f"Expected {len(names)} values for {frame} position, got {len(pos)}: {pos}")
+        for name, value in zip(names, pos):
+            self._column(name)[i, j] = value
+
+    # Apply a phenomenon tuple at (time i, body j) — mirrors CelestialState.apply_pheno
+    def apply_pheno(self, i: int, j: int, pheno: tuple) -> None:
+        if len(pheno) != len(_PHENO_COLUMNS):
+            raise ValueError(f"Expected {len(_PHENO_COLUMNS)} values for phenomenon, got {len(pheno)}: {pheno}")
+        for name, value in zip(_PHENO_COLUMNS, pheno):
+            self._column(name)[i, j] = value
+
+    def apply_mag(self, i: int, j: int, mag: Optional[float]) -> None:
+        if mag is not None:
+            self._column("app_mag")[i, j] = mag
+
+
+     #==========#
+    # ACCESSORS #
+     #==========#
+
+    # Sign index into SIGNS per cell, -1 where longitude is missing
+    @property
+    def sign(self) -> np.ndarray:
+        lon = self["lon"]
+        idx = np.full(self.shape, -1, dtype=np.int8)
+        ok  = ~np.isnan(lon)
+        idx[ok] = (lon[ok] // 30).astype(np.int8) % 12
+        return idx
+
+    @property
+    def orb(self) -> np.ndarray:
+        return self["lon"] % 30
+
+    # 0-360° phase cycle (0°=new, 180°=full), NaN where phase data is missing
+    @property
+    def phase_cycle(self) -> np.ndarray:
+        angle  = self["phase_angle"]
+        waxing = self["phase_waxing"]
+        return np.where(waxing == 1.0, 180.0 - angle, np.where(waxing == 0.0, 180.0 + angle, np.nan))
+
+    # 0-360° synodic cycle (0°=conjunction, 180°=opposition), NaN where elongation data is missing
+    @property
+    def elong_cycle(self) -> np.ndarray:
+        elong  = self["elong"]
+        waxing = self["elong_waxing"]
+        return np.where(waxing == 1.0, elong, np.where(waxing == 0.0, 360.0 - elong, np.nan))
+
+    @property
+    def retrograde(self) -> np.ndarray:
+        with np.errstate(invalid="ignore"):
+            return (self["dlon"] < 0) & self._moving
+
+
+     #=====#
+    # VIEWS #
+     #=====#
+
+    def dt(self, i: int) -> datetime:
+        return jd_to_datetime(float(self.jd[i]))
+
+    @property
+    def dts(self) -> list[datetime]:
+        return [jd_to_datetime(float(jd)) for jd in self.jd]
+
+    # Materialize a single cell as a CelestialState (for display code that expects one)
+    def state(self, i: int, j: int) -> CelestialState:
+        c = CelestialState(
+            id       = self.ids[j],
+            glyph    = self.glyphs[j],
+            name     = self.names[j],
+            type     = self.types[j],
+            dt       = self.dt(i),
+            location = self.location,  # type: ignore[arg-type]
+        )
+        for name, col in self._columns.items():
+            value = col[i, j]
+            if value != value:  # NaN → leave as None
+                continue
+            setattr(c, name, bool(value) if name in BOOL_COLUMNS else float(value))
+        return c
+
+    # All bodies at timestep i
+    def states(self, i: int) -> list[CelestialState]:
+        return [self.state(i, j) for j in range(len(self.targets))]
+
+    # One body over all timesteps
+    def trace(self, target: str) -> list[CelestialState]:
+        j = self.index(target)
+        return [self.state(i, j) for i in range(len(self.jd))]
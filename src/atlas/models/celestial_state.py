@@ -57,7 +57,7 @@ ELONGATION_EVENTS: list[tuple[float, str, str]] = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class CelestialState:
 	id: Union[int, str]
 	glyph: str
@@ -1,17 +1,156 @@
 # Standard Modules
-from dataclasses import dataclass, field
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
+
+# Internal Modules
+from atlas.utils.chrono import datetime_to_jd, jd_to_datetime
+
+
+# Intern table shared by all events — types, body names, details and glyphs repeat
+# across thousands of events, so each instance stores small integer codes instead
+_STRINGS:     list[str]      = []
+_CODES:       dict[str, int] = {}
+_INTERN_LOCK: threading.Lock = threading.Lock()
+
+
+# Return the code for a string, registering it on first sight (-1 for None)
+def intern_code(s: Optional[str]) -> int:
+    if s is None:
+        return -1
+    code = _CODES.get(s)
+    if code is None:
+        with _INTERN_LOCK:
+            code = _CODES.get(s)
+            if code is None:
+                code = _CODES[s] = len(_STRINGS)
+                _STRINGS.append(s)
+    return code
+
+
+# Return the string for a code (None for -1)
+def intern_lookup(code: int) -> Optional[str]:
+    return _STRINGS[code] if code >= 0 else None
+
+
+# Snapshot of the intern table, index = code
+def intern_table() -> list[str]:
+    return list(_STRINGS)
+
+
+def _jd(t: Union[datetime, float, None]) -> Optional[float]:
+    if t is None or isinstance(t, (int, float)):
+        return t  # type: ignore[return-value]
+    return datetime_to_jd(t)
 
 
-@dataclass
 class Event:
-    type:     str                     # "aspect" | "ingress" | "station" | "phase"
-    at:       datetime                # exact moment (refined via bisection)
-    body:     str                     # primary body name
-    detail:   str                     # e.g. "conjunction", "Aries", "retrograde", "full moon"
-    glyph:    str                     # display glyph for the event
-    body_two: Optional[str] = None    # second body name (aspects only)
-    orb:      Optional[float] = None  # orb at exact moment (aspects only, ~0)
-    start:    Optional[datetime] = None  # when condition begins (orb entry, phase boundary, etc.)
-    end:      Optional[datetime] = None  # when condition ends
+    # Times are stored as Julian Days (at_jd / start_jd / end_jd); the datetime
+    # attributes (at / start / end) are derived on access
+    __slots__ = ("_type", "_body", "_detail", "_glyph", "_body_two", "orb", "at_jd", "start_jd", "end_jd")
+
+    def __init__(
+        self,
+        type:     str,                                 # "aspect" | "ingress" | "station" | "phase"
+        at:       Union[datetime, float],              # exact moment (refined via bisection)
+        body:     str,                                 # primary body name
+        detail:   str,                                 # e.g. "conjunction", "Aries", "retrograde", "full moon"
+        glyph:    str,                                 # display glyph for the event
+        body_two: Optional[str] = None,                # second body name (aspects only)
+        orb:      Optional[float] = None,              # orb at exact moment (aspects only, ~0)
+        start:    Union[datetime, float, None] = None, # when condition begins (orb entry, phase boundary, etc.)
+        end:      Union[datetime, float, None] = None, # when condition ends
+    ):
+        self._type     = intern_code(type)
+        self._body     = intern_code(body)
+        self._detail   = intern_code(detail)
+        self._glyph    = intern_code(glyph)
+        self._body_two = intern_code(body_two)
+        self.orb       = orb
+        self.at_jd:    float           = _jd(at)     # type: ignore[assignment]
+        self.start_jd: Optional[float] = _jd(start)
+        self.end_jd:   Optional[float] = _jd(end)
+
+    @property
+    def type(self) -> str:
+        return _STRINGS[self._type]
+
+    @type.setter
+    def type(self, value: str) -> None:
+        self._type = intern_code(value)
+
+    @property
+    def body(self) -> str:
+        return _STRINGS[self._body]
+
+    @body.setter
+    def body(self, value: str) -> None:
+        self._body = intern_code(value)
+
+    @property
+    def detail(self) -> str:
+        return _STRINGS[self._detail]
+
+    @detail.setter
+    def detail(self, value: str) -> None:
+        self._detail = intern_code(value)
+
+    @property
+    def glyph(self) -> str:
+        return _STRINGS[self._glyph]
+
+    @glyph.setter
+    def glyph(self, value: str) -> None:
+        self._glyph = intern_code(value)
+
+    @property
+    def body_two(self) -> Optional[str]:
+        return intern_lookup(self._body_two)
+
+    @body_two.setter
+    def body_two(self, value: Optional[str]) -> None:
+        self._body_two = intern_code(value)
+
+    @property
+    def at(self) -> datetime:
+        return jd_to_datetime(self.at_jd)
+
+    @at.setter
+    def at(self, value: Union[datetime, float]) -> None:
+        self.at_jd = _jd(value)  # type: ignore[assignment]
+
+    @property
+    def start(self) -> Optional[datetime]:
+        return jd_to_datetime(self.start_jd) if self.start_jd is not None else None
+
+    @start.setter
+    def start(self, value: Union[datetime, float, None]) -> None:
+        self.start_jd = _jd(value)
+
+    @property
+    def end(self) -> Optional[datetime]:
+        return jd_to_datetime(self.end_jd) if self.end_jd is not None else None
+
+    @end.setter
+    def end(self, value: Union[datetime, float, None]) -> None:
+        self.end_jd = _jd(value)
+
+    # Integer codes into the intern table: (type, body, detail, glyph, body_two)
+    @property
+    def codes(self) -> tuple[int, int, int, int, int]:
+        return (self._type, self._body, self._detail, self._glyph, self._body_two)
+
+    def _key(self) -> tuple:
+        return (*self.codes, self.orb, self.at_jd, self.start_jd, self.end_jd)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (f"Event(type={self.type!r}, at={self.at!r}, body={self.body!r}, detail={self.detail!r}, "
+                f"glyph={self.glyph!r}, body_two={self.body_two!r}, orb={self.orb!r}, "
+                f"start={self.start!r}, end={self.end!r})")
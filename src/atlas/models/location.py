@@ -3,7 +3,7 @@
 # Standard libraries
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Location:
     lat: float
     lon: float
@@ -2,18 +2,29 @@
 import os
 import threading
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 # Internal Modules
 from atlas.core.atlas import Atlas
 from atlas.core.observatory import Observatory
+from atlas.models.aspect import build_aspects, build_transit_aspects
 from atlas.models.celestial_state import CelestialState
 from atlas.models.location import Location
 from atlas.utils.config import load_config
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
+    from atlas.view.offscreen import RendererPool
+
+
+# Chart images: GL contexts kept warm by the server, instants floored to this many seconds
+# for the cache key, and the number of rendered PNGs kept in memory
+RENDER_CONTEXTS  = 2
+INSTANT_QUANTUM  = 60
+IMAGE_CACHE_SIZE = 512
+IMAGE_SIZES      = (64, 2048)
 
 
 # Serialize a CelestialState to a JSON-safe dict
@@ -46,7 +57,7 @@ def _serialize(state: CelestialState) -> dict:
 
 # Build and return a configured FastAPI app
 def create_app() -> "FastAPI":
-    from fastapi import FastAPI, HTTPException
+    from fastapi import FastAPI, HTTPException, Response
 
     cfg       = load_config()
     ephe_path = cfg.get("ephemeris", {}).get("path") or os.fspath(Path.home() / ".ephe")
@@ -70,6 +81,19 @@ def create_app() -> "FastAPI":
 
     _available_celestials = list(cfg.get("celestials", {}).keys())
 
+    # Render pool, started by the first image request so JSON-only servers never open a GL context;
+    # its worker threads are daemons and exit with the server
+    _pool: Optional["RendererPool"] = None
+    _pool_lock = threading.Lock()
+
+    def _renderers() -> "RendererPool":
+        nonlocal _pool
+        with _pool_lock:
+            if _pool is None:
+                from atlas.view.offscreen import RendererPool
+                _pool = RendererPool(RENDER_CONTEXTS)
+            return _pool
+
     # Parse a datetime string — ISO format with optional time component
     def _parse_dt(s: str) -> datetime:
         for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
@@ -79,6 +103,56 @@ def create_app() -> "FastAPI":
                 continue
         raise ValueError(f"unrecognized datetime format: '{s}'")
 
+    # Floor to the cache quantum — charts a few seconds apart are pixel-identical
+    def _quantize(dt: datetime) -> datetime:
+        ts = dt.timestamp()
+        return datetime.fromtimestamp(ts - ts % INSTANT_QUANTUM, tz=timezone.utc)
+
+    # Ecliptic states and cusps for a chart (ephemeris access serialized like the JSON endpoints)
+    def _chart_inputs(dt: datetime, location: Location, zodiac: str, hsys: str, targets: tuple[str, ...]) -> tuple[list, list]:
+        with _lock:
+            _ensure_ephe_path()
+            celestials = [
+                _atlas.build_celestial_state(
+                    dt=dt, location=location, target=t, zodiac=zodiac, properties=["position"], systems=["ecliptic"],
+                )
+                for t in targets
+            ]
+            cusps = _atlas.build_houses(dt=dt, location=location, zodiac=zodiac, hsys=hsys)
+        return cusps, celestials
+
+    @lru_cache(maxsize=IMAGE_CACHE_SIZE)
+    def _chart_png(dt: datetime, lat: float, lon: float, alt: float, zodiac: str, hsys: str,
+                   size: int, targets: tuple[str, ...], title: str) -> bytes:
+        from atlas.view.offscreen import encode_png
+        cusps, celestials = _chart_inputs(dt, Location(lat=lat, lon=lon, alt=alt), zodiac, hsys, targets)
+        aspects = build_aspects(celestials)
+        return _renderers().run(lambda r: encode_png(r.render_chart(cusps, celestials, aspects, size, title)))
+
+    @lru_cache(maxsize=IMAGE_CACHE_SIZE)
+    def _transit_png(dt: datetime, transit_dt: datetime, lat: float, lon: float, alt: float, zodiac: str, hsys: str,
+                     size: int, targets: tuple[str, ...], title: str) -> bytes:
+        from atlas.view.offscreen import encode_png
+        location          = Location(lat=lat, lon=lon, alt=alt)
+        cusps, celestials = _chart_inputs(dt, location, zodiac, hsys, targets)
+        t_cusps, t_cels   = _chart_inputs(transit_dt, location, zodiac, hsys, targets)
+        aspects           = build_transit_aspects(celestials, t_cels)
+        return _renderers().run(lambda r: encode_png(r.render_transit(cusps, celestials, t_cusps, t_cels, aspects, size, title)))
+
+    # Validate the shared image query parameters; returns (instant, targets)
+    def _image_args(at: str, targets: str, size: int) -> tuple[datetime, tuple[str, ...]]:
+        if not IMAGE_SIZES[0] <= size <= IMAGE_SIZES[1]:
+            raise HTTPException(status_code=400, detail=f"size must be between {IMAGE_SIZES[0]} and {IMAGE_SIZES[1]}")
+        try:
+            dt = _parse_dt(at) if at else datetime.now(timezone.utc)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        names = [t.strip() for t in targets.split(",") if t.strip()] or _available_celestials
+        return _quantize(dt), tuple(t for t in names if t in _available_celestials)
+
+    def _png_response(png: bytes) -> "Response":
+        return Response(content=png, media_type="image/png", headers={"Cache-Control": f"public, max-age={INSTANT_QUANTUM}"})
+
 
     # Return house cusps for a given time, location, and house system
     @app.get("/cast")
@@ -156,6 +230,48 @@ def create_app() -> "FastAPI":
             "bodies":   bodies,
         }
 
+    # Radix chart as PNG — rendered offscreen, cached per (instant quantum, location, zodiac, size)
+    @app.get("/chart.png")
+    def chart_png(
+        targets: str = "",
+        at: str = "",
+        zodiac: str = "tropical",
+        hsys: str = "placidus",
+        lat: float = _lat,
+        lon: float = _lon,
+        alt: float = _alt,
+        size: int = 900,
+        title: str = "",
+    ):
+        dt, names = _image_args(at, targets, size)
+        try:
+            png = _chart_png(dt, lat, lon, alt, zodiac, hsys, size, names, title)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return _png_response(png)
+
+    # Natal chart at `at` with the transit ring at `transit` (default: now)
+    @app.get("/transit.png")
+    def transit_png(
+        targets: str = "",
+        at: str = "",
+        transit: str = "",
+        zodiac: str = "tropical",
+        hsys: str = "placidus",
+        lat: float = _lat,
+        lon: float = _lon,
+        alt: float = _alt,
+        size: int = 900,
+        title: str = "",
+    ):
+        dt, names = _image_args(at, targets, size)
+        transit_dt, _ = _image_args(transit, targets, size)
+        try:
+            png = _transit_png(dt, transit_dt, lat, lon, alt, zodiac, hsys, size, names, title)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return _png_response(png)
+
     return app
 
 
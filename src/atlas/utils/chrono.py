@@ -1,5 +1,5 @@
 # Standard libraries
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Internal libraries
 from atlas.models.location import Location
@@ -24,3 +24,19 @@ def utc_to_local(t: datetime, location: Location) -> datetime:
     local_tz = pytz.timezone(tz_str)
     t_utc    = pytz.utc.localize(t)
     return t_utc.astimezone(local_tz).replace(tzinfo=None)
+
+
+# Julian Day of the J2000.0 epoch and its naive UTC datetime
+J2000_JD: float = 2451545.0
+_J2000_DT       = datetime(2000, 1, 1, 12, 0, 0)
+
+
+# Converts a naive UTC datetime to a Julian Day (Gregorian calendar, matches swe.julday)
+def datetime_to_jd(t: datetime) -> float:
+    return J2000_JD + (t.replace(tzinfo=None) - _J2000_DT).total_seconds() / 86400.0
+
+
+# Converts a Julian Day back to a naive UTC datetime. A float64 JD resolves only ~40 µs in this era, so the
+# result is rounded to the millisecond — whole minutes and seconds then survive the round trip exactly
+def jd_to_datetime(jd: float) -> datetime:
+    return _J2000_DT + timedelta(milliseconds=round((jd - J2000_JD) * 86_400_000.0))
@@ -1,11 +1,20 @@
 # atlas/src/utils/constellation.py
-# IAU constellation lookup using Roman (1987) boundary data (B1875.0 epoch)
+# IAU constellation lookup using Roman (1987) boundary data (B1875.0 epoch), compiled to constellations.npy
 
 # Standard Modules
+import logging
 import math
+from bisect import bisect_right
 from pathlib import Path
 from functools import lru_cache
-from typing import Optional
+from typing import NamedTuple, Optional
+
+# Internal Modules
+from atlas.utils.chrono import J2000_JD
+from atlas.utils.precession import B1875_JD, precess_radec, precession_matrix, radec_to_unit, rotate
+
+# External Modules
+import numpy as np
 
 
 # Full constellation name map keyed by IAU abbreviation
@@ -42,65 +51,227 @@ _NAMES: dict[str, str] = {
     "Vul": "Vulpecula",     "Pyx": "Pyxis",         "Ser": "Serpens",
 }
 
-# Load and parse the boundary data file once at import
-@lru_cache(maxsize=1)
-def _load_boundaries() -> list[tuple[float, float, float, str]]:
-    data_path = Path(__file__).parent.parent / "data" / "constellations.dat"
-    boundaries = []
-    with open(data_path) as f:
+_DATA_DIR = Path(__file__).parent.parent / "data"
+_DAT_PATH = _DATA_DIR / "constellations.dat"
+_NPY_PATH = _DATA_DIR / "constellations.npy"
+
+# Bump when the compiled layout changes — a stale constellations.npy is then rebuilt in memory
+FORMAT_VERSION = 1
+
+STRIP_DTYPE = np.dtype([
+    ("ra_low",  np.float64),   # RA hours, B1875
+    ("ra_high", np.float64),
+    ("dec_low", np.float64),   # Dec degrees, B1875
+    ("abbr",    "U3"),
+])
+CENTER_DTYPE = np.dtype([
+    ("abbr", "U3"),
+    ("ra",   np.float64),          # label position, degrees, B1875
+    ("dec",  np.float64),
+    ("unit", np.float64, (3,)),    # the same point as a J2000 unit vector
+])
+
+# Sampling of boundary polylines — RA hours along parallels, degrees along hour circles
+_PARALLEL_STEP = 0.5
+_MERIDIAN_STEP = 1.0
+
+
+# Parse the Roman (1987) strip table: (ra_low h, ra_high h, dec_low °, abbr), file order
+def _parse_dat(path: Path) -> list[tuple[float, float, float, str]]:
+    strips = []
+    with open(path) as f:
         for line in f:
             parts = line.split()
             if len(parts) == 4:
-                ra_low, ra_high, dec_low, abbr = float(parts[0]), float(parts[1]), float(parts[2]), parts[3]
-                boundaries.append((ra_low, ra_high, dec_low, abbr))
-    return boundaries
+                strips.append((float(parts[0]), float(parts[1]), float(parts[2]), parts[3]))
+    return strips
+
+
+# J2000 → B1875 precession matrix as nested tuples for the scalar path
+@lru_cache(maxsize=1)
+def _b1875_rows() -> tuple[tuple[float, ...], ...]:
+    return tuple(tuple(row) for row in precession_matrix(J2000_JD, B1875_JD).tolist())
 
 
-# Precess RA/Dec from J2000.0 to B1875.0 using IAU precession (Lieske 1979)
+# Precess RA/Dec from J2000.0 to B1875.0 (IAU 1976 precession, Lieske 1977)
 def _precess_to_b1875(ra_deg: float, dec_deg: float) -> tuple[float, float]:
-    # Julian centuries from J2000.0 to B1875.0
-    T = -1.2475
+    ra, dec = math.radians(ra_deg), math.radians(dec_deg)
+    x, y, z = math.cos(dec) * math.cos(ra), math.cos(dec) * math.sin(ra), math.sin(dec)
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _b1875_rows()
+
+    px = m00 * x + m01 * y + m02 * z
+    py = m10 * x + m11 * y + m12 * z
+    pz = m20 * x + m21 * y + m22 * z
+    return math.degrees(math.atan2(py, px)) % 360, math.degrees(math.asin(max(-1.0, min(1.0, pz))))
+
+
+# Band × RA-cell lookup table: band k spans [dec_levels[k], dec_levels[k+1]),
+# cell c spans [ra_breaks[c], ra_breaks[c+1]) hours; table holds an index into abbrs, -1 if uncovered
+class _BoundaryIndex(NamedTuple):
+    dec_levels: np.ndarray
+    ra_breaks:  np.ndarray
+    table:      np.ndarray
+    abbrs:      tuple[str, ...]
+
+
+ #=========#
+# COMPILER #
+ #=========#
+
+# Paint the strips band by band (ascending dec) so each cell holds the strip with the highest
+# dec_low at or below the band — the same winner as a full scan, ties going to the first listed strip
+def _paint_index(strips: list[tuple[float, float, float, str]]) -> _BoundaryIndex:
+    abbrs = tuple(dict.fromkeys(s[3] for s in strips))
+    codes = {a: i for i, a in enumerate(abbrs)}
+
+    dec_levels = np.unique([s[2] for s in strips])
+    ra_breaks  = np.unique([0.0, 24.0] + [s[0] for s in strips] + [s[1] for s in strips])
+    table      = np.full((len(dec_levels), len(ra_breaks) - 1), -1, dtype=np.int16)
+
+    row   = table[0].copy()
+    order = sorted(range(len(strips)), key=lambda i: (strips[i][2], -i))
+    band  = 0
+    for i in order:
+        ra_low, ra_high, dec_low, abbr = strips[i]
+        while dec_levels[band] < dec_low:
+            table[band] = row
+            band += 1
+        c0, c1 = np.searchsorted(ra_breaks, (ra_low, ra_high))
+        row[c0:c1] = codes[abbr]
+    table[band:] = row
+    return _BoundaryIndex(dec_levels, ra_breaks, table, abbrs)
+
+
+# Label position per constellation: mean strip RA midpoint (wrap-aware), midpoint of its dec extent
+def _centers(strips: list[tuple[float, float, float, str]], abbrs: tuple[str, ...]) -> np.ndarray:
+    centers = np.zeros(len(abbrs), dtype=CENTER_DTYPE)
+    for k, abbr in enumerate(abbrs):
+        own     = [s for s in strips if s[3] == abbr]
+        ra_mids = [(s[0] + s[1]) / 2 for s in own]
+        if max(ra_mids) - min(ra_mids) > 12.0:
+            ra_mids = [r + 24.0 if r < 12.0 else r for r in ra_mids]
+        centers[k]["abbr"] = abbr
+        centers[k]["ra"]   = (sum(ra_mids) / len(ra_mids) % 24.0) * 15.0
+        centers[k]["dec"]  = (min(s[2] for s in own) + max(s[2] for s in own)) / 2
+    centers["unit"] = rotate(radec_to_unit(centers["ra"], centers["dec"]), precession_matrix(B1875_JD, J2000_JD))
+    return centers
 
-    ra  = math.radians(ra_deg)
-    dec = math.radians(dec_deg)
 
-    # IAU precession angles (arcseconds → radians)
-    zeta  = math.radians((2306.2181 + 1.39656 * T) * T / 3600)
-    z     = math.radians((2306.2181 + 1.39656 * T) * T / 3600)
-    theta = math.radians((2004.3109 - 0.85330 * T) * T / 3600)
+# Boundary polylines as (S, 2, 3) J2000 unit-vector segments, traced from the band table:
+# parallels where a cell changes constellation between bands, hour circles where it changes between cells
+def _segments(idx: _BoundaryIndex) -> np.ndarray:
+    levels, breaks, table = idx.dec_levels, idx.ra_breaks, idx.table
+    tops  = np.append(levels[1:], 90.0)
+    verts: list[tuple[float, float, float, float]] = []  # (ra1 h, dec1, ra2 h, dec2)
 
-    # Rotation
-    a = math.cos(dec) * math.sin(ra + zeta)
-    b = math.cos(theta) * math.cos(dec) * math.cos(ra + zeta) - math.sin(theta) * math.sin(dec)
-    c = math.sin(theta) * math.cos(dec) * math.cos(ra + zeta) + math.cos(theta) * math.sin(dec)
+    def _runs(mask: np.ndarray) -> list[tuple[int, int]]:
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+        return list(zip(edges[0::2], edges[1::2]))
 
-    ra_1875  = math.degrees(math.atan2(a, b)) + math.degrees(z)
-    dec_1875 = math.degrees(math.asin(c))
+    for k in range(1, len(levels)):
+        for c0, c1 in _runs(table[k] != table[k - 1]):
+            ras = np.linspace(breaks[c0], breaks[c1], max(1, math.ceil((breaks[c1] - breaks[c0]) / _PARALLEL_STEP)) + 1)
+            verts += [(r1, levels[k], r2, levels[k]) for r1, r2 in zip(ras[:-1], ras[1:])]
 
-    # Normalize RA to [0, 360)
-    ra_1875 = ra_1875 % 360
-    return ra_1875, dec_1875
+    for k in range(len(levels)):
+        differs = table[k] != np.roll(table[k], 1)  # cell c vs c-1; c=0 compares across 0h/24h
+        decs    = np.linspace(levels[k], tops[k], max(1, math.ceil((tops[k] - levels[k]) / _MERIDIAN_STEP)) + 1)
+        for c in np.flatnonzero(differs):
+            verts += [(breaks[c], d1, breaks[c], d2) for d1, d2 in zip(decs[:-1], decs[1:])]
 
+    v    = np.array(verts, dtype=np.float64).reshape(-1, 4)
+    m    = precession_matrix(B1875_JD, J2000_JD)
+    ends = [rotate(radec_to_unit(v[:, i] * 15.0, v[:, i + 1]), m) for i in (0, 2)]
+    return np.stack(ends, axis=1)
+
+
+# Compile constellations.dat into one structured record (a single .npy, memory-mappable)
+def build_constellation_data(dat_path: Path = _DAT_PATH) -> np.ndarray:
+    strips   = _parse_dat(dat_path)
+    idx      = _paint_index(strips)
+    centers  = _centers(strips, idx.abbrs)
+    segments = _segments(idx)
+
+    dtype = np.dtype([
+        ("version",    np.int32),
+        ("strips",     STRIP_DTYPE,  (len(strips),)),
+        ("dec_levels", np.float64,   (len(idx.dec_levels),)),
+        ("ra_breaks",  np.float64,   (len(idx.ra_breaks),)),
+        ("table",      np.int16,     idx.table.shape),
+        ("abbrs",      "U3",         (len(idx.abbrs),)),
+        ("centers",    CENTER_DTYPE, (len(centers),)),
+        ("segments",   np.float64,   segments.shape),
+    ])
+    data = np.zeros(1, dtype=dtype)
+    data["version"]    = FORMAT_VERSION
+    data["strips"][0]  = np.array(strips, dtype=STRIP_DTYPE)
+    data["dec_levels"] = idx.dec_levels
+    data["ra_breaks"]  = idx.ra_breaks
+    data["table"]      = idx.table
+    data["abbrs"]      = idx.abbrs
+    data["centers"][0] = centers
+    data["segments"]   = segments
+    return data
+
+
+ #========#
+# LOADER #
+ #========#
+
+# Compiled boundary data, memory-mapped once; falls back to compiling the text table if the
+# binary file is missing or from an older layout. Fields: strips, dec_levels, ra_breaks, table, abbrs, centers, segments
+@lru_cache(maxsize=1)
+def load_constellation_data() -> dict[str, np.ndarray]:
+    data = None
+    if _NPY_PATH.exists():
+        data = np.load(_NPY_PATH, mmap_mode="r")
+        if data.dtype.names is None or "version" not in data.dtype.names or int(data["version"][0]) != FORMAT_VERSION:
+            logging.warning("constellations.npy is stale — run scripts/build_constellations.py")
+            data = None
+    if data is None:
+        data = build_constellation_data()
+    return {name: data[name][0] for name in data.dtype.names if name != "version"}
+
+
+@lru_cache(maxsize=1)
+def _load_index() -> _BoundaryIndex:
+    data = load_constellation_data()
+    return _BoundaryIndex(data["dec_levels"], data["ra_breaks"], data["table"], tuple(data["abbrs"].tolist()))
+
+
+ #========#
+# LOOKUP #
+ #========#
 
 # Return the full constellation name for a J2000 RA/Dec (degrees)
 def identify_constellation(ra_deg: float, dec_deg: float) -> Optional[str]:
     ra_1875, dec_1875 = _precess_to_b1875(ra_deg, dec_deg)
-    ra_hours = ra_1875 / 15.0
-
-    boundaries  = _load_boundaries()
-    best_abbr   = None
-    best_dec    = -90.0
-
-    for ra_low, ra_high, dec_low, abbr in boundaries:
-        if dec_1875 < dec_low:
-            continue
-        
-        # Handle RA wraparound (e.g. ra_low=23h, ra_high=24h wraps to 0h)
-        in_range = (ra_low <= ra_hours < ra_high) if ra_low < ra_high else (ra_hours >= ra_low or ra_hours < ra_high)
-        if in_range and dec_low > best_dec:
-            best_dec  = dec_low
-            best_abbr = abbr
-
-    if best_abbr is None:
+
+    idx  = _load_index()
+    band = bisect_right(idx.dec_levels, dec_1875) - 1
+    if band < 0:
+        return None
+    cell = min(bisect_right(idx.ra_breaks, ra_1875 / 15.0) - 1, idx.table.shape[1] - 1)
+
+    code = idx.table[band, cell]
+    if code < 0:
         return None
-    return _NAMES.get(best_abbr, best_abbr)
+    abbr = idx.abbrs[code]
+    return _NAMES.get(abbr, abbr)
+
+
+# Vectorized identify_constellation: full names for arrays of J2000 RA/Dec (degrees), None where unresolved
+def identify_constellations(ra_deg: np.ndarray, dec_deg: np.ndarray) -> np.ndarray:
+    ra_deg, dec_deg   = np.broadcast_arrays(np.asarray(ra_deg, dtype=np.float64), np.asarray(dec_deg, dtype=np.float64))
+    ra_1875, dec_1875 = precess_radec(ra_deg, dec_deg, J2000_JD, B1875_JD)
+
+    idx   = _load_index()
+    band  = np.searchsorted(idx.dec_levels, dec_1875, side="right") - 1
+    cell  = np.minimum(np.searchsorted(idx.ra_breaks, ra_1875 / 15.0, side="right") - 1, idx.table.shape[1] - 1)
+    valid = (band >= 0) & ~np.isnan(ra_1875) & ~np.isnan(dec_1875)
+
+    codes = np.full(ra_deg.shape, -1, dtype=np.int16)
+    codes[valid] = idx.table[band[valid], cell[valid]]
+
+    names = np.array([_NAMES.get(a, a) for a in idx.abbrs] + [None], dtype=object)
+    return names[codes]  # code -1 picks the trailing None
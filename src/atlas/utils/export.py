@@ -0,0 +1,190 @@
+# atlas/src/utils/export.py
+# Columnar export of frames and events — npy, parquet, arrow (IPC file), csv/tsv, ndjson
+
+# Standard libraries
+import csv
+import json
+from typing import TYPE_CHECKING, NamedTuple, TextIO, Union
+
+# Internal libraries
+from atlas.models.celestial_state import SIGNS
+from atlas.utils.chrono import J2000_JD
+
+if TYPE_CHECKING:
+    from atlas.models.celestial_frame import CelestialFrame
+    from atlas.models.event import Event
+
+# External libraries
+import numpy as np
+
+
+EXPORT_FORMATS: tuple[str, ...] = ("npy", "parquet", "arrow", "csv", "tsv", "ndjson")
+BINARY_FORMATS: tuple[str, ...] = ("npy", "parquet", "arrow")
+
+_J2000_US = np.datetime64("2000-01-01T12:00:00", "us")
+
+
+# Dictionary-encoded string column: integer codes into a label table (-1 = missing)
+class Categorical(NamedTuple):
+    codes:  np.ndarray
+    labels: list[str]
+
+    def decode(self) -> np.ndarray:
+        table = np.array([*self.labels, ""], dtype=object)
+        return table[self.codes]  # code -1 picks the trailing ""
+
+
+# Julian Days → datetime64[us] (NaN → NaT), rounded to the millisecond like chrono.jd_to_datetime
+def jd_to_datetime64(jd: np.ndarray) -> np.ndarray:
+    jd  = np.asarray(jd, dtype=np.float64)
+    ms  = np.round((jd - J2000_JD) * 86_400_000.0)
+    out = _J2000_US + np.nan_to_num(ms).astype("timedelta64[ms]")
+    out[np.isnan(jd)] = np.datetime64("NaT")
+    return out
+
+
+ #=======#
+# COLUMNS #
+ #=======#
+
+# Long layout of a frame: one row per (time, body); float columns are views where the frame is contiguous
+def frame_columns(frame: "CelestialFrame") -> dict[str, Union[np.ndarray, Categorical]]:
+    n_times, n_bodies = frame.shape
+    columns: dict[str, Union[np.ndarray, Categorical]] = {
+        "dt":     jd_to_datetime64(np.repeat(frame.jd, n_bodies)),
+        "jd":     np.repeat(frame.jd, n_bodies),
+        "target": Categorical(np.tile(np.arange(n_bodies, dtype=np.int32), n_times), list(frame.targets)),
+    }
+    for name in frame.columns:
+        columns[name] = frame[name].reshape(-1)
+    if "lon" in frame:
+        columns["sign"]       = Categorical(frame.sign.reshape(-1).astype(np.int32), [name for _, name in SIGNS])
+        columns["orb"]        = frame.orb.reshape(-1)
+        columns["retrograde"] = frame.retrograde.reshape(-1)
+    if "phase_angle" in frame:
+        columns["phase_cycle"] = frame.phase_cycle.reshape(-1)
+        columns["elong_cycle"] = frame.elong_cycle.reshape(-1)
+    return columns
+
+
+# One row per event; string fields stay dictionary-encoded against the event intern table
+def event_columns(events: "list[Event]") -> dict[str, Union[np.ndarray, Categorical]]:
+    from atlas.models.event import intern_table
+
+    labels = intern_table()
+    codes  = np.array([e.codes for e in events], dtype=np.int32).reshape(-1, 5)
+    nan    = float("nan")
+    at     = np.array([e.at_jd for e in events], dtype=np.float64)
+    start  = np.array([nan if e.start_jd is None else e.start_jd for e in events], dtype=np.float64)
+    end    = np.array([nan if e.end_jd is None else e.end_jd for e in events], dtype=np.float64)
+    return {
+        "type":     Categorical(codes[:, 0], labels),
+        "body":     Categorical(codes[:, 1], labels),
+        "body_two": Categorical(codes[:, 4], labels),
+        "detail":   Categorical(codes[:, 2], labels),
+        "glyph":    Categorical(codes[:, 3], labels),
+        "at":       jd_to_datetime64(at),
+        "start":    jd_to_datetime64(start),
+        "end":      jd_to_datetime64(end),
+        "at_jd":    at,
+        "start_jd": start,
+        "end_jd":   end,
+        "orb":      np.array([nan if e.orb is None else e.orb for e in events], dtype=np.float64),
+    }
+
+
+ #=======#
+# WRITERS #
+ #=======#
+
+# Write columns to a path (any format) or an open text stream (csv, tsv, ndjson)
+def write_columns(columns: dict[str, Union[np.ndarray, Categorical]], dest: Union[str, TextIO], fmt: str) -> None:
+    match fmt:
+        case "npy":
+            _write_npy(columns, _require_path(dest, fmt))
+        case "parquet":
+            table = _arrow_table(columns)
+            import pyarrow.parquet as pq  # type: ignore
+            pq.write_table(table, _require_path(dest, fmt))
+        case "arrow":
+            table = _arrow_table(columns)
+            import pyarrow as pa  # type: ignore
+            with pa.OSFile(_require_path(dest, fmt), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        case "csv" | "tsv" | "ndjson":
+            if isinstance(dest, str):
+                with open(dest, "w", newline="", encoding="utf-8") as f:
+                    _write_text(columns, f, fmt)
+            else:
+                _write_text(columns, dest, fmt)
+        case _:
+            raise ValueError(f"unknown export format: '{fmt}' — use one of {', '.join(EXPORT_FORMATS)}")
+
+
+def _require_path(dest: Union[str, TextIO], fmt: str) -> str:
+    if not isinstance(dest, str):
+        raise ValueError(f"{fmt} export needs an output path (--out)")
+    return dest
+
+
+# Structured array with one field per column; strings become fixed-width unicode
+def _write_npy(columns: dict, path: str) -> None:
+    arrays = {name: col.decode() if isinstance(col, Categorical) else col for name, col in columns.items()}
+    fields = []
+    for name, arr in arrays.items():
+        if arr.dtype == object:
+            width = max((len(s) for s in arr), default=1) or 1
+            fields.append((name, f"U{width}"))
+        else:
+            fields.append((name, arr.dtype))
+    n   = len(next(iter(arrays.values()))) if arrays else 0
+    out = np.empty(n, dtype=fields)
+    for name, arr in arrays.items():
+        out[name] = arr
+    np.save(path, out)
+
+
+# Arrow table built from NumPy buffers — numeric columns are wrapped without copying
+def _arrow_table(columns: dict):
+    try:
+        import pyarrow as pa  # type: ignore
+    except ImportError:
+        raise ImportError("pyarrow required for parquet/arrow export: pip install pyarrow") from None
+
+    arrays = {}
+    for name, col in columns.items():
+        if isinstance(col, Categorical):
+            missing = col.codes < 0
+            indices = pa.array(col.codes, mask=missing if missing.any() else None)
+            arrays[name] = pa.DictionaryArray.from_arrays(indices, pa.array(col.labels, type=pa.string()))
+        elif np.issubdtype(col.dtype, np.datetime64):
+            arrays[name] = pa.array(col, mask=np.isnat(col))
+        else:
+            arrays[name] = pa.array(col)
+    return pa.table(arrays)
+
+
+# Row-oriented text output; NaN / NaT / missing codes are written as empty (csv) or null (ndjson)
+def _write_text(columns: dict, out: TextIO, fmt: str) -> None:
+    names = list(columns)
+    cols  = []
+    for col in columns.values():
+        if isinstance(col, Categorical):
+            values = [None if c < 0 else col.labels[c] for c in col.codes.tolist()]
+        elif np.issubdtype(col.dtype, np.datetime64):
+            values = [None if s == "NaT" else s for s in np.datetime_as_string(col, unit="s").tolist()]
+        elif np.issubdtype(col.dtype, np.floating):
+            values = [None if v != v else v for v in col.tolist()]
+        else:
+            values = col.tolist()
+        cols.append(values)
+
+    if fmt == "ndjson":
+        for row in zip(*cols):
+            out.write(json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n")
+        return
+
+    writer = csv.writer(out, delimiter="\t" if fmt == "tsv" else ",", lineterminator="\n")
+    writer.writerow(names)
+    for row in zip(*cols):
+        writer.writerow(["" if v is None else v for v in row])
@@ -0,0 +1,63 @@
+# atlas/src/utils/interpolate.py
+# Cubic Hermite interpolation of longitudes between two keyframes of positions and speeds, evaluated in place
+
+# External Modules
+import numpy as np
+
+
+class AngleHermite:
+    # n angles (degrees) with rates (degrees/day) at both ends of an interval h days long. set() copies a new
+    # keyframe pair into preallocated arrays; __call__(t) evaluates into the same output array every time,
+    # so per-frame evaluation allocates nothing.
+
+    def __init__(self, n: int):
+        self.p0   = np.zeros(n)
+        self.v0   = np.zeros(n)
+        self.d    = np.zeros(n)   # p1 - p0 along the direction of travel (may exceed ±180° for fast bodies)
+        self.v1   = np.zeros(n)
+        self.h    = 1.0
+        self.out  = np.zeros(n)
+        self._tmp = np.zeros(n)
+
+    def __len__(self) -> int:
+        return len(self.out)
+
+    def set(self, p0, v0, p1, v1, h: float) -> None:
+        np.copyto(self.p0, p0)
+        np.copyto(self.v0, v0)
+        np.copyto(self.v1, v1)
+        self.h = float(h)
+
+        # Travel p0 → p1: the wrapped residual around the distance the mean speed predicts, so a body that
+        # moves more than 180° in one interval still unwraps the right way
+        np.add(self.v0, self.v1, out=self._tmp)
+        self._tmp *= 0.5 * self.h
+        np.nan_to_num(self._tmp, copy=False)
+        np.subtract(p1, self.p0, out=self.d)
+        self.d -= self._tmp
+        self.d += 180.0
+        np.mod(self.d, 360.0, out=self.d)
+        self.d -= 180.0
+        self.d += self._tmp
+
+        # Missing speeds fall back to the chord slope (linear motion)
+        chord = self.d / self.h if self.h else self.d
+        np.copyto(self.v0, chord, where=np.isnan(self.v0))
+        np.copyto(self.v1, chord, where=np.isnan(self.v1))
+
+    # Positions at fraction t ∈ [0, 1] of the interval, wrapped to [0, 360)
+    def __call__(self, t: float) -> np.ndarray:
+        t2, t3 = t * t, t * t * t
+        h01 = -2.0 * t3 + 3.0 * t2          # p(t) = p0 + h01·Δ + h·(h10·v0 + h11·v1), since h00 + h01 = 1
+        h10 = (t3 - 2.0 * t2 + t) * self.h
+        h11 = (t3 - t2) * self.h
+
+        out = self.out
+        np.multiply(self.d, h01, out=out)
+        out += self.p0
+        np.multiply(self.v0, h10, out=self._tmp)
+        out += self._tmp
+        np.multiply(self.v1, h11, out=self._tmp)
+        out += self._tmp
+        np.mod(out, 360.0, out=out)
+        return out
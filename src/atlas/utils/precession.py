@@ -0,0 +1,119 @@
+# atlas/src/utils/precession.py
+# Precession (IAU 1976, Lieske 1977) and low-accuracy nutation (IAU 1980) as cached 3×3 rotation matrices
+
+# Standard Modules
+import math
+from functools import lru_cache
+
+# Internal Modules
+from atlas.utils.chrono import J2000_JD
+
+# External Modules
+import numpy as np
+
+
+# Besselian epoch B1875.0 — the epoch of the Roman (1987) constellation boundaries
+B1875_JD: float = 2405889.258550475
+
+_ARCSEC = math.pi / (180.0 * 3600.0)
+
+
+# Frame rotations about the x / y / z axes (rotate the coordinate frame by +a radians)
+def rot_x(a: float) -> np.ndarray:
+    c, s = math.cos(a), math.sin(a)
+    return np.array([[1.0, 0.0, 0.0], [0.0, c, s], [0.0, -s, c]])
+
+
+def rot_y(a: float) -> np.ndarray:
+    c, s = math.cos(a), math.sin(a)
+    return np.array([[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]])
+
+
+def rot_z(a: float) -> np.ndarray:
+    c, s = math.cos(a), math.sin(a)
+    return np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def _frozen(m: np.ndarray) -> np.ndarray:
+    m.flags.writeable = False
+    return m
+
+
+ #========#
+# MATRICES #
+ #========#
+
+# Mean obliquity of the ecliptic (IAU 1980), radians
+def mean_obliquity(jd: float) -> float:
+    T = (jd - J2000_JD) / 36525.0
+    return (84381.448 - 46.8150 * T - 0.00059 * T * T + 0.001813 * T * T * T) * _ARCSEC
+
+
+# Mean equator & equinox of jd_from → mean equator & equinox of jd_to
+@lru_cache(maxsize=64)
+def precession_matrix(jd_from: float, jd_to: float) -> np.ndarray:
+    T = (jd_from - J2000_JD) / 36525.0
+    t = (jd_to - jd_from) / 36525.0
+
+    zeta  = ((2306.2181 + 1.39656 * T - 0.000139 * T * T) * t + (0.30188 - 0.000344 * T) * t * t + 0.017998 * t ** 3) * _ARCSEC
+    z     = ((2306.2181 + 1.39656 * T - 0.000139 * T * T) * t + (1.09468 + 0.000066 * T) * t * t + 0.018203 * t ** 3) * _ARCSEC
+    theta = ((2004.3109 - 0.85330 * T - 0.000217 * T * T) * t - (0.42665 + 0.000217 * T) * t * t - 0.041833 * t ** 3) * _ARCSEC
+
+    return _frozen(rot_z(-z) @ rot_y(theta) @ rot_z(-zeta))
+
+
+# Nutation in longitude and obliquity (radians) — the four largest IAU 1980 terms, ~0.5" accuracy
+def nutation(jd: float) -> tuple[float, float]:
+    T     = (jd - J2000_JD) / 36525.0
+    L     = math.radians(280.4665 + 36000.7698 * T)
+    Lm    = math.radians(218.3165 + 481267.8813 * T)
+    omega = math.radians(125.04452 - 1934.136261 * T)
+
+    d_psi = -17.20 * math.sin(omega) - 1.32 * math.sin(2 * L) - 0.23 * math.sin(2 * Lm) + 0.21 * math.sin(2 * omega)
+    d_eps =   9.20 * math.cos(omega) + 0.57 * math.cos(2 * L) + 0.10 * math.cos(2 * Lm) - 0.09 * math.cos(2 * omega)
+    return d_psi * _ARCSEC, d_eps * _ARCSEC
+
+
+# Mean equator & equinox of jd → true equator & equinox of jd
+@lru_cache(maxsize=64)
+def nutation_matrix(jd: float) -> np.ndarray:
+    d_psi, d_eps = nutation(jd)
+    eps0         = mean_obliquity(jd)
+    return _frozen(rot_x(-(eps0 + d_eps)) @ rot_z(-d_psi) @ rot_x(eps0))
+
+
+# Mean catalog epoch → equator of date; with nutate=True the result is the true (apparent-frame) equator
+@lru_cache(maxsize=64)
+def epoch_matrix(jd_from: float, jd_to: float, nutate: bool = False) -> np.ndarray:
+    m = precession_matrix(jd_from, jd_to)
+    return _frozen(nutation_matrix(jd_to) @ m) if nutate else m
+
+
+ #=======#
+# VECTORS #
+ #=======#
+
+# RA/Dec (degrees) → (N, 3) unit vectors
+def radec_to_unit(ra_deg: np.ndarray, dec_deg: np.ndarray) -> np.ndarray:
+    ra      = np.radians(np.asarray(ra_deg, dtype=np.float64))
+    dec     = np.radians(np.asarray(dec_deg, dtype=np.float64))
+    cos_dec = np.cos(dec)
+    return np.stack([cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)], axis=-1)
+
+
+# (N, 3) vectors → RA in [0, 360) and Dec (degrees)
+def unit_to_radec(v: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    v   = np.asarray(v, dtype=np.float64)
+    ra  = np.degrees(np.arctan2(v[..., 1], v[..., 0])) % 360.0
+    dec = np.degrees(np.arcsin(np.clip(v[..., 2], -1.0, 1.0)))
+    return ra, dec
+
+
+# Apply a rotation to (N, 3) row vectors — one matrix multiply for a whole catalog
+def rotate(v: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    return np.asarray(v) @ matrix.T
+
+
+# Precess RA/Dec arrays between mean epochs (degrees in, degrees out)
+def precess_radec(ra_deg: np.ndarray, dec_deg: np.ndarray, jd_from: float, jd_to: float, nutate: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    return unit_to_radec(rotate(radec_to_unit(ra_deg, dec_deg), epoch_matrix(jd_from, jd_to, nutate)))
@@ -0,0 +1,80 @@
+# atlas/src/utils/spatial.py
+# Uniform-grid index over 2D points — nearest, radius and rectangle queries without scanning every point
+
+# Standard Modules
+import math
+from typing import Optional
+
+# External Modules
+import numpy as np
+
+
+class PointGrid:
+    # Points are bucketed into square cells, CSR-style: `order` lists point indices sorted by cell id and
+    # `starts[c]:starts[c + 1]` is cell c's run. Cells in one grid row are adjacent in that order, so a
+    # query touches one contiguous slice per row it overlaps.
+
+    def __init__(self, xy: np.ndarray, cell: float):
+        self.xy   = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.cell = float(cell)
+
+        lo = self.xy.min(axis=0) if len(self.xy) else np.zeros(2)
+        hi = self.xy.max(axis=0) if len(self.xy) else np.zeros(2)
+        self._origin = lo
+        self._nx     = int((hi[0] - lo[0]) // self.cell) + 1
+        self._ny     = int((hi[1] - lo[1]) // self.cell) + 1
+
+        ix, iy      = self._cells(self.xy[:, 0], self.xy[:, 1])
+        cid         = iy * self._nx + ix
+        self._order = np.argsort(cid, kind="stable")
+        self._starts = np.searchsorted(cid[self._order], np.arange(self._nx * self._ny + 1))
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def _cells(self, x, y) -> tuple[np.ndarray, np.ndarray]:
+        ix = np.clip(((np.asarray(x) - self._origin[0]) // self.cell).astype(np.int64), 0, self._nx - 1)
+        iy = np.clip(((np.asarray(y) - self._origin[1]) // self.cell).astype(np.int64), 0, self._ny - 1)
+        return ix, iy
+
+    # Indices of points in the cells overlapping a rectangle (a superset of the exact answer)
+    def _candidates(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        ox, oy = self._origin
+        if not len(self.xy) or x1 < ox or y1 < oy or x0 > ox + self._nx * self.cell or y0 > oy + self._ny * self.cell:
+            return np.empty(0, dtype=np.int64)
+        (cx0, cx1), (cy0, cy1) = (self._cells([x0, x1], [y0, y1]))
+        runs = [
+            self._order[self._starts[row * self._nx + cx0]:self._starts[row * self._nx + cx1 + 1]]
+            for row in range(int(cy0), int(cy1) + 1)
+        ]
+        return np.concatenate(runs)
+
+    # Point indices inside an axis-aligned rectangle (bounds in any order)
+    def within_rect(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        idx = self._candidates(x0, y0, x1, y1)
+        p   = self.xy[idx]
+        return idx[(p[:, 0] >= x0) & (p[:, 0] <= x1) & (p[:, 1] >= y0) & (p[:, 1] <= y1)]
+
+    # Point indices within `radius` of (x, y), nearest first
+    def within_radius(self, x: float, y: float, radius: float) -> np.ndarray:
+        idx  = self._candidates(x - radius, y - radius, x + radius, y + radius)
+        dist = np.hypot(self.xy[idx, 0] - x, self.xy[idx, 1] - y)
+        keep = dist <= radius
+        return idx[keep][np.argsort(dist[keep], kind="stable")]
+
+    # Index of the closest point within `radius`, or None
+    def nearest(self, x: float, y: float, radius: float = math.inf) -> Optional[int]:
+        if not len(self.xy):
+            return None
+        if math.isinf(radius):
+            # Widen the search until it hits; beyond the farthest grid corner every point is in range
+            ox, oy = self._origin
+            far    = max(math.hypot(cx - x, cy - y) for cx in (ox, ox + self._nx * self.cell) for cy in (oy, oy + self._ny * self.cell))
+            radius = self.cell
+            while not len(hits := self.within_radius(x, y, min(radius, far))) and radius < far:
+                radius *= 2.0
+        else:
+            hits = self.within_radius(x, y, radius)
+        return int(hits[0]) if len(hits) else None
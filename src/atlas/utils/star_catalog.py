@@ -0,0 +1,239 @@
+# atlas/src/utils/star_catalog.py
+# Sky-tiled, magnitude-sorted star catalog: stars.tiled.npy (rows) + stars.index.npy (tile offsets), memory-mapped
+
+# Standard Modules
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+# Internal Modules
+from atlas.utils.precession import radec_to_unit
+
+# External Modules
+import numpy as np
+
+
+_DATA_DIR = Path(__file__).parent.parent / "data"
+
+FLAT_NAME  = "stars.npy"          # plain catalog as written by older convert_hyg.py runs
+TILED_NAME = "stars.tiled.npy"    # rows grouped by tile, brightest first within each tile
+INDEX_NAME = "stars.index.npy"    # one structured record of tile offsets and magnitude cutoffs
+
+# Bump when the tiled layout changes — a stale index is rebuilt from stars.npy when available
+FORMAT_VERSION = 1
+
+STAR_DTYPE = np.dtype([
+    ("ra",    np.float32),   # RA in degrees (J2000)
+    ("dec",   np.float32),   # Dec in degrees (J2000)
+    ("mag",   np.float32),   # Apparent magnitude
+    ("ci",    np.float32),   # B-V color index (star color)
+    ("name",  "S20"),        # Proper name, ASCII, up to 20 chars (empty if unnamed)
+    ("spect", "S8"),         # Spectral type, ASCII, up to 8 chars
+])
+
+# Optional render-ready columns (convert_hyg.py --precompute) so the dome derives nothing at load time
+RENDER_FIELDS = [
+    ("unit", np.float32, (3,)),   # J2000 unit vector
+    ("rgb",  np.float32, (3,)),   # colour from ci_to_rgb
+    ("size", np.float32),         # point size from mag_to_size
+]
+RENDER_DTYPE = np.dtype(STAR_DTYPE.descr + RENDER_FIELDS)
+
+# Tiles: 10° declination bands, each cut into RA cells of roughly equal area (fewer toward the poles)
+TILE_DEG = 10.0
+
+# Per-tile row offsets are stored at these magnitudes; queries between levels bisect the mag column
+MAG_LEVELS = np.arange(-2.0, 21.0, 0.5)
+
+
+ #=========#
+# RENDERING #
+ #=========#
+
+# B-V colour index → RGB as a piecewise-linear ramp (blue-white → white → orange → red), clamped to [-0.4, 2.0]
+_CI_KNOTS = np.array([-0.4, 0.0, 0.58, 1.0, 2.0])
+_CI_RGB   = np.array([
+    [0.55, 0.70, 1.00],
+    [1.00, 1.00, 1.00],
+    [1.00, 1.00, 0.95],
+    [1.00, 0.75, 0.50],
+    [1.00, 0.10, 0.00],
+])
+
+
+# Vectorized over a catalog column; missing indices fall back to a solar-type 0.6
+def ci_to_rgb(ci: np.ndarray) -> np.ndarray:
+    ci = np.asarray(ci, dtype=np.float64)
+    ci = np.where(np.isfinite(ci), ci, 0.6)
+    return np.stack([np.interp(ci, _CI_KNOTS, _CI_RGB[:, k]) for k in range(3)], axis=-1).astype(np.float32)
+
+
+# Point size in pixels for an apparent magnitude (arrays or scalars)
+def mag_to_size(mag):
+    return np.maximum(1.0, (7.5 - np.asarray(mag, dtype=np.float32)) * 1.6)
+
+
+# Fill the RENDER_FIELDS of rows in place from their catalog columns
+def fill_render_fields(rows: np.ndarray) -> None:
+    rows["unit"] = radec_to_unit(rows["ra"], rows["dec"])
+    rows["rgb"]  = ci_to_rgb(rows["ci"])
+    rows["size"] = mag_to_size(rows["mag"])
+
+
+ #=====#
+# TILES #
+ #=====#
+
+# RA cells per declination band, and the first tile id of each band (last entry = tile count)
+@lru_cache(maxsize=1)
+def _bands() -> tuple[np.ndarray, np.ndarray]:
+    n     = int(round(180.0 / TILE_DEG))
+    mid   = -90.0 + (np.arange(n) + 0.5) * TILE_DEG
+    cells = np.maximum(1, np.round(360.0 / TILE_DEG * np.cos(np.radians(mid)))).astype(np.int64)
+    first = np.concatenate([[0], np.cumsum(cells)])
+    return cells, first
+
+
+def n_tiles() -> int:
+    return int(_bands()[1][-1])
+
+
+# Tile id per star (RA/Dec degrees)
+def tile_ids(ra_deg: np.ndarray, dec_deg: np.ndarray) -> np.ndarray:
+    cells, first = _bands()
+    band = np.clip(((np.asarray(dec_deg, dtype=np.float64) + 90.0) // TILE_DEG).astype(np.int64), 0, len(cells) - 1)
+    n    = cells[band]
+    cell = np.minimum((np.mod(np.asarray(ra_deg, dtype=np.float64), 360.0) / 360.0 * n).astype(np.int64), n - 1)
+    return first[band] + cell
+
+
+# Tile centres as unit vectors and the angular radius (degrees) of a cap that covers each tile
+def tile_caps() -> tuple[np.ndarray, np.ndarray]:
+    cells, first = _bands()
+    band  = np.repeat(np.arange(len(cells)), cells)
+    cell  = np.arange(first[-1]) - first[band]
+    width = 360.0 / cells[band]
+
+    # Sample each tile's outline and interior on a 5×5 grid; the cap radius is the farthest sample
+    f       = np.linspace(0.0, 1.0, 5)
+    shape   = (len(cell), len(f), len(f))
+    ra      = np.broadcast_to(((cell[:, None] + f) * width[:, None])[:, :, None], shape)
+    dec     = np.broadcast_to((-90.0 + (band[:, None] + f) * TILE_DEG)[:, None, :], shape)
+    samples = radec_to_unit(ra, dec)
+    center  = radec_to_unit((cell + 0.5) * width, -90.0 + (band + 0.5) * TILE_DEG)
+    cos_d   = np.einsum("tijk,tk->tij", samples, center)
+    radius  = np.degrees(np.arccos(np.clip(cos_d.min(axis=(1, 2)), -1.0, 1.0)))
+    return center, radius
+
+
+ #=====#
+# BUILD #
+ #=====#
+
+# Row offsets for rows already sorted by (tile, mag): starts per tile and the first row fainter than each level
+def build_index(tiles: np.ndarray, mags: np.ndarray) -> np.ndarray:
+    count  = n_tiles()
+    starts = np.searchsorted(tiles, np.arange(count + 1))
+    cuts   = np.empty((count, len(MAG_LEVELS)), dtype=np.int64)
+    for t in range(count):
+        lo, hi   = starts[t], starts[t + 1]
+        cuts[t]  = lo + np.searchsorted(mags[lo:hi], MAG_LEVELS, side="right")
+
+    center, radius = tile_caps()
+    dtype = np.dtype([
+        ("version",    np.int32),
+        ("tile_deg",   np.float64),
+        ("rows",       np.int64),
+        ("starts",     np.int64,   (count + 1,)),
+        ("mag_levels", np.float64, (len(MAG_LEVELS),)),
+        ("cuts",       np.int64,   cuts.shape),
+        ("center",     np.float64, center.shape),
+        ("radius",     np.float64, radius.shape),
+    ])
+    index = np.zeros(1, dtype=dtype)
+    index["version"]    = FORMAT_VERSION
+    index["tile_deg"]   = TILE_DEG
+    index["rows"]       = len(tiles)
+    index["starts"]     = starts
+    index["mag_levels"] = MAG_LEVELS
+    index["cuts"]       = cuts
+    index["center"]     = center
+    index["radius"]     = radius
+    return index
+
+
+# Sort a flat catalog into the tiled layout; returns (rows, index record)
+def build_tiled_catalog(stars: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    tiles = tile_ids(stars["ra"], stars["dec"])
+    order = np.lexsort((stars["mag"], tiles))
+    rows  = np.asarray(stars)[order]
+    return rows, build_index(tiles[order], rows["mag"])
+
+
+def write_tiled_catalog(data_dir: Path, rows: np.ndarray, index: np.ndarray) -> None:
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    np.save(data_dir / TILED_NAME, rows)
+    np.save(data_dir / INDEX_NAME, index)
+
+
+ #======#
+# LOADER #
+ #======#
+
+class StarCatalog:
+    # Rows stay memory-mapped; only the slices a caller asks for are paged in
+
+    def __init__(self, rows: np.ndarray, index: np.ndarray):
+        self.rows        = rows
+        self.precomputed = rows.dtype.names is not None and "unit" in rows.dtype.names
+        self.starts      = index["starts"][0]
+        self.mag_levels  = index["mag_levels"][0]
+        self.cuts        = index["cuts"][0]
+        self.center      = index["center"][0]
+        self.radius      = index["radius"][0]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def n_tiles(self) -> int:
+        return len(self.starts) - 1
+
+    # End row (exclusive) of tile t's stars at or brighter than mag; the tile's rows start at starts[t]
+    def stop(self, tile: int, mag: float) -> int:
+        k  = int(np.searchsorted(self.mag_levels, mag, side="right")) - 1
+        lo = int(self.starts[tile]) if k < 0 else int(self.cuts[tile, k])
+        hi = int(self.cuts[tile, k + 1]) if k + 1 < len(self.mag_levels) else int(self.starts[tile + 1])
+        return lo + int(np.searchsorted(self.rows["mag"][lo:hi], mag, side="right"))
+
+    # Rows of a tile with mag_from < mag <= mag_to (a copy, safe to hand to another thread)
+    def slice(self, tile: int, mag_from: float, mag_to: float) -> tuple[int, np.ndarray]:
+        lo = int(self.starts[tile]) if mag_from == -np.inf else self.stop(tile, mag_from)
+        hi = self.stop(tile, mag_to)
+        return lo, np.array(self.rows[lo:max(lo, hi)])
+
+
+# Open the tiled catalog in data_dir, tiling a flat stars.npy on first use (written back when possible)
+@lru_cache(maxsize=4)
+def open_star_catalog(data_dir: str = str(_DATA_DIR)) -> Optional[StarCatalog]:
+    d = Path(data_dir)
+    if (d / TILED_NAME).exists() and (d / INDEX_NAME).exists():
+        rows  = np.load(d / TILED_NAME, mmap_mode="r")
+        index = np.load(d / INDEX_NAME)
+        if int(index["version"][0]) == FORMAT_VERSION and int(index["rows"][0]) == len(rows):
+            return StarCatalog(rows, index)
+        logging.warning("%s is stale — re-run scripts/convert_hyg.py", INDEX_NAME)
+
+    if not (d / FLAT_NAME).exists():
+        return None
+
+    logging.info("tiling %s (one-time)", d / FLAT_NAME)
+    rows, index = build_tiled_catalog(np.load(d / FLAT_NAME, mmap_mode="r"))
+    try:
+        write_tiled_catalog(d, rows, index)
+    except OSError as e:
+        logging.warning("could not write tiled catalog to %s: %s", d, e)
+        return StarCatalog(rows, index)
+    return StarCatalog(np.load(d / TILED_NAME, mmap_mode="r"), index)
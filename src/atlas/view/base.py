@@ -4,7 +4,12 @@
 # Standard Modules
 import os
 import math
-from typing import Optional
+import json
+import hashlib
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 # Standard Modules (continued)
 import logging
@@ -25,6 +30,11 @@ _SYMBOL_FONT = os.path.join(_STATIC_DIR, 'fonts/NotoSansSymbols-Regular.ttf')
 ATLAS_SIZE   = 512
 GLYPH_CELL   = 48
 
+# Rasterised glyph atlases (PNG + UV map) keyed by font hash, character set, cell size and mode
+_GLYPH_CACHE_DIR     = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'atlas' / 'glyphs'
+_GLYPH_CACHE_VERSION = 1
+_SDF_SUPERSAMPLE     = 2   # distance field computed at 2× and box-filtered down
+
 SYMBOL_CHARS = "♈♉♊♋♌♍♎♏♐♑♒♓☉☽☿♀♂♃♄♅♆⯓⚸⚷⯛⚳⚴⚵⚶"
 TEXT_CHARS   = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz℞°. "
 
@@ -47,13 +57,14 @@ def _strip_var_selector(ch: str) -> str:
     return ch.replace('︎', '').replace('️', '')
 
 
+# Orthographic projection, transposed so .tobytes() yields the column-major layout GLSL expects
 def _ortho(l: float, r: float, b: float, t: float) -> np.ndarray:
     return np.array([
         [2/(r-l), 0,       0, -(r+l)/(r-l)],
         [0,       2/(t-b), 0, -(t+b)/(t-b)],
         [0,       0,      -1,  0           ],
         [0,       0,       0,  1           ],
-    ], dtype='f4')
+    ], dtype='f4').T
 
 
 def _circle_verts(radius: float, segments: int = 180) -> np.ndarray:
@@ -65,50 +76,191 @@ def _circle_verts(radius: float, segments: int = 180) -> np.ndarray:
     return pairs
 
 
-class GlyphAtlas:
-    def __init__(self, ctx: moderngl.Context, font_path: str, chars: str, cell_size: int = GLYPH_CELL):
-        self.uv_map: dict[str, tuple[float, float, float, float]] = {}
-        cols    = ATLAS_SIZE // cell_size
-        rows    = math.ceil(len(chars) / cols)
-        atlas_h = max(rows * cell_size, 1)
+# Signed distance to the glyph outline, spread pixels each way, as alpha: 0.5 on the edge, 1 deep inside, 0 far outside.
+# Brute force over the (2·spread + 1)² neighbourhood — fine for a one-off rasterisation that then lives on disk.
+def _sdf_alpha(alpha: np.ndarray, spread: int) -> np.ndarray:
+    inside = alpha >= 128
+    h, w   = inside.shape
+    padded = np.pad(inside, spread, mode='edge')
+    d_in   = np.full((h, w), float(spread))   # inside pixel → nearest outside pixel
+    d_out  = np.full((h, w), float(spread))   # outside pixel → nearest inside pixel
+    for dy in range(-spread, spread + 1):
+        for dx in range(-spread, spread + 1):
+            d = math.hypot(dx, dy)
+            if d == 0 or d > spread:
+                continue
+            nb = padded[spread + dy:spread + dy + h, spread + dx:spread + dx + w]
+            np.minimum(d_in,  np.where(inside & ~nb, d, spread), out=d_in)
+            np.minimum(d_out, np.where(~inside & nb, d, spread), out=d_out)
+    signed = np.where(inside, d_in - 0.5, 0.5 - d_out)
+    return np.clip(0.5 + signed / (2 * spread), 0.0, 1.0)
+
+
+# Draw each character centred in its own cell; returns the RGBA bitmap (rows top-down) and cell UVs (v from the top)
+def _rasterize_glyphs(font_path: str, chars: str, cell_size: int, sdf: bool) -> tuple[Image.Image, dict]:
+    scale   = _SDF_SUPERSAMPLE if sdf else 1
+    cell    = cell_size * scale
+    cols    = ATLAS_SIZE // cell_size
+    rows    = math.ceil(len(chars) / cols)
+    atlas_h = max(rows * cell_size, 1)
+
+    img  = Image.new("RGBA", (ATLAS_SIZE * scale, atlas_h * scale), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    try:
+        font = ImageFont.truetype(font_path, size=cell - 8 * scale)
+    except Exception:
+        logging.warning("glyph atlas: font not found at %s, using default", font_path)
+        font = ImageFont.load_default()
+
+    uv_map: dict[str, tuple[float, float, float, float]] = {}
+    for i, ch in enumerate(chars):
+        col = i % cols
+        row = i // cols
+        px  = col * cell + cell // 2
+        py  = row * cell + cell // 2
+        draw.text((px, py), ch, font=font, fill=(255, 255, 255, 255), anchor="mm")
+        u0 = (col * cell_size)       / ATLAS_SIZE
+        v0 = (row * cell_size)       / atlas_h
+        u1 = ((col + 1) * cell_size) / ATLAS_SIZE
+        v1 = ((row + 1) * cell_size) / atlas_h
+        uv_map[ch] = (u0, v0, u1, v1)
+
+    if sdf:
+        dist  = _sdf_alpha(np.asarray(img)[:, :, 3], spread=cell_size // 12 * scale)
+        dist  = dist.reshape(atlas_h, scale, ATLAS_SIZE, scale).mean(axis=(1, 3))
+        rgba  = np.full((atlas_h, ATLAS_SIZE, 4), 255, dtype=np.uint8)
+        rgba[:, :, 3] = np.round(dist * 255)
+        img   = Image.fromarray(rgba, "RGBA")
+    return img, uv_map
+
+
+@lru_cache(maxsize=None)
+def _font_digest(font_path: str) -> str:
+    try:
+        with open(font_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return 'default'
+
+
+# Atlas bitmap + UV map from the disk cache, rasterising (and storing) on a miss; cache I/O errors only cost speed
+def _load_glyph_bitmap(font_path: str, chars: str, cell_size: int, sdf: bool) -> tuple[Image.Image, dict]:
+    key  = json.dumps([_GLYPH_CACHE_VERSION, _font_digest(font_path), chars, cell_size, ATLAS_SIZE, sdf])
+    stem = _GLYPH_CACHE_DIR / hashlib.sha256(key.encode()).hexdigest()[:24]
+    try:
+        with Image.open(f"{stem}.png") as cached:
+            img = cached.convert("RGBA")
+        with open(f"{stem}.json", encoding='utf-8') as f:
+            uv_map = {ch: tuple(uv) for ch, uv in json.load(f).items()}
+        return img, uv_map
+    except (OSError, ValueError):
+        pass
+
+    img, uv_map = _rasterize_glyphs(font_path, chars, cell_size, sdf)
+    try:
+        _GLYPH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for suffix, write in (('.json', lambda f: f.write(json.dumps(uv_map).encode('utf-8'))),
+                              ('.png',  lambda f: img.save(f, format='PNG'))):
+            # Write-then-rename through a uniquely named temp file: concurrent processes and threads never
+            # share a temp path, and readers never see half a file
+            with tempfile.NamedTemporaryFile(dir=_GLYPH_CACHE_DIR, prefix=f"{stem.name}.", suffix='.tmp', delete=False) as f:
+                tmp = f.name
+                try:
+                    write(f)
+                except BaseException:
+                    f.close()
+                    os.unlink(tmp)
+                    raise
+            os.replace(tmp, f"{stem}{suffix}")
+    except OSError as e:
+        logging.debug("glyph atlas: not cached (%s)", e)
+    return img, uv_map
 
-        img  = Image.new("RGBA", (ATLAS_SIZE, atlas_h), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
 
-        try:
-            font = ImageFont.truetype(font_path, size=cell_size - 8)
-        except Exception:
-            logging.warning("glyph atlas: font not found at %s, using default", font_path)
-            font = ImageFont.load_default()
-
-        for i, ch in enumerate(chars):
-            col = i % cols
-            row = i // cols
-            px  = col * cell_size + cell_size // 2
-            py  = row * cell_size + cell_size // 2
-            draw.text((px, py), ch, font=font, fill=(255, 255, 255, 255), anchor="mm")
-            u0 = (col * cell_size)       / ATLAS_SIZE
-            v0 = (row * cell_size)       / atlas_h
-            u1 = ((col + 1) * cell_size) / ATLAS_SIZE
-            v1 = ((row + 1) * cell_size) / atlas_h
-            self.uv_map[ch] = (u0, v0, u1, v1)
+class GlyphAtlas:
+    # Characters in one RGBA texture, uv_map giving each one's cell. With sdf=True the alpha channel holds a
+    # signed distance field (edge at 0.5), so one rasterisation stays sharp at every drawn size.
 
-        img = img.transpose(Image.FLIP_TOP_BOTTOM)  # type: ignore
-        for ch in self.uv_map:
-            u0, v0, u1, v1 = self.uv_map[ch]
-            self.uv_map[ch] = (u0, 1.0 - v1, u1, 1.0 - v0)
+    def __init__(self, ctx: moderngl.Context, font_path: str, chars: str, cell_size: int = GLYPH_CELL, sdf: bool = False):
+        self.sdf = sdf
+        img, uv  = _load_glyph_bitmap(font_path, chars, cell_size, sdf)
 
-        self.texture = ctx.texture((ATLAS_SIZE, atlas_h), 4, img.tobytes())
+        # GL textures start at the bottom row
+        img = img.transpose(Image.FLIP_TOP_BOTTOM)  # type: ignore
+        self.uv_map: dict[str, tuple[float, float, float, float]] = {
+            ch: (u0, 1.0 - v1, u1, 1.0 - v0) for ch, (u0, v0, u1, v1) in uv.items()
+        }
+        self.texture = ctx.texture(img.size, 4, img.tobytes())
         self.texture.filter = (moderngl.LINEAR, moderngl.LINEAR)
 
 
+# Per-context store for GL objects every view on that context can share (compiled programs, glyph atlases),
+# kept in ctx.extra as moderngl_window does for its default programs
+def _context_shared(ctx: moderngl.Context, key: tuple, make: Callable[[], Any]) -> Any:
+    if ctx.extra is None:
+        ctx.extra = {}
+    shared = ctx.extra.setdefault('atlas', {})
+    if key not in shared:
+        shared[key] = make()
+    return shared[key]
+
+
+@lru_cache(maxsize=None)
+def _shader_source(filename: str) -> str:
+    with open(os.path.join(_SHADER_DIR, filename)) as f:
+        return f.read()
+
+
+class InstanceBuffer:
+    # Instanced geometry: every item is one row of floats (fmt, per instance) in a preallocated array, drawn as an
+    # instance of a small shared shape (a unit quad for glyphs, a unit segment for lines). Adding an item is a row
+    # assignment; upload orphans the GPU buffer so the driver never waits on a draw still reading it. Both the
+    # array and the buffer only grow (doubling), so steady-state frames allocate nothing.
+
+    def __init__(self, ctx: moderngl.Context, prog: moderngl.Program, shape: moderngl.Buffer, shape_attr: str,
+                 fmt: str, *attrs: str, capacity: int = 256):
+        width        = sum(int(f[:-1] or 1) for f in fmt.split())
+        self.rows    = np.zeros((capacity, width), dtype='f4')
+        self.count   = 0
+        self.vbo     = ctx.buffer(reserve=capacity * width * 4, dynamic=True)
+        self.vao     = ctx.vertex_array(prog, [(shape, '2f', shape_attr), (self.vbo, f'{fmt}/i', *attrs)])
+        self._n_verts = shape.size // 8
+
+    def append(self, *values: float) -> None:
+        if self.count == len(self.rows):
+            self.rows = np.concatenate((self.rows, np.zeros_like(self.rows)))
+        self.rows[self.count] = values
+        self.count += 1
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def upload(self) -> None:
+        data = self.rows[:self.count]
+        size = data.nbytes
+        self.vbo.orphan(max(size, 2 * self.vbo.size) if size > self.vbo.size else -1)
+        if size:
+            self.vbo.write(data)
+
+    def render(self, mode: int) -> None:
+        if self.count:
+            self.vao.render(mode, vertices=self._n_verts, instances=self.count)
+
+
+# Shared instance shapes, (x, y) per vertex: unit quad as a triangle strip, unit segment as a line
+_UNIT_QUAD    = np.array([[0, 0], [1, 0], [0, 1], [1, 1]], dtype='f4')
+_UNIT_SEGMENT = np.array([[0, 0], [1, 0]], dtype='f4')
+
+
 class BaseGLWindow(moderngl_window.WindowConfig):  # type: ignore
     gl_version   = (3, 3)
     window_size  = (900, 900)
     aspect_ratio = 1.0
     resizable    = True
 
-    _TEXT_SPACING: float = 0.50  # override in subclasses
+    _TEXT_SPACING: float = 0.50   # override in subclasses
+    GLYPH_SDF:     bool  = False  # distance-field glyph atlases: crisp at any size, softer small text
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -119,13 +271,13 @@ class BaseGLWindow(moderngl_window.WindowConfig):  # type: ignore
         self._glyph_prog = self._load_program('glyph')
         self._line_prog  = self._load_program('line')
 
-        self._sym_atlas = GlyphAtlas(self.ctx, _SYMBOL_FONT, SYMBOL_CHARS)
-        self._txt_atlas = GlyphAtlas(self.ctx, _FONT_PATH,   TEXT_CHARS)
+        self._sym_atlas = self._glyph_atlas(_SYMBOL_FONT, SYMBOL_CHARS)
+        self._txt_atlas = self._glyph_atlas(_FONT_PATH,   TEXT_CHARS)
 
-        self._sym_quads:     list[np.ndarray]             = []
-        self._txt_quads:     list[np.ndarray]             = []
-        self._sym_glyph_vao: Optional[moderngl.VertexArray] = None
-        self._txt_glyph_vao: Optional[moderngl.VertexArray] = None
+        # One instance per glyph: centre, size, atlas UV rect, colour
+        self._unit_quad   = self.ctx.buffer(_UNIT_QUAD.tobytes())
+        self._sym_glyphs  = self._glyph_instances()
+        self._txt_glyphs  = self._glyph_instances()
 
         self._save_path: Optional[str] = None
         self._save_done: bool          = False
@@ -136,17 +288,33 @@ class BaseGLWindow(moderngl_window.WindowConfig):  # type: ignore
         y    = (height - side) // 2
         self.ctx.viewport = (x, y, side, side)
 
-    def _load_program(self, name: str) -> moderngl.Program:
-        vert = open(os.path.join(_SHADER_DIR, f'{name}.vert')).read()
-        frag = open(os.path.join(_SHADER_DIR, f'{name}.frag')).read()
-        return self.ctx.program(vertex_shader=vert, fragment_shader=frag)
+    # Vertex + fragment pair from shaders/; frag names a fragment shader shared with another program.
+    # Compiled once per context and shared by every view on it, so uniforms that differ between views
+    # (projection, alphas) must be restated before drawing — see _bind_uniforms.
+    def _load_program(self, name: str, frag: Optional[str] = None) -> moderngl.Program:
+        frag = frag or name
+        return _context_shared(self.ctx, ('program', name, frag), lambda: self.ctx.program(
+            vertex_shader=_shader_source(f'{name}.vert'), fragment_shader=_shader_source(f'{frag}.frag'),
+        ))
+
+    def _glyph_atlas(self, font_path: str, chars: str) -> GlyphAtlas:
+        return _context_shared(self.ctx, ('glyphs', font_path, chars, GLYPH_CELL, self.GLYPH_SDF),
+                               lambda: GlyphAtlas(self.ctx, font_path, chars, GLYPH_CELL, self.GLYPH_SDF))
+
+    # Write this view's per-view uniforms into the shared programs; called at the start of each frame
+    def _bind_uniforms(self) -> None:
+        pass
+
+    def _glyph_instances(self) -> InstanceBuffer:
+        return InstanceBuffer(self.ctx, self._glyph_prog, self._unit_quad, 'in_corner',
+                              '2f 1f 4f 4f', 'in_center', 'in_size', 'in_uv_rect', 'in_color')
 
     def _add_glyph(self, ch: str, x: float, y: float, size: float, color: _RGBA) -> None:
         ch = _strip_var_selector(ch)
         if ch in self._sym_atlas.uv_map:
-            self._sym_quads.append(_glyph_quad(x, y, size, self._sym_atlas.uv_map[ch], color))
+            self._sym_glyphs.append(x, y, size, *self._sym_atlas.uv_map[ch], *color)
         elif ch in self._txt_atlas.uv_map:
-            self._txt_quads.append(_glyph_quad(x, y, size, self._txt_atlas.uv_map[ch], color))
+            self._txt_glyphs.append(x, y, size, *self._txt_atlas.uv_map[ch], *color)
 
     def _add_text(self, text: str, x: float, y: float, size: float, color: _RGBA) -> None:
         spacing = size * self._TEXT_SPACING
@@ -156,25 +324,20 @@ class BaseGLWindow(moderngl_window.WindowConfig):  # type: ignore
             self._add_glyph(ch, start_x + i * spacing, y, size, color)
 
     def _reset_glyphs(self) -> None:
-        for vao in (self._sym_glyph_vao, self._txt_glyph_vao):
-            if vao:
-                vao.release()
-        self._sym_glyph_vao = None
-        self._txt_glyph_vao = None
-        self._sym_quads     = []
-        self._txt_quads     = []
+        self._sym_glyphs.clear()
+        self._txt_glyphs.clear()
 
     def _upload_glyphs(self) -> None:
-        def _build(quads: list) -> Optional[moderngl.VertexArray]:
-            if not quads:
-                return None
-            data = np.vstack(quads).astype('f4')
-            vbo  = self.ctx.buffer(data.tobytes())
-            return self.ctx.vertex_array(
-                self._glyph_prog, [(vbo, '2f 2f 4f', 'in_pos', 'in_uv', 'in_color')]
-            )
-        self._sym_glyph_vao = _build(self._sym_quads)
-        self._txt_glyph_vao = _build(self._txt_quads)
+        self._sym_glyphs.upload()
+        self._txt_glyphs.upload()
+
+    def _render_glyphs(self) -> None:
+        self._glyph_prog['tex'] = 0  # type: ignore
+        for buf, atlas in ((self._sym_glyphs, self._sym_atlas), (self._txt_glyphs, self._txt_atlas)):
+            if buf.count:
+                self._glyph_prog['u_sdf'] = atlas.sdf  # type: ignore
+                atlas.texture.use(location=0)
+                buf.render(moderngl.TRIANGLE_STRIP)
 
     def _save_screenshot(self, path: str) -> None:
         x, y, w, h = self.ctx.viewport
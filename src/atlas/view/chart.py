@@ -4,9 +4,13 @@ from typing import Any, Optional
 from dataclasses import dataclass
 
 # Internal Modules
+from atlas.core.timeline import Timeline
+from atlas.models.aspect import ASPECT_DEFS, angular_diff, build_aspects
+from atlas.utils.interpolate import AngleHermite
 from atlas.view.base import (
-    BaseGLWindow, GlyphAtlas, _RGBA, _ortho, _circle_verts, _glyph_quad, _strip_var_selector,
+    BaseGLWindow, GlyphAtlas, InstanceBuffer, _RGBA, _UNIT_SEGMENT, _ortho, _circle_verts, _glyph_quad, _strip_var_selector,
 )
+from atlas.view.video import FrameReader, ScreenRecorder, VideoWriter
 
 # External Modules
 import moderngl
@@ -60,11 +64,43 @@ ASPECT_WEIGHTS: dict[str, str] = {
 # GEOMETRY #
 #----------#
 
-def _line_verts(angle: float, r1: float, r2: float) -> np.ndarray:
-    return np.array([
-        [r1 * math.cos(angle), r1 * math.sin(angle)],
-        [r2 * math.cos(angle), r2 * math.sin(angle)],
-    ], dtype='f4')
+# Ecliptic speed in degrees/day, NaN when the ephemeris gave none (interpolation then falls back to linear)
+def _rate(cel: Any) -> float:
+    return cel.dlon if cel.dlon is not None else math.nan
+
+
+_ASPECT_ORBS: dict[str, tuple[float, float]] = {name: (angle, orb) for angle, name, orb in ASPECT_DEFS}
+
+
+# Whether an aspect is still within its orb at its bodies' current longitudes
+def _in_orb(aspect: Any) -> bool:
+    angle, orb = _ASPECT_ORBS[aspect.name]
+    return abs(angular_diff(aspect.body_one.lon, aspect.body_two.lon) - angle) <= orb
+
+
+# Radial segments from r1 to r2 at each angle, as (2n, 6) line vertices
+def _tick_verts(angles: np.ndarray, r1: float, r2: float, color: _RGBA) -> np.ndarray:
+    cos, sin = np.cos(angles), np.sin(angles)
+    out = np.empty((2 * len(angles), 6), dtype='f4')
+    out[0::2, 0], out[0::2, 1] = r1 * cos, r1 * sin
+    out[1::2, 0], out[1::2, 1] = r2 * cos, r2 * sin
+    out[:, 2:] = color
+    return out
+
+
+def _ring_verts(radius: float, color: _RGBA) -> np.ndarray:
+    pairs = _circle_verts(radius)
+    out   = np.empty((len(pairs), 6), dtype='f4')
+    out[:, :2] = pairs
+    out[:, 2:] = color
+    return out
+
+
+# Column-major proj · R(angle) for the line shader: rotates the static skeleton in place of rebuilding it
+def _rotated_proj(proj: np.ndarray, angle: float) -> np.ndarray:
+    c, s = math.cos(angle), math.sin(angle)
+    rot  = np.array([[c, -s, 0, 0], [s, c, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], dtype='f4')
+    return (rot.T @ proj).astype('f4')   # proj is already transposed: (P·R)ᵀ = Rᵀ·Pᵀ
 
 
 #------------------#
@@ -78,38 +114,91 @@ class _LabelNode:
     data:     Any
 
 
-def _resolve_collisions(nodes: list[_LabelNode], tolerance: float = 5.0, max_iters: int = 10000) -> list[_LabelNode]:
-    for n in nodes:
-        n.chart_lon = n.lon
-
-    for _ in range(max_iters):
-        nodes.sort(key=lambda n: n.chart_lon)
-        moved = False
-
-        for i in range(len(nodes) - 1):
-            a, b = nodes[i], nodes[i + 1]
-            diff = (b.chart_lon - a.chart_lon) % 360
-            if diff > 180:
-                diff = 360 - diff
-            if diff < tolerance:
-                adj = (tolerance - diff) / 2
-                a.chart_lon = (a.chart_lon - adj) % 360
-                b.chart_lon = (b.chart_lon + adj) % 360
-                moved = True
-
-        first, last = nodes[0], nodes[-1]
-        wrap = (first.chart_lon - last.chart_lon) % 360
-        if wrap > 180:
-            wrap = 360 - wrap
-        if wrap < tolerance:
-            adj = (tolerance - wrap) / 2
-            first.chart_lon = (first.chart_lon + adj) % 360
-            last.chart_lon  = (last.chart_lon  - adj) % 360
-            moved = True
-
-        if not moved:
-            break
-
+# Spread labels at least `tolerance` degrees apart, each cluster of crowded bodies fanned out evenly around the
+# mean of its longitudes. Returns label longitudes in input order, plus the sort order and cluster ids reused
+# by _LabelLayout. Clusters that overlap once spread are merged and re-spread until every gap holds.
+def _spread_labels(lons: np.ndarray, tolerance: float = 5.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    n = len(lons)
+    if n == 0:
+        return np.empty(0), np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    tol = min(tolerance, 360.0 / n)
+
+    # Unwrap the circle at its widest gap, so the cut falls between two clusters
+    order = np.argsort(lons, kind='stable')
+    x     = lons[order]
+    gaps  = np.diff(x, append=x[0] + 360.0)
+    cut   = (int(np.argmax(gaps)) + 1) % n
+    order = np.roll(order, -cut)
+    x     = np.roll(x, -cut)
+    if cut:
+        x[n - cut:] += 360.0
+
+    cid = np.concatenate(([0], np.cumsum(np.diff(x) >= tol)))
+    while True:
+        pos   = _cluster_layout(x, cid, tol)
+        bound = np.diff(cid) > 0
+        clash = bound & (np.diff(pos) < tol - 1e-9)
+        if clash.any():
+            cid = np.concatenate(([0], np.cumsum(bound & ~clash)))
+            continue
+        if cid[-1] > 0 and pos[0] + 360.0 - pos[-1] < tol - 1e-9:
+            # First and last cluster touch across the cut: carry the first to the end and merge
+            k     = int(np.count_nonzero(cid == 0))
+            order = np.roll(order, -k)
+            x     = np.concatenate((x[k:], x[:k] + 360.0))
+            cid   = np.concatenate((cid[k:] - 1, np.full(k, cid[-1] - 1)))
+            continue
+        break
+
+    out = np.empty(n)
+    out[order] = pos % 360.0
+    return out, order, cid
+
+
+# Closed-form spread: cluster members tol apart, centred on their mean longitude (x sorted, unwrapped)
+def _cluster_layout(x: np.ndarray, cid: np.ndarray, tol: float) -> np.ndarray:
+    counts = np.bincount(cid)
+    center = np.bincount(cid, weights=x) / counts
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank   = np.arange(len(x)) - starts[cid]
+    return center[cid] + (rank - (counts[cid] - 1) / 2.0) * tol
+
+
+class _LabelLayout:
+    # One label ring's layout kept across frames. While no body has moved more than REUSE_DEG since the last
+    # full solve, the cached order and clusters are re-spread around the new longitudes in closed form.
+
+    REUSE_DEG: float = 0.05
+
+    def __init__(self, tolerance: float = 5.0):
+        self.tolerance = tolerance
+        self._lons:  Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None
+        self._cid:   Optional[np.ndarray] = None
+
+    def solve(self, lons: np.ndarray) -> np.ndarray:
+        n = len(lons)
+        if self._lons is not None and len(self._lons) == n and n:
+            drift = np.abs((lons - self._lons + 180.0) % 360.0 - 180.0)
+            if drift.max() <= self.REUSE_DEG:
+                order, cid = self._order, self._cid
+                x   = np.unwrap(lons[order], period=360.0)
+                out = np.empty(n)
+                out[order] = _cluster_layout(x, cid, min(self.tolerance, 360.0 / n)) % 360.0  # type: ignore
+                return out
+
+        out, self._order, self._cid = _spread_labels(lons, self.tolerance)
+        self._lons = lons.copy()
+        return out
+
+
+# Set node.chart_lon to each node's de-collided label position (nodes keep their order)
+def _resolve_collisions(nodes: list[_LabelNode], tolerance: float = 5.0,
+                        layout: Optional[_LabelLayout] = None) -> list[_LabelNode]:
+    lons = np.array([n.lon for n in nodes], dtype=float)
+    out  = layout.solve(lons) if layout is not None else _spread_labels(lons, tolerance)[0]
+    for node, x in zip(nodes, out.tolist()):
+        node.chart_lon = x
     return nodes
 
 
@@ -123,105 +212,97 @@ class Chart(BaseGLWindow):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        v    = self.VIEWPORT
-        proj = _ortho(-v, v, -v, v)
-        self._line_prog['proj'].write(proj.tobytes())   # type: ignore
-        self._line_prog['u_line_alpha'] = 1.0           # type: ignore
-        self._glyph_prog['proj'].write(proj.tobytes())  # type: ignore
+        v          = self.VIEWPORT
+        self._proj = _ortho(-v, v, -v, v)
+        self._segment_prog = self._load_program('segment', frag='line')
+        self._bind_uniforms()
+
+        # Static skeleton (rings, ticks, sign boundaries): uploaded once in ecliptic orientation and drawn
+        # rotated by -_base_rad, so moving the ascendant costs one uniform write instead of a rebuild
+        self._base_rad = 0.0
+        self._skeleton_pts: list[np.ndarray]              = []
+        self._skeleton_vao: Optional[moderngl.VertexArray] = None
+        self._skeleton_n    = 0
 
-        self._line_pts:     list[list[float]] = []
-        self._asp_hard_pts: list[list[float]] = []
-        self._asp_med_pts:  list[list[float]] = []
+        # Moving parts (cusps, planet ticks, aspects, labels) are one instance each: endpoints + colour per segment
+        self._unit_segment = self.ctx.buffer(_UNIT_SEGMENT.tobytes())
+        self._lines        = self._segment_instances()
+        self._asp_hard     = self._segment_instances()
+        self._asp_med      = self._segment_instances()
 
-        self._line_vao:     Optional[moderngl.VertexArray] = None
-        self._asp_hard_vao: Optional[moderngl.VertexArray] = None
-        self._asp_med_vao:  Optional[moderngl.VertexArray] = None
+    def _segment_instances(self) -> InstanceBuffer:
+        return InstanceBuffer(self.ctx, self._segment_prog, self._unit_segment, 'in_end', '4f 4f', 'in_points', 'in_color')
 
     def _add_line(self, angle: float, r1: float, r2: float, color: _RGBA) -> None:
-        v = _line_verts(angle, r1, r2)
-        r, g, b, a = color
-        self._line_pts.append([float(v[0][0]), float(v[0][1]), r, g, b, a])
-        self._line_pts.append([float(v[1][0]), float(v[1][1]), r, g, b, a])
+        c, s = math.cos(angle), math.sin(angle)
+        self._lines.append(r1 * c, r1 * s, r2 * c, r2 * s, *color)
 
     def _add_segment(self, x1: float, y1: float, x2: float, y2: float, color: _RGBA, weight: str = 'soft') -> None:
-        r, g, b, a = color
-        pt1 = [x1, y1, r, g, b, a]
-        pt2 = [x2, y2, r, g, b, a]
         match weight:
-            case 'hard':
-                self._asp_hard_pts.append(pt1)
-                self._asp_hard_pts.append(pt2)
-            case 'med':
-                self._asp_med_pts.append(pt1)
-                self._asp_med_pts.append(pt2)
-            case _:
-                self._line_pts.append(pt1)
-                self._line_pts.append(pt2)
-
-    def _add_circle(self, radius: float, color: _RGBA = WHITE) -> None:
-        pairs = _circle_verts(radius)
-        r, g, b, a = color
-        for i in range(0, len(pairs), 2):
-            self._line_pts.append([float(pairs[i][0]),   float(pairs[i][1]),   r, g, b, a])
-            self._line_pts.append([float(pairs[i+1][0]), float(pairs[i+1][1]), r, g, b, a])
+            case 'hard': buf = self._asp_hard
+            case 'med':  buf = self._asp_med
+            case _:      buf = self._lines
+        buf.append(x1, y1, x2, y2, *color)
+
+    # Skeleton geometry, angles in ecliptic orientation (0 rad = 0° Aries)
+    def _add_ring(self, radius: float, color: _RGBA = WHITE) -> None:
+        self._skeleton_pts.append(_ring_verts(radius, color))
+
+    def _add_ticks(self, angles: np.ndarray, r1: float, r2: float, color: _RGBA) -> None:
+        self._skeleton_pts.append(_tick_verts(np.asarray(angles, dtype=np.float64), r1, r2, color))
+
+    def _upload_skeleton(self) -> None:
+        if not self._skeleton_pts:
+            return
+        data = np.vstack(self._skeleton_pts)
+        self._skeleton_vao = self.ctx.vertex_array(
+            self._line_prog, [(self.ctx.buffer(data.tobytes()), '2f 4f', 'in_pos', 'in_color')]
+        )
+        self._skeleton_n   = len(data)
+        self._skeleton_pts = []
 
     def _reset_geometry(self) -> None:
         self._reset_glyphs()
-        for vao in (self._line_vao, self._asp_hard_vao, self._asp_med_vao):
-            if vao:
-                vao.release()
-        self._line_vao     = None
-        self._asp_hard_vao = None
-        self._asp_med_vao  = None
-        self._line_pts     = []
-        self._asp_hard_pts = []
-        self._asp_med_pts  = []
-
-    def _build_line_vao(self, pts: list[list[float]]) -> Optional[moderngl.VertexArray]:
-        if not pts:
-            return None
-        data = np.array(pts, dtype='f4')
-        vbo  = self.ctx.buffer(data.tobytes())
-        return self.ctx.vertex_array(self._line_prog, [(vbo, '2f 4f', 'in_pos', 'in_color')])
+        for buf in (self._lines, self._asp_hard, self._asp_med):
+            buf.clear()
 
     def _upload_geometry(self) -> None:
-        self._line_vao     = self._build_line_vao(self._line_pts)
-        self._asp_hard_vao = self._build_line_vao(self._asp_hard_pts)
-        self._asp_med_vao  = self._build_line_vao(self._asp_med_pts)
+        for buf in (self._lines, self._asp_hard, self._asp_med):
+            buf.upload()
         self._upload_glyphs()
 
+    def _bind_uniforms(self) -> None:
+        for prog in (self._line_prog, self._segment_prog, self._glyph_prog):
+            prog['proj'].write(self._proj.tobytes())  # type: ignore
+        for prog in (self._line_prog, self._segment_prog):
+            prog['u_line_alpha'] = 1.0                # type: ignore
+
     def on_render(self, time: float, frame_time: float) -> None:
-        if not hasattr(self, '_debug_printed'):
-            self._debug_printed = True
-            print(f"[debug] wnd.size={self.wnd.size}  buffer_size={self.wnd.buffer_size}  pixel_ratio={self.wnd.pixel_ratio}  viewport={self.ctx.viewport}")
+        self._bind_uniforms()
         self.ctx.clear(0.0, 0.0, 0.0, 1.0)
-
-        if self._line_vao:
-            self._line_vao.render(moderngl.LINES)
-
-        if self._asp_med_vao:
-            self.ctx.line_width = 1.5
-            self._asp_med_vao.render(moderngl.LINES)
-        if self._asp_hard_vao:
-            self.ctx.line_width = 2.5
-            self._asp_hard_vao.render(moderngl.LINES)
-        self.ctx.line_width = 1.0
-
-        if self._sym_glyph_vao:
-            self._sym_atlas.texture.use(location=0)
-            self._glyph_prog['tex'] = 0
-            self._sym_glyph_vao.render(moderngl.TRIANGLES)
-
-        if self._txt_glyph_vao:
-            self._txt_atlas.texture.use(location=0)
-            self._glyph_prog['tex'] = 0
-            self._txt_glyph_vao.render(moderngl.TRIANGLES)
+        self._draw()
 
         if self._save_path and not self._save_done:
             self._save_done = True
             self._save_screenshot(self._save_path)
             self.wnd.close()
 
+    # The chart into the current viewport, without clearing — batch renders draw many charts per framebuffer
+    def _draw(self) -> None:
+        if self._skeleton_vao:
+            self._line_prog['proj'].write(_rotated_proj(self._proj, -self._base_rad).tobytes())  # type: ignore
+            self._skeleton_vao.render(moderngl.LINES, vertices=self._skeleton_n)
+            self._line_prog['proj'].write(self._proj.tobytes())  # type: ignore
+
+        self._lines.render(moderngl.LINES)
+        self.ctx.line_width = 1.5
+        self._asp_med.render(moderngl.LINES)
+        self.ctx.line_width = 2.5
+        self._asp_hard.render(moderngl.LINES)
+        self.ctx.line_width = 1.0
+
+        self._render_glyphs()
+
 
 #--------------#
 # RADIX CHART  #
@@ -266,15 +347,34 @@ class RadixChart(Chart):
             self._cusps      = list(self.__class__._cfg_cusps)
             self._celestials = list(self.__class__._cfg_celestials)
             self._aspects    = list(self.__class__._cfg_aspects)
-        self._chart_title = self.__class__._cfg_title
-        self._save_path   = self.__class__._cfg_save_path
-        self._save_done   = False
-
-        self._base_rad = math.radians(self._cusps[0]) - math.pi
-        self._mc_rad   = math.radians(self._cusps[9]) - self._base_rad
-        self._build()
+        self._chart_title  = self.__class__._cfg_title
+        self._save_path    = self.__class__._cfg_save_path
+        self._save_done    = False
+        self._label_layout = _LabelLayout()   # label positions carried across frames
+
+        self._build_skeleton()
+        self._upload_skeleton()
+        self._refresh()
+
+    # Swap in another chart on a live instance — offscreen renderers reuse one window per context
+    def set_chart(self, cusps: list[float], celestials: list, aspects: list = [], title: Optional[str] = None) -> None:
+        self._cusps      = list(cusps)
+        self._celestials = list(celestials)
+        self._aspects    = list(aspects)
+        if title is not None:
+            self._chart_title = title
+        self._refresh()
+
+    # Rebuild and upload the dynamic layer for the current cusps and bodies (no cusps → empty chart)
+    def _refresh(self) -> None:
+        self._reset_geometry()
+        if len(self._cusps):
+            self._base_rad = math.radians(self._cusps[0]) - math.pi
+            self._mc_rad   = math.radians(self._cusps[9]) - self._base_rad
+            self._build()
         self._upload_geometry()
 
+    # Per-frame layer; the skeleton is built once in __init__
     def _build(self) -> None:
         self._build_base()
         self._build_zodiac()
@@ -282,25 +382,21 @@ class RadixChart(Chart):
         self._build_aspects()
         self._build_celestials()
 
-    def _build_base(self) -> None:
+    def _build_skeleton(self) -> None:
         for r in [self.R_INNER, self.R_MID, self.R_OUTER, self.R_RIM]:
-            self._add_circle(r, WHITE)
-        self._add_text(self._chart_title, 0.0, 1.1, self.TEXT_SIZE * 0.8, WHITE)
-
-        one_deg = np.linspace(0, 2 * math.pi, 360, endpoint=False) + math.radians(15) - self._base_rad
-        for angle in one_deg:
-            self._add_line(angle, self.R_OUTER, self.R_OUTER + 0.020, DIM_LINE)
+            self._add_ring(r, WHITE)
+        self._add_ticks(np.linspace(0, 2 * math.pi, 360, endpoint=False) + math.radians(15), self.R_OUTER, self.R_OUTER + 0.020, DIM_LINE)
+        self._add_ticks(np.linspace(0, 2 * math.pi, 36,  endpoint=False) + math.radians(15), self.R_OUTER, self.R_OUTER + 0.030, DIM_WHITE)
+        self._add_ticks(np.radians(np.arange(0, 360, 30)), self.R_OUTER, self.R_RIM, DIM_WHITE)
 
-        ten_deg = np.linspace(0, 2 * math.pi, 36, endpoint=False) + math.radians(15) - self._base_rad
-        for angle in ten_deg:
-            self._add_line(angle, self.R_OUTER, self.R_OUTER + 0.030, DIM_WHITE)
+    def _build_base(self) -> None:
+        self._add_text(self._chart_title, 0.0, 1.1, self.TEXT_SIZE * 0.8, WHITE)
 
+    # Sign glyphs stay upright, so they move with the ascendant here rather than in the rotated skeleton
     def _build_zodiac(self) -> None:
         for i in range(12):
-            boundary = math.radians(i * 30) - self._base_rad
-            mid      = boundary + math.radians(15)
-            r_mid    = (self.R_OUTER + self.R_RIM) / 2
-            self._add_line(boundary, self.R_OUTER, self.R_RIM, DIM_WHITE)
+            mid   = math.radians(i * 30 + 15) - self._base_rad
+            r_mid = (self.R_OUTER + self.R_RIM) / 2
             x = r_mid * math.cos(mid)
             y = r_mid * math.sin(mid)
             self._add_glyph(ZODIAC_SYMBOLS[i], x, y, self.GLYPH_SIZE, ZODIAC_COLORS[i])
@@ -346,7 +442,7 @@ class RadixChart(Chart):
             return
         nodes    = [_LabelNode(lon=cel.lon, chart_lon=cel.lon, data=cel)
                     for cel in self._celestials if cel.lon is not None]
-        resolved = _resolve_collisions(nodes)
+        resolved = _resolve_collisions(nodes, layout=self._label_layout)
 
         for node in resolved:
             cel       = node.data
@@ -411,71 +507,81 @@ class LiveRadixChart(RadixChart):
         self._location  = cls._cfg_location
         self._zodiac    = cls._cfg_zodiac
         self._targets   = list(cls._cfg_targets)
-        self._prev_cusps: list[float] = []
+        self._motion      = AngleHermite(0)    # body longitudes between the two keyframes
+        self._cusp_motion = AngleHermite(12)
+        self._aspect_candidates: list = []     # aspects in orb at either keyframe; filtered by orb each frame
+        self._aspects:           list = []
         self._fetch_data()
         self._last_update: float = self._time_mod.monotonic()
         super().__init__(**kwargs)
 
+    # Keyframes at now and one UPDATE_INTERVAL later, so every frame in between shows the true sky at its time
     def _fetch_data(self) -> None:
-        from datetime import datetime
+        from datetime import datetime, timedelta
         from atlas.utils.chrono import convert_to_utc
 
-        now = convert_to_utc(datetime.now(), self._location)
+        now  = convert_to_utc(datetime.now(), self._location)
+        then = now + timedelta(seconds=self._get_step_secs())
         self.__class__.title = datetime.now().strftime("Live  —  %Y-%m-%d  %H:%M:%S")
 
-        celestials = []
+        celestials, ahead = [], []
         for target in self._targets:
             try:
-                state = self._atlas.build_celestial_state(
-                    dt         = now,
-                    location   = self._location,
-                    target     = target,
-                    zodiac     = self._zodiac,
-                    properties = ["position"],
-                    systems    = ["ecliptic"],
-                )
-                celestials.append(state)
+                pair = [
+                    self._atlas.build_celestial_state(
+                        dt         = dt,
+                        location   = self._location,
+                        target     = target,
+                        zodiac     = self._zodiac,
+                        properties = ["position"],
+                        systems    = ["ecliptic"],
+                    )
+                    for dt in (now, then)
+                ]
             except Exception:
-                pass
+                continue
+            if pair[0].lon is not None and pair[1].lon is not None:
+                celestials.append(pair[0])
+                ahead.append(pair[1])
 
-        cusps = self._atlas.build_houses(dt=now, location=self._location, zodiac=self._zodiac)
-        self._prev_cusps = list(getattr(self, '_cusps', []))
-        self._cusps      = cusps
         self._celestials = celestials
+        self._set_keyframes(
+            [c.lon for c in celestials], [_rate(c) for c in celestials],
+            [c.lon for c in ahead],      [_rate(c) for c in ahead],
+            self._atlas.build_houses(dt=now,  location=self._location, zodiac=self._zodiac),
+            self._atlas.build_houses(dt=then, location=self._location, zodiac=self._zodiac),
+            self._get_step_secs() / 86400.0,
+        )
 
     def _get_step_secs(self) -> float:
         return self.__class__.UPDATE_INTERVAL
 
+    # Load the keyframe pair the next frames interpolate across: bodies by cubic Hermite on their ephemeris
+    # speeds, cusps linearly (no rates from the house system). self._celestials are the states drawn each
+    # frame, in the same order as lon0/lon1; h is the interval in days.
+    def _set_keyframes(self, lon0, dlon0, lon1, dlon1, cusps0, cusps1, h: float) -> None:
+        if len(self._motion) != len(lon0):
+            self._motion = AngleHermite(len(lon0))
+        self._motion.set(lon0, dlon0, lon1, dlon1, h)
+        self._cusp_motion.set(cusps0, np.nan, cusps1, np.nan, h)
+        self._cusps = self._cusp_motion(0.0)
+
+        # Aspect candidates: the states are shared with the Aspect objects, so their lines follow the bodies
+        pairs: dict = {}
+        for t in (1.0, 0.0):
+            for c, x in zip(self._celestials, self._motion(t).tolist()):
+                c.lon = x
+            for a in build_aspects(self._celestials):
+                pairs.setdefault((id(a.body_one), id(a.body_two)), a)
+        self._aspect_candidates = list(pairs.values())
+
+    # Evaluate the keyframe interpolation at fraction t of the interval and redraw
     def _rebuild_interpolated(self, t: float) -> None:
-        from copy import copy
-        from atlas.models.aspect import build_aspects
-
-        step_days = self._get_step_secs() / 86400.0
-        interp    = []
-        for c in self._celestials:
-            if t > 0.0 and c.lon is not None and c.dlon is not None:
-                ci     = copy(c)
-                ci.lon = (c.lon + c.dlon * step_days * t) % 360
-                interp.append(ci)
-            else:
-                interp.append(c)
-
-        prev = self._prev_cusps if self._prev_cusps else self._cusps
-        interp_cusps = [
-            (prev[i] + ((self._cusps[i] - prev[i] + 180) % 360 - 180) * t) % 360.0
-            for i in range(len(self._cusps))
-        ]
-
-        orig_celestials, orig_cusps, orig_aspects = self._celestials, self._cusps, self._aspects
-        self._celestials = interp
-        self._cusps      = interp_cusps
-        self._aspects    = build_aspects(interp)
-        self._reset_geometry()
-        self._base_rad = math.radians(interp_cusps[0]) - math.pi
-        self._mc_rad   = math.radians(interp_cusps[9]) - self._base_rad
-        self._build()
-        self._upload_geometry()
-        self._celestials, self._cusps, self._aspects = orig_celestials, orig_cusps, orig_aspects
+        for c, x in zip(self._celestials, self._motion(t).tolist()):
+            c.lon = x
+        self._cusps   = self._cusp_motion(t)
+        self._aspects = [a for a in self._aspect_candidates if _in_orb(a)]
+        self._refresh()
 
     def on_render(self, time: float, frame_time: float) -> None:
         now     = self._time_mod.monotonic()
@@ -500,6 +606,9 @@ class PlaybackChart(LiveRadixChart):
 
     UPDATE_INTERVAL: float = 1.0
 
+    RECORD_FPS: int = 60   # window recordings keep every rendered (vsync-paced) frame
+    EXPORT_FPS: int = 30   # offscreen export: fixed timestep, rendered as fast as the machine allows
+
     # Class-level config — set by configure_playback(), copied to instance in __init__
     _cfg_start_dt:    Any          = None
     _cfg_end_dt:      Any          = None
@@ -537,7 +646,16 @@ class PlaybackChart(LiveRadixChart):
         self._ff_speed_prev = 0
         self._ff_speed_max = cls._cfg_ff_speed_max
         self._video_path   = cls._cfg_video_path
-        self._frame_buffer: list = []
+        self._recorder: Optional[ScreenRecorder] = None
+
+        # Positions and cusps for the whole range, filled ahead of the cursor by a worker thread
+        self._key_step  = 0
+        self._key_pair  = (-1, -1)   # timeline steps the current interpolation runs between
+        self._direction = 1
+        self._timeline  = Timeline(
+            atlas=cls._cfg_atlas, targets=list(cls._cfg_targets), location=cls._cfg_location, zodiac=cls._cfg_zodiac,
+            start_dt=cls._cfg_start_dt, step=cls._cfg_play_step, n_steps=cls._cfg_total_steps,
+        )
         super().__init__(**kwargs)
 
     def _update_title(self, dt: Any = None, step: int = 0) -> None:
@@ -546,22 +664,27 @@ class PlaybackChart(LiveRadixChart):
         speed = f"  {self._ff_speed}x" if self._ff_speed > 1 else ""
         self.__class__.title = dt.strftime(f"Playback  —  %Y-%m-%d  %H:%M  [{step}/{self._total_steps}  {pct}%]{speed}")
 
+    # Index the timeline — no ephemeris work on the render thread
     def _load_at(self, dt: Any, step: int) -> None:
         self._update_title(dt, step)
-        celestials = []
-        for target in self._targets:
-            try:
-                state = self._atlas.build_celestial_state(
-                    dt=dt, location=self._location, target=target,
-                    zodiac=self._zodiac, properties=["position"], systems=["ecliptic"],
-                )
-                celestials.append(state)
-            except Exception:
-                pass
-        cusps = self._atlas.build_houses(dt=dt, location=self._location, zodiac=self._zodiac)
-        self._prev_cusps = list(self._cusps)
-        self._cusps      = cusps
-        self._celestials = celestials
+        self._key_step = step
+        self._timeline.seek(step, self._direction)
+        self._key_pair   = (-1, -1)
+        self._celestials = self._timeline.states(step)
+        self._cusps      = self._timeline.cusps_at(step)
+
+    # Key the interpolation from the loaded step to the next one shown (ff_speed steps on); re-keyed when the
+    # speed changes mid-step
+    def _rebuild_interpolated(self, t: float) -> None:
+        tl = self._timeline
+        a  = self._key_step
+        b  = min(a + self._ff_speed, len(tl) - 1)
+        if (a, b) != self._key_pair:
+            self._key_pair = (a, b)
+            tl.wait(b)
+            self._set_keyframes(tl.lon[a], tl.dlon[a], tl.lon[b], tl.dlon[b], tl.cusps[a], tl.cusps[b],
+                                (b - a) * self._play_step.total_seconds() / 86400.0)
+        super()._rebuild_interpolated(t)
 
     def _fetch_data(self) -> None:
         if not getattr(self, '_current_dt', None):
@@ -569,6 +692,7 @@ class PlaybackChart(LiveRadixChart):
             return
         dt  = self._current_dt
         cur = self._current_step
+        self._direction = 1
         self._load_at(dt, cur)
         skip    = self._ff_speed
         next_dt = dt + self._play_step * skip
@@ -585,6 +709,7 @@ class PlaybackChart(LiveRadixChart):
         new_step = max(0, min(new_step, self._total_steps - 1))
         self._current_dt   = new_dt
         self._current_step = new_step
+        self._direction    = direction
         self._load_at(new_dt, new_step)
         self._rebuild_interpolated(0.0)
 
@@ -617,9 +742,6 @@ class PlaybackChart(LiveRadixChart):
             else:
                 self._step(-1)
 
-    def _get_step_secs(self) -> float:
-        return self._play_step.total_seconds() * self._ff_speed
-
     def on_render(self, time: float, frame_time: float) -> None:
         if not self._paused:
             now     = self._time_mod.monotonic()
@@ -634,11 +756,51 @@ class PlaybackChart(LiveRadixChart):
         super(LiveRadixChart, self).on_render(time, frame_time)
 
         if self._video_path:
-            self._frame_buffer.append(self.ctx.screen.read())
+            self._record()
             if self._current_dt >= self._end_dt:
-                self._encode_video(self._video_path)
+                self._finish_recording()
                 self.wnd.close()
 
+    def on_close(self) -> None:
+        self._finish_recording()
+        self._timeline.close()
+
+    # Stream the frame just drawn to the encoder, opened on the first call at the current viewport size
+    def _record(self) -> None:
+        if self._recorder is None:
+            self._recorder = ScreenRecorder(self._video_path, fps=self.RECORD_FPS)  # type: ignore[arg-type]
+        if not self._recorder.capture(self.ctx):
+            self._recorder, self._video_path = None, None
+
+    def _finish_recording(self) -> None:
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder, self._video_path = None, None
+
+    # Fixed-timestep export into an offscreen framebuffer: EXPORT_FPS × UPDATE_INTERVAL frames per playback
+    # step, each rendered as soon as the previous one is queued — no window, no wall clock
+    def export(self, path: str, fbo: moderngl.Framebuffer, fps: Optional[int] = None) -> int:
+        fps      = fps or self.EXPORT_FPS
+        per_step = max(1, round(fps * self.UPDATE_INTERVAL))
+        frames   = FrameReader(self.ctx, fbo.size)
+        self._paused, self._ff_speed = False, 1
+
+        with VideoWriter(path, fps=fps) as video:
+            dt, step = self._start_dt, 0
+            while dt <= self._end_dt:
+                self._current_dt, self._current_step = dt, step
+                self._load_at(dt, step)
+                for k in range(per_step):
+                    self._rebuild_interpolated(k / per_step)
+                    fbo.use()
+                    super(LiveRadixChart, self).on_render(0.0, 0.0)
+                    video.write(frames.read(fbo))
+                dt, step = dt + self._play_step, step + 1
+            for frame in frames.flush():
+                video.write(frame)
+        frames.release()
+        return video.frames
+
     def _build(self) -> None:
         super()._build()
         self._build_playback_hud()
@@ -669,20 +831,6 @@ class PlaybackChart(LiveRadixChart):
         if self._paused:
             self._add_text("space  play    arrows  step    shift+arrows  speed", 0.0, -1.19, self.TEXT_SIZE * 0.7, DIM_LINE)
 
-    def _encode_video(self, path: str) -> None:
-        try:
-            import imageio  # type: ignore
-            w, h = self.wnd.size
-            fps  = max(1, round(1.0 / self.UPDATE_INTERVAL))
-            with imageio.get_writer(path, fps=fps, macro_block_size=None) as writer:
-                for frame_bytes in self._frame_buffer:
-                    arr = np.frombuffer(frame_bytes, dtype=np.uint8).reshape(h, w, 3)
-                    arr = np.flipud(arr)
-                    writer.append_data(arr)
-            logging.info("video saved: %s", path)
-        except ImportError:
-            logging.error("imageio required for video export: pip install imageio[ffmpeg]")
-
 
 #---------------#
 # TRANSIT CHART #
@@ -713,29 +861,34 @@ class TransitChart(RadixChart):
         cls._cfg_transit_aspects    = transit_aspects
 
     def __init__(self, **kwargs):
+        # Set before super().__init__, which already builds the transit layer
+        self._transit_cusps        = list(self.__class__._cfg_transit_cusps)
+        self._transit_celestials   = list(self.__class__._cfg_transit_celestials)
+        self._transit_aspects      = list(self.__class__._cfg_transit_aspects)
+        self._transit_label_layout = _LabelLayout()
         super().__init__(**kwargs)
-        self._transit_cusps      = list(self.__class__._cfg_transit_cusps)
-        self._transit_celestials = list(self.__class__._cfg_transit_celestials)
-        self._transit_aspects    = list(self.__class__._cfg_transit_aspects)
+
+    def set_chart(self, cusps: list[float], celestials: list, aspects: list = [], title: Optional[str] = None,
+                  transit_cusps: list[float] = [], transit_celestials: list = [], transit_aspects: list = []) -> None:
+        self._transit_cusps      = list(transit_cusps)
+        self._transit_celestials = list(transit_celestials)
+        self._transit_aspects    = list(transit_aspects)
+        super().set_chart(cusps, celestials, aspects, title)
 
     def _build_aspects(self) -> None:
         pass  # suppress natal-only aspects
 
     def _build(self) -> None:
         super()._build()
-        self._build_transit_base()
         self._build_transit_houses()
         self._build_transit_celestials()
         self._build_transit_aspects()
 
-    def _build_transit_base(self) -> None:
-        self._add_circle(self.R_TRANSIT_RIM, WHITE)
-        one_deg = np.linspace(0, 2 * math.pi, 360, endpoint=False) + math.radians(15) - self._base_rad
-        for angle in one_deg:
-            self._add_line(angle, self.R_RIM, self.R_RIM - 0.020, DIM_LINE)
-        ten_deg = np.linspace(0, 2 * math.pi, 36, endpoint=False) + math.radians(15) - self._base_rad
-        for angle in ten_deg:
-            self._add_line(angle, self.R_RIM, self.R_RIM - 0.030, DIM_WHITE)
+    def _build_skeleton(self) -> None:
+        super()._build_skeleton()
+        self._add_ring(self.R_TRANSIT_RIM, WHITE)
+        self._add_ticks(np.linspace(0, 2 * math.pi, 360, endpoint=False) + math.radians(15), self.R_RIM, self.R_RIM - 0.020, DIM_LINE)
+        self._add_ticks(np.linspace(0, 2 * math.pi, 36,  endpoint=False) + math.radians(15), self.R_RIM, self.R_RIM - 0.030, DIM_WHITE)
 
     def _build_transit_houses(self) -> None:
         for cusp_lon in self._transit_cusps:
@@ -746,7 +899,7 @@ class TransitChart(RadixChart):
             return
         nodes    = [_LabelNode(lon=cel.lon, chart_lon=cel.lon, data=cel)
                     for cel in self._transit_celestials if cel.lon is not None]
-        resolved = _resolve_collisions(nodes)
+        resolved = _resolve_collisions(nodes, layout=self._transit_label_layout)
 
         for node in resolved:
             cel       = node.data
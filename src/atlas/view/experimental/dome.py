@@ -4,9 +4,10 @@
 # Standard Modules
 import os
 import math
-from datetime import datetime
-from functools import lru_cache
-from pathlib import Path
+import queue
+import logging
+import threading
+from datetime import datetime, timedelta
 from typing import Optional, Callable, TYPE_CHECKING
 
 # Internal Modules
@@ -14,8 +15,15 @@ from atlas.view.base import (
     BaseGLWindow, GlyphAtlas, _RGBA, _ortho, _circle_verts, _glyph_quad,
     _strip_var_selector, _FONT_PATH, _SYMBOL_FONT, TEXT_CHARS, SYMBOL_CHARS,
 )
+from atlas.utils.chrono import J2000_JD
+from atlas.utils.constellation import load_constellation_data
+from atlas.utils.precession import epoch_matrix, mean_obliquity, radec_to_unit, rot_y, rot_z, rotate
+from atlas.utils.spatial import PointGrid
+from atlas.utils.star_catalog import StarCatalog, ci_to_rgb, mag_to_size, open_star_catalog
+from atlas.view.video import FrameReader, ScreenRecorder, VideoWriter
 
 if TYPE_CHECKING:
+    from atlas.core.atlas import Atlas
     from atlas.models.celestial_state import CelestialState
     from atlas.models.location import Location
 
@@ -28,7 +36,7 @@ from PIL import Image, ImageDraw, ImageFont
 
 
 _SHADER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shaders")
-_DATA_DIR   = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+_DATA_DIR   = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
 
 _PANEL_VERT = """
 #version 330 core
@@ -44,9 +52,27 @@ void main() { fragColor = texture(panel_tex, v_uv); }
 _VIEWPORT     = 1.15
 _DOME_R       = 1.0
 _CLICK_RADIUS = 0.045
+_HOVER_SEGS   = 48
 _PANEL_W      = 300
 _PANEL_H      = 295
 
+# Star level of detail: each doubling of zoom reaches this many magnitudes deeper, up to a resident cap
+_LOD_MAG_PER_ZOOM = 1.5
+_LOD_MAX_STARS    = 2_000_000
+_STAR_FLOATS      = 8   # unit xyz, size, rgb, mag
+
+# The ecliptic drifts ~47" per century against the J2000 frame — re-upload it only after this many days
+_ECLIPTIC_REBUILD_DAYS = 3652.5
+
+# Planet point buffer starts with room for this many bodies and grows on demand
+_PLANET_CAPACITY = 24
+
+# Time-lapse planet tracks: line alpha, and the longest step (dome radii) still drawn as a connected arc
+_TRACK_ALPHA       = 0.6
+_TRACK_MAX_JUMP    = 0.25
+_TRACK_MAG_STEP    = timedelta(days=1)
+_TRACK_MAG_SAMPLES = 180
+
 _PLANET_COLORS: dict[str, _RGBA] = {
     "sun":     (1.0,  0.95, 0.3,  1.0), "moon":    (0.95, 0.95, 0.85, 1.0),
     "mercury": (0.75, 0.75, 0.75, 1.0), "venus":   (0.95, 0.9,  0.7,  1.0),
@@ -56,86 +82,37 @@ _PLANET_COLORS: dict[str, _RGBA] = {
 }
 _DEFAULT_PLANET_COLOR: _RGBA = (0.85, 0.85, 1.0, 1.0)
 
-# Derive constellation centroids from the IAU boundary strips in constellations.dat
-@lru_cache(maxsize=1)
-def _load_constellation_centers(dat_path: str) -> dict[str, tuple[float, float]]:
-    from collections import defaultdict
-    strips: dict[str, list[tuple[float, float, float]]] = defaultdict(list)
-    with open(dat_path) as f:
-        for line in f:
-            parts = line.split()
-            if len(parts) == 4:
-                ra_low, ra_high, dec_low = float(parts[0]), float(parts[1]), float(parts[2])
-                strips[parts[3]].append((ra_low, ra_high, dec_low))
-
-    centers: dict[str, tuple[float, float]] = {}
-    for abbr, strip_list in strips.items():
-        # RA midpoint per strip (hours); handle wrap across 0h/24h
-        ra_mids = [(s[0] + s[1]) / 2 for s in strip_list]
-        if max(ra_mids) - min(ra_mids) > 12.0:
-            ra_mids = [r + 24.0 if r < 12.0 else r for r in ra_mids]
-        ra_deg = (sum(ra_mids) / len(ra_mids) % 24.0) * 15.0
-
-        # Dec: midpoint between lowest and highest strip boundaries
-        dec_deg = (min(s[2] for s in strip_list) + max(s[2] for s in strip_list)) / 2
-
-        centers[abbr] = (ra_deg, dec_deg)
-    return centers
-
-
-def _ci_to_rgb(ci: float) -> tuple[float, float, float]:
-    if not math.isfinite(ci):
-        ci = 0.6
-    ci = max(-0.4, min(2.0, ci))
-    if ci < 0.0:
-        t = (ci + 0.4) / 0.4
-        return (0.55 + 0.45 * t, 0.7 + 0.3 * t, 1.0)
-    elif ci < 0.58:
-        t = ci / 0.58
-        return (1.0, 1.0, 1.0 - 0.05 * t)
-    elif ci < 1.0:
-        t = (ci - 0.58) / 0.42
-        return (1.0, 1.0 - 0.25 * t, 0.95 - 0.45 * t)
-    else:
-        t = min(1.0, (ci - 1.0) / 1.0)
-        return (1.0, 0.75 - 0.65 * t, 0.5 - 0.5 * t)
-
-
-def _mag_to_size(mag: float) -> float:
-    return max(1.0, (7.5 - mag) * 1.6)
-
-
 def _project(alt: float, az: float) -> tuple[float, float]:
     r    = (90.0 - alt) / 90.0 * _DOME_R
     az_r = math.radians(az)
     return -r * math.sin(az_r), r * math.cos(az_r)
 
 
-def _radec_to_altaz(
-    ra_deg:  np.ndarray,
-    dec_deg: np.ndarray,
-    lat_deg: float,
-    lst_deg: float,
-) -> tuple[np.ndarray, np.ndarray]:
-    H       = np.radians((lst_deg - ra_deg) % 360.0)
-    lat_r   = math.radians(lat_deg)
-    dec_r   = np.radians(dec_deg)
-    sin_alt = math.sin(lat_r) * np.sin(dec_r) + math.cos(lat_r) * np.cos(dec_r) * np.cos(H)
-    alt     = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
-    cos_alt = np.cos(np.radians(alt))
-    cos_az  = np.where(
-        cos_alt > 1e-6,
-        (np.sin(dec_r) - math.sin(lat_r) * sin_alt) / (math.cos(lat_r) * cos_alt + 1e-10),
-        1.0,
-    )
-    az = np.degrees(np.arccos(np.clip(cos_az, -1.0, 1.0)))
-    az = np.where(np.sin(H) > 0, 360.0 - az, az)
-    return alt, az
-
-
-@lru_cache(maxsize=1)
-def _load_catalog(path: str) -> np.ndarray:
-    return np.load(path)
+def _julday(dt: datetime) -> float:
+    hour = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
+    return swe.julday(dt.year, dt.month, dt.day, hour)
+
+
+# Rotation from the true equator of date to the local horizon frame (x = south, y = east, z = zenith):
+# apparent sidereal time, then latitude
+def _local_matrix(lst_deg: float, lat_deg: float) -> np.ndarray:
+    return rot_y(math.radians(90.0 - lat_deg)) @ rot_z(math.radians(lst_deg))
+
+
+# Horizon-frame vectors → altitude (degrees) and dome-plane x, y (azimuthal equidistant, north up, east left)
+def _dome_xy(h: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    alt = np.degrees(np.arcsin(np.clip(h[..., 2], -1.0, 1.0)))
+    az  = np.arctan2(h[..., 1], -h[..., 0])
+    r   = (90.0 - alt) / 90.0 * _DOME_R
+    return alt, -r * np.sin(az), r * np.cos(az)
+
+
+# Ecliptic of date every 1° (361 points) followed by the 12 sign midpoints, as J2000 unit vectors
+def _ecliptic_units(jd: float) -> np.ndarray:
+    eps  = mean_obliquity(jd)
+    lons = np.radians(np.concatenate([np.arange(0, 361, 1.0), np.arange(15.0, 360.0, 30.0)]))
+    v    = np.stack([np.cos(lons), np.sin(lons) * math.cos(eps), np.sin(lons) * math.sin(eps)], axis=-1)
+    return rotate(v, epoch_matrix(J2000_JD, jd, nutate=True).T)
 
 
 #------------#
@@ -261,7 +238,7 @@ class InfoPanel:
         draw.line([(8, 32), (_PANEL_W - 8, 32)], fill=(45, 50, 70, 200), width=1)
 
         y = 40
-        for key, label in [("constellation", "Constellation"), ("mag", "Magnitude"),
+        for key, label in [("brightest", "Brightest"), ("constellation", "Constellation"), ("mag", "Magnitude"),
                             ("spect", "Spectral"), ("ci", "B-V Index")]:
             if val := data.get(key):
                 draw.text((12, y), label,    font=font_sm, fill=(110, 120, 145, 220))
@@ -318,8 +295,7 @@ class DomeView(BaseGLWindow):
         save_path:  Optional[str]      = None,
         title:      str                = "",
     ) -> None:
-        hour              = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-        cls._cfg_jd        = swe.julday(dt.year, dt.month, dt.day, hour)
+        cls._cfg_jd        = _julday(dt)
         cls._cfg_lat       = location.lat
         cls._cfg_lon       = location.lon
         cls._cfg_mag_limit = mag_limit
@@ -347,24 +323,19 @@ class DomeView(BaseGLWindow):
 
         self.ctx.enable(moderngl.PROGRAM_POINT_SIZE)
 
-        self._star_prog  = self._load_program('star')
-        self._panel_prog = self.ctx.program(vertex_shader=_PANEL_VERT, fragment_shader=_PANEL_FRAG)
+        self._star_prog      = self._load_program('star')
+        self._sky_star_prog  = self._load_program('sky_star', frag='star')
+        self._sky_line_prog  = self._load_program('sky_line')
+        self._sky_glyph_prog = self._load_program('sky_glyph', frag='glyph')
+        self._panel_prog     = self.ctx.program(vertex_shader=_PANEL_VERT, fragment_shader=_PANEL_FRAG)
 
-        v    = _VIEWPORT
-        proj = _ortho(-v, v, -v, v)
-        for prog in (self._star_prog, self._line_prog, self._glyph_prog):
-            prog['proj'].write(proj.tobytes())  # type: ignore
         self._star_prog['u_brightness'] = 1.0  # type: ignore
         self._line_prog['u_line_alpha'] = 1.0  # type: ignore
+        for prog in self._sky_progs:
+            prog['dome_r'] = _DOME_R  # type: ignore
 
         self._panel = InfoPanel(self.ctx, self._panel_prog)
 
-        self._star_xy:    np.ndarray       = np.empty((0, 2), dtype=np.float32)
-        self._star_radec: np.ndarray       = np.empty((0, 2), dtype=np.float32)
-        self._star_names: list[str]        = []
-        self._star_mags:  list[float]      = []
-        self._star_ci:    list[float]      = []
-        self._star_spect: list[str]        = []
         self._planet_xy:    list[tuple[float, float]] = []
         self._planet_names: list[str]      = []
 
@@ -376,256 +347,373 @@ class DomeView(BaseGLWindow):
         self._drag_pan:   bool  = False
         self._shift_held: bool  = False
 
-        self._lst:                float = 0.0
-        self._ecliptic_vao:       Optional[moderngl.VertexArray] = None
-        self._n_ecliptic:         int   = 0
-        self._sun_vao:            Optional[moderngl.VertexArray] = None
-        self._const_boundary_vao: Optional[moderngl.VertexArray] = None
-        self._n_const_boundary:   int   = 0
+        self._lst:          float = 0.0
+        self._sky:          np.ndarray = np.eye(3)
+        self._ecliptic_jd:  float = self._jd
+        self._picks:        Optional[tuple[tuple, np.ndarray, PointGrid]] = None
+        self._hover:        Optional[tuple[float, float, float]] = None
+        self._region_from:  Optional[tuple[float, float]]        = None
+        self._region_to:    Optional[tuple[float, float]]        = None
+        self._gl_owned:     list  = []
+        self._sky_owned:    list  = []
+
+        # Planet discs and halos (x, y, size, rgb), rewritten in place per instant: the sun's first, then the rest
+        self._planet_vbo = self.ctx.buffer(reserve=_PLANET_CAPACITY * 2 * 6 * 4, dynamic=True)
+        self._planet_vao = self.ctx.vertex_array(self._star_prog, [(self._planet_vbo, "2f 1f 3f", "in_pos", "in_size", "in_color")])
+        self._n_sun_pts    = 0
+        self._n_planet_pts = 0
+        self._sun_alt_now  = -18.0
+
+        # Hover ring and selection rectangle — fixed-size buffers rewritten in place as the mouse moves
+        self._hover_vbo  = self.ctx.buffer(reserve=_HOVER_SEGS * 2 * 6 * 4)
+        self._hover_vao  = self.ctx.vertex_array(self._line_prog, [(self._hover_vbo, "2f 4f", "in_pos", "in_color")])
+        self._region_vbo = self.ctx.buffer(reserve=8 * 6 * 4)
+        self._region_vao = self.ctx.vertex_array(self._line_prog, [(self._region_vbo, "2f 4f", "in_pos", "in_color")])
+
+        circ    = _circle_verts(_DOME_R, segments=360)
+        ccolors = np.full((len(circ), 4), [0.22, 0.24, 0.34, 0.55], dtype="f4")
+        self._horizon_vao = self._make_vao(self._line_prog, np.hstack([circ, ccolors]), "2f 4f", "in_pos", "in_color")
+
+        self._update_projection()
+        self._update_sky()
+        self._init_stars()
+        self._upload_sky()
+        self._build_vaos()
 
-        self._compute_stars()
+    @property
+    def _sky_progs(self) -> tuple[moderngl.Program, ...]:
+        return (self._sky_star_prog, self._sky_line_prog, self._sky_glyph_prog)
+
+    # Move the dome to another instant (optionally with fresh planet states or another observer): the sky is one
+    # uniform update; only the handful of planet points and overlay glyphs are rebuilt
+    def set_time(self, dt: datetime, planets: Optional[list] = None, location: Optional["Location"] = None) -> None:
+        self._jd = _julday(dt)
+        if planets is not None:
+            self._planets = list(planets)
+        if location is not None:
+            self._lat, self._lon = location.lat, location.lon
+        self._update_sky()
+        if abs(self._jd - self._ecliptic_jd) > _ECLIPTIC_REBUILD_DAYS:
+            self._ecliptic_jd = self._jd
+            self._upload_sky()
         self._build_vaos()
 
-    def _compute_stars(self) -> None:
-        self._lst = (swe.sidtime(self._jd) * 15.0 + self._lon) % 360.0
+    # Sidereal time and the J2000 → horizon rotation for the current instant (precession + nutation to the true
+    # equator of date, then the local rotation), written to every sky program
+    def _update_sky(self) -> None:
+        self._lst   = (swe.sidtime(self._jd) * 15.0 + self._lon) % 360.0
+        self._local = _local_matrix(self._lst, self._lat)
+        self._sky   = self._local @ epoch_matrix(J2000_JD, self._jd, nutate=True)
+        self._picks = None
+        self._hover = None
+        self._write_sky()
+
+    def _write_sky(self) -> None:
+        sky = self._sky.T.astype('f4').tobytes()  # column-major for GLSL
+        for prog in self._sky_progs:
+            prog['sky'].write(sky)  # type: ignore
+
+    # Programs are shared with other views on this context: restate the dome's projection and sky each frame
+    def _bind_uniforms(self) -> None:
+        self._update_projection()
+        self._write_sky()
+
+    # Buffer + VAO appended to an ownership list — the view's, or the sky's, which is released on re-upload
+    def _make_vao(self, prog: moderngl.Program, data: np.ndarray, fmt: str, *attrs: str, owned: Optional[list] = None) -> moderngl.VertexArray:
+        vbo = self.ctx.buffer(np.ascontiguousarray(data, dtype="f4").tobytes())
+        vao = self.ctx.vertex_array(prog, [(vbo, fmt, *attrs)])
+        (self._gl_owned if owned is None else owned).extend([vao, vbo])
+        return vao
+
+     #===#
+    # SKY #
+     #===#
+
+    # Static sky geometry uploaded once as J2000 unit vectors — constellation boundaries and labels,
+    # ecliptic and zodiac glyphs; the vertex shaders project them with the `sky` uniform (stars: see STARS)
+    def _upload_sky(self) -> None:
+        for obj in self._sky_owned:
+            obj.release()
+        self._sky_owned = []
+        self._upload_sky_lines()
+        self._upload_sky_glyphs()
+
+    # Constellation boundaries (white) and the ecliptic of date (gold); per-frame alpha comes from uniforms
+    def _upload_sky_lines(self) -> None:
+        segments = np.asarray(load_constellation_data()["segments"]).reshape(-1, 3)
+        data     = np.empty((len(segments), 7), dtype="f4")
+        data[:, :3] = segments
+        data[:, 3:] = (1.0, 1.0, 1.0, 1.0)
+        self._const_boundary_vao = self._make_vao(self._sky_line_prog, data, "3f 4f", "in_unit", "in_color", owned=self._sky_owned)
+        self._n_const_boundary   = len(data)
+
+        line = _ecliptic_units(self._ecliptic_jd)[:361]
+        data = np.empty((360 * 2, 7), dtype="f4")
+        data[:, :3] = np.stack([line[:-1], line[1:]], axis=1).reshape(-1, 3)
+        data[:, 3:] = (0.82, 0.75, 0.38, 1.0)
+        self._ecliptic_vao = self._make_vao(self._sky_line_prog, data, "3f 4f", "in_unit", "in_color", owned=self._sky_owned)
+        self._n_ecliptic   = len(data)
+
+    # Zodiac glyphs at the ecliptic sign midpoints and constellation abbreviations at their centres,
+    # as glyph quads offset around a sky anchor
+    def _upload_sky_glyphs(self) -> None:
+        from atlas.models.celestial_state import SIGNS
+
+        zodiac = [
+            self._sky_quad(self._sym_atlas, glyph, unit, 0.0, 0.068, (0.82, 0.75, 0.38, 1.0))
+            for (glyph, _), unit in zip(SIGNS, _ecliptic_units(self._ecliptic_jd)[361:])
+        ]
+        self._zodiac_vao = self._sky_glyph_vao(zodiac)
+
+        centers = load_constellation_data()["centers"]
+        spacing = 0.048 * self._TEXT_SPACING
+        labels  = []
+        for abbr, unit in zip(centers["abbr"].tolist(), np.asarray(centers["unit"])):
+            start = -(len(abbr) - 1) * spacing / 2
+            labels += [self._sky_quad(self._txt_atlas, ch, unit, start + i * spacing, 0.048, (1.0, 1.0, 1.0, 1.0)) for i, ch in enumerate(abbr)]
+        self._label_vao = self._sky_glyph_vao(labels)
+
+    def _sky_quad(self, atlas: GlyphAtlas, ch: str, unit: np.ndarray, dx: float, size: float, color: _RGBA) -> Optional[np.ndarray]:
+        uv = atlas.uv_map.get(_strip_var_selector(ch))
+        if uv is None:
+            return None
+        quad = _glyph_quad(dx, 0.0, size, uv, color)
+        return np.hstack([np.broadcast_to(unit, (6, 3)), quad])
+
+    def _sky_glyph_vao(self, quads: list) -> Optional[moderngl.VertexArray]:
+        quads = [q for q in quads if q is not None]
+        if not quads:
+            return None
+        return self._make_vao(
+            self._sky_glyph_prog, np.vstack(quads), "3f 2f 2f 4f",
+            "in_unit", "in_offset", "in_uv", "in_color", owned=self._sky_owned,
+        )
 
-        cat_path = str(Path(_DATA_DIR) / "stars.npy")
-        if not Path(cat_path).exists():
+     #=====#
+    # STARS #
+     #=====#
+
+    # The star buffer only grows: a base layer down to the configured magnitude is loaded up front, then
+    # tiles in view are streamed deeper on a worker thread as the zoom level allows
+    def _init_stars(self) -> None:
+        self._stars: Optional[StarCatalog]            = open_star_catalog(_DATA_DIR)
+        self._star_vbo: Optional[moderngl.Buffer]      = None
+        self._star_vao: Optional[moderngl.VertexArray] = None
+        self._star_cpu    = np.empty((0, _STAR_FLOATS), dtype="f4")  # CPU mirror of the vertex data, for picking
+        self._star_row    = np.empty(0, dtype=np.int64)              # catalog row of each vertex
+        self._n_stars     = 0
+        self._lod_mag     = self._mag_limit
+        self._lod_jobs:    "queue.Queue[Optional[tuple[int, float, float]]]" = queue.Queue()
+        self._lod_ready:   "queue.Queue[tuple[int, float, np.ndarray, np.ndarray]]" = queue.Queue()
+        self._lod_pending: set[int] = set()
+
+        if self._stars is None:
             logging.warning("stars.npy not found — run scripts/convert_hyg.py")
-            self._star_vbo_data = np.empty((0, 6), dtype=np.float32)
-            self._n_stars = 0
+            self._tile_depth = np.empty(0)
             return
 
-        cat  = _load_catalog(cat_path)
-        cat  = cat[(cat["mag"] <= self._mag_limit) & (cat["name"] != b"Sol")]
-        alt, az = _radec_to_altaz(cat["ra"], cat["dec"], self._lat, self._lst)
-
-        vis = alt > -0.5
-        cat, alt, az = cat[vis], alt[vis], az[vis]
-
-        r    = (90.0 - alt) / 90.0 * _DOME_R
-        az_r = np.radians(az)
-        xs   = (-r * np.sin(az_r)).astype(np.float32)
-        ys   = (r * np.cos(az_r)).astype(np.float32)
+        self._tile_depth = np.full(self._stars.n_tiles, -np.inf)
+        for tile in range(self._stars.n_tiles):
+            self._append_stars(*self._read_tile(tile, -np.inf, self._mag_limit))
+        threading.Thread(target=self._lod_worker, name="dome-lod", daemon=True).start()
+
+    # Vertices (unit, size, rgb, mag) for a tile's stars with mag_from < mag <= mag_to — safe off the GL thread
+    def _read_tile(self, tile: int, mag_from: float, mag_to: float) -> tuple[int, float, np.ndarray, np.ndarray]:
+        first, rows = self._stars.slice(tile, mag_from, mag_to)  # type: ignore[union-attr]
+        keep  = rows["name"] != b"Sol"
+        rows  = rows[keep]
+        verts = np.empty((len(rows), _STAR_FLOATS), dtype="f4")
+        if self._stars.precomputed:  # type: ignore[union-attr]
+            verts[:, 0:3] = rows["unit"]
+            verts[:, 3]   = rows["size"]
+            verts[:, 4:7] = rows["rgb"]
+        else:
+            verts[:, 0:3] = radec_to_unit(rows["ra"], rows["dec"])
+            verts[:, 3]   = mag_to_size(rows["mag"])
+            verts[:, 4:7] = ci_to_rgb(rows["ci"])
+        verts[:, 7]   = rows["mag"]
+        return tile, mag_to, first + np.flatnonzero(keep), verts
+
+    def _lod_worker(self) -> None:
+        while (job := self._lod_jobs.get()) is not None:
+            try:
+                self._lod_ready.put(self._read_tile(*job))
+            except Exception as e:
+                logging.warning(f"star tile {job[0]} failed to load: {e}")
 
-        rgb   = np.array([_ci_to_rgb(float(c)) for c in cat["ci"]], dtype=np.float32)
-        sizes = np.array([_mag_to_size(float(m)) for m in cat["mag"]], dtype=np.float32)
+    # Append vertices to the star buffer (GL thread), doubling buffer and mirror capacity when full
+    def _append_stars(self, tile: int, mag: float, rows: np.ndarray, verts: np.ndarray) -> None:
+        self._tile_depth[tile] = max(self._tile_depth[tile], mag)
+        self._lod_pending.discard(tile)
+        if not len(verts):
+            return
 
-        self._star_vbo_data = np.column_stack([xs, ys, sizes, rgb]).astype(np.float32)
-        self._n_stars        = len(xs)
-        self._star_xy        = np.column_stack([xs, ys])
-        self._star_radec     = np.column_stack([cat["ra"].astype(np.float32), cat["dec"].astype(np.float32)])
-        self._star_names     = [n.decode("ascii", errors="replace").strip() for n in cat["name"]]
-        self._star_mags      = [float(m) for m in cat["mag"]]
-        self._star_ci        = [float(c) for c in cat["ci"]]
-        self._star_spect     = [s.decode("ascii", errors="replace").strip() for s in cat["spect"]]
+        n, stride = self._n_stars, _STAR_FLOATS * 4
+        if n + len(verts) > len(self._star_cpu):
+            cap = max(n + len(verts), 2 * len(self._star_cpu), 1 << 14)
+            vbo = self.ctx.buffer(reserve=cap * stride)
+            if self._star_vbo is not None:
+                self.ctx.copy_buffer(vbo, self._star_vbo, size=n * stride)
+                self._star_vao.release()  # type: ignore[union-attr]
+                self._star_vbo.release()
+            self._star_vbo = vbo
+            self._star_vao = self.ctx.vertex_array(
+                self._sky_star_prog, [(vbo, "3f 1f 3f 1f", "in_unit", "in_size", "in_color", "in_mag")]
+            )
+            self._star_cpu = np.resize(self._star_cpu, (cap, _STAR_FLOATS))
+            self._star_row = np.resize(self._star_row, cap)
+
+        self._star_vbo.write(np.ascontiguousarray(verts).tobytes(), offset=n * stride)  # type: ignore[union-attr]
+        self._star_cpu[n:n + len(verts)] = verts
+        self._star_row[n:n + len(verts)] = rows
+        self._n_stars = n + len(verts)
+
+    # Deepest magnitude the current zoom shows; tiles overlapping the view that are loaded shallower are queued,
+    # nearest the view centre first
+    def _request_lod(self) -> None:
+        self._lod_mag = self._mag_limit + _LOD_MAG_PER_ZOOM * math.log2(self._zoom)
+        if self._stars is None or self._n_stars >= _LOD_MAX_STARS:
+            return
+        need = self._tile_depth < self._lod_mag
+        if not need.any():
+            return
 
+        alt, xs, ys = _dome_xy(self._stars.center @ self._sky.T)
+        reach = self._stars.radius * 1.6 / 90.0 * _DOME_R  # projection stretches caps up to π/2 tangentially
+        half  = _VIEWPORT / self._zoom
+        dx, dy = np.abs(xs - self._pan_x), np.abs(ys - self._pan_y)
+        tiles  = np.flatnonzero(need & (alt > -self._stars.radius) & (dx < half + reach) & (dy < half + reach))
+        for tile in tiles[np.argsort(np.hypot(dx, dy)[tiles])].tolist():
+            if tile not in self._lod_pending:
+                self._lod_pending.add(tile)
+                self._lod_jobs.put((tile, float(self._tile_depth[tile]), self._lod_mag))
+
+    # Upload tiles the worker has finished, a bounded number per frame
+    def _drain_lod(self, budget: int = 32) -> None:
+        for _ in range(budget):
+            try:
+                chunk = self._lod_ready.get_nowait()
+            except queue.Empty:
+                return
+            self._append_stars(*chunk)
+
+    # Grid index over the dome positions of visible stars — rebuilt on the first query after the time,
+    # the zoom depth or the loaded set changes
+    def _star_picks(self) -> tuple[np.ndarray, PointGrid]:
+        key = (self._jd, self._n_stars, self._lod_mag)
+        if self._picks is None or self._picks[0] != key:
+            stars       = self._star_cpu[:self._n_stars]
+            alt, xs, ys = _dome_xy(stars[:, 0:3] @ self._sky.T)
+            idx         = np.flatnonzero((alt > -0.5) & (stars[:, 7] <= self._lod_mag))
+            self._picks = (key, idx, PointGrid(np.column_stack([xs[idx], ys[idx]]), _CLICK_RADIUS))
+        return self._picks[1], self._picks[2]
+
+    # Catalog rows of visible stars within `radius` of a dome point, brightest first
+    def stars_in_radius(self, x: float, y: float, radius: float) -> np.ndarray:
+        idx, grid = self._star_picks()
+        return self._brightest(idx[grid.within_radius(x, y, radius)])
+
+    # Catalog rows of visible stars inside a dome-plane rectangle, brightest first
+    def stars_in_rect(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        idx, grid = self._star_picks()
+        return self._brightest(idx[grid.within_rect(x0, y0, x1, y1)])
+
+    def _brightest(self, slots: np.ndarray) -> np.ndarray:
+        if self._stars is None:
+            return np.empty(0)
+        sel = self._stars.rows[np.sort(self._star_row[slots])]
+        return sel[np.argsort(sel["mag"], kind="stable")]
+
+    # Closest planet within its click radius, else the closest star within the star click radius
+    def _pick(self, cx: float, cy: float) -> Optional[tuple[str, int, float, float]]:
+        star_r   = _CLICK_RADIUS / self._zoom
+        planet_r = star_r * 2.5
+
+        best = None
+        for i, (px, py) in enumerate(self._planet_xy):
+            d = math.hypot(cx - px, cy - py)
+            if d < planet_r and (best is None or d < best[0]):
+                best = (d, i, px, py)
+        if best is not None:
+            return ("planet", best[1], best[2], best[3])
+
+        idx, grid = self._star_picks()
+        k = grid.nearest(cx, cy, star_r)
+        if k is None:
+            return None
+        return ("star", int(idx[k]), float(grid.xy[k, 0]), float(grid.xy[k, 1]))
+
+    def _sun_alt(self) -> float:
+        return self._sun_alt_now
+
+     #=======#
+    # OVERLAY #
+     #=======#
+
+    # Per-instant overlay from the planet states: discs, glyphs, cardinal points and title
     def _build_vaos(self) -> None:
-        # Reset glyph accumulators before rebuild
+        shown = [s for s in self._planets if s.alt is not None and s.az is not None]
+        xy    = [_project(s.alt, s.az) for s in shown]
+        self._place_planets(
+            names  = [s.name for s in shown],
+            glyphs = [s.glyph for s in shown],
+            alt    = np.array([s.alt for s in shown], dtype=float),
+            x      = np.array([p[0] for p in xy], dtype=float),
+            y      = np.array([p[1] for p in xy], dtype=float),
+            mag    = np.array([np.nan if s.app_mag is None else s.app_mag for s in shown], dtype=float),
+        )
+
+    # Write planets at dome positions (x, y) into the point buffer and the glyph layer; bodies below the horizon
+    # are skipped, a missing magnitude (NaN) gets the default disc size
+    def _place_planets(self, names: list[str], glyphs: list[str], alt: np.ndarray, x: np.ndarray, y: np.ndarray, mag: np.ndarray) -> None:
         self._reset_glyphs()
         self._planet_xy    = []
         self._planet_names = []
+        self._sun_alt_now  = -18.0
 
-        vbo = self.ctx.buffer(self._star_vbo_data.tobytes())
-        self._star_vao = self.ctx.vertex_array(
-            self._star_prog, [(vbo, "2f 1f 3f", "in_pos", "in_size", "in_color")]
-        )
-
-        circ    = _circle_verts(_DOME_R, segments=360)
-        ccolors = np.full((len(circ), 4), [0.22, 0.24, 0.34, 0.55], dtype="f4")
-        vbo     = self.ctx.buffer(np.hstack([circ, ccolors]).astype("f4").tobytes())
-        self._horizon_vao = self.ctx.vertex_array(
-            self._line_prog, [(vbo, "2f 4f", "in_pos", "in_color")]
-        )
-
-        self._build_ecliptic()
-
-        planet_pts: list[list[float]] = []
+        sizes   = np.where(np.isnan(mag), 9.0, mag_to_size(np.nan_to_num(mag)))
         sun_pts:    list[list[float]] = []
-        for state in self._planets:
-            if state.alt is None or state.az is None or state.alt < 0:
+        planet_pts: list[list[float]] = []
+        for i, name in enumerate(names):
+            is_sun = name.lower() == "sun"
+            if is_sun and np.isfinite(alt[i]):
+                self._sun_alt_now = float(alt[i])
+            if not alt[i] >= 0:   # below the horizon, or no position
                 continue
-            x, y       = _project(state.alt, state.az)
-            color      = _PLANET_COLORS.get(state.name.lower(), _DEFAULT_PLANET_COLOR)
-            size       = _mag_to_size(state.app_mag) if state.app_mag is not None else 9.0
+            px, py     = float(x[i]), float(y[i])
+            size       = float(sizes[i])
+            color      = _PLANET_COLORS.get(name.lower(), _DEFAULT_PLANET_COLOR)
             halo_color = (color[0] * 0.35, color[1] * 0.35, color[2] * 0.35)
-            pts        = sun_pts if state.name.lower() == "sun" else planet_pts
-            pts.append([x, y, size * 3.2, halo_color[0], halo_color[1], halo_color[2]])
-            pts.append([x, y, size,       color[0],       color[1],       color[2]])
-            self._planet_xy.append((x, y))
-            self._planet_names.append(state.name)
+            pts        = sun_pts if is_sun else planet_pts
+            pts.append([px, py, size * 3.2, halo_color[0], halo_color[1], halo_color[2]])
+            pts.append([px, py, size,       color[0],       color[1],       color[2]])
+            self._planet_xy.append((px, py))
+            self._planet_names.append(name)
             sym_color: _RGBA = (color[0] * 0.6, color[1] * 0.6, color[2] * 0.6, 0.55)  # type: ignore
-            self._add_glyph(state.glyph, x, y, 0.068, sym_color)
-
-        def _make_pt_vao(pts: list) -> Optional[moderngl.VertexArray]:
-            if not pts:
-                return None
-            vbo = self.ctx.buffer(np.array(pts, dtype="f4").tobytes())
-            return self.ctx.vertex_array(
-                self._star_prog, [(vbo, "2f 1f 3f", "in_pos", "in_size", "in_color")]
-            )
+            self._add_glyph(glyphs[i], px, py, 0.068, sym_color)
 
-        self._planet_vao: Optional[moderngl.VertexArray] = _make_pt_vao(planet_pts)
-        self._sun_vao    = _make_pt_vao(sun_pts)
+        pts = np.array(sun_pts + planet_pts, dtype="f4").reshape(-1, 6)
+        if pts.nbytes > self._planet_vbo.size:
+            self._planet_vbo.orphan(pts.nbytes)
+        if len(pts):
+            self._planet_vbo.write(pts.tobytes())
+        self._n_sun_pts    = len(sun_pts)
+        self._n_planet_pts = len(planet_pts)
 
         label_r = _DOME_R + 0.08
         for label, az in [("N", 0), ("E", 90), ("S", 180), ("W", 270)]:
-            x = -label_r * math.sin(math.radians(az))
-            y =  label_r * math.cos(math.radians(az))
-            self._add_text(label, x, y, 0.065, (0.45, 0.5, 0.62, 0.75))
+            lx = -label_r * math.sin(math.radians(az))
+            ly =  label_r * math.cos(math.radians(az))
+            self._add_text(label, lx, ly, 0.065, (0.45, 0.5, 0.62, 0.75))
 
         if self._title_str:
             self._add_text(self._title_str, 0.0, -_VIEWPORT + 0.06, 0.038, (0.35, 0.4, 0.52, 0.65))
 
-        self._build_constellation_boundaries()
-        self._build_constellation_labels()
         self._upload_glyphs()
 
-    def _build_ecliptic(self) -> None:
-        from atlas.models.celestial_state import SIGNS
-        T      = (self._jd - 2451545.0) / 36525.0
-        eps    = math.radians(23.439291111 - 0.013004167 * T)
-        lons   = np.arange(0, 361, 1.0)
-        l_rad  = np.radians(lons)
-        ra_deg  = np.degrees(np.arctan2(np.sin(l_rad) * math.cos(eps), np.cos(l_rad))) % 360.0
-        dec_deg = np.degrees(np.arcsin(np.clip(np.sin(eps) * np.sin(l_rad), -1.0, 1.0)))
-        alt, az = _radec_to_altaz(ra_deg, dec_deg, self._lat, self._lst)
-        above   = alt > 0.0
-
-        # Brighten the ecliptic at night, fade toward day
-        sun_alt   = next((s.alt for s in self._planets if s.name.lower() == "sun" and s.alt is not None), -18.0)
-        night_t   = max(0.0, min(1.0, (-sun_alt - 6.0) / 12.0))  # 0 at day, 1 at night
-        ecl_alpha = 0.12 + 0.53 * night_t
-        ecl_c: _RGBA = (0.82, 0.75, 0.38, ecl_alpha)
-        segs: list[float] = []
-        for i in range(len(lons) - 1):
-            if above[i] and above[i + 1]:
-                x0, y0 = _project(float(alt[i]),   float(az[i]))
-                x1, y1 = _project(float(alt[i+1]), float(az[i+1]))
-                segs += [x0, y0, *ecl_c, x1, y1, *ecl_c]
-
-        if segs:
-            vbo = self.ctx.buffer(np.array(segs, dtype="f4").tobytes())
-            self._ecliptic_vao = self.ctx.vertex_array(
-                self._line_prog, [(vbo, "2f 4f", "in_pos", "in_color")]
-            )
-            self._n_ecliptic = len(segs) // 6
-        else:
-            self._ecliptic_vao = None
-            self._n_ecliptic   = 0
-
-        # Zodiac glyphs along the ecliptic — brighter and larger than the line itself
-        glyph_c: _RGBA = (0.82, 0.75, 0.38, min(1.0, ecl_alpha * 1.6 + 0.10))
-        for i, (glyph, _) in enumerate(SIGNS):
-            lon = i * 30.0 + 15.0
-            l   = math.radians(lon)
-            ra  = math.degrees(math.atan2(math.sin(l) * math.cos(eps), math.cos(l))) % 360.0
-            dec = math.degrees(math.asin(max(-1.0, min(1.0, math.sin(eps) * math.sin(l)))))
-            a, z = _radec_to_altaz(np.array([ra]), np.array([dec]), self._lat, self._lst)
-            if float(a[0]) > 3.0:
-                x, y = _project(float(a[0]), float(z[0]))
-                self._add_glyph(glyph, x, y, 0.068, glyph_c)
-
-    def _build_constellation_labels(self) -> None:
-        dat_path = str(Path(_DATA_DIR) / "constellations.dat")
-        if not Path(dat_path).exists():
-            return
-        centers = _load_constellation_centers(dat_path)
-
-        sun_alt   = next((s.alt for s in self._planets if s.name.lower() == "sun" and s.alt is not None), -18.0)
-        night_t   = max(0.0, min(1.0, (-sun_alt - 6.0) / 12.0))
-        lbl_alpha = 0.15 + 0.70 * night_t
-        lbl_c: _RGBA = (1.0, 1.0, 1.0, lbl_alpha)
-
-        for abbr, (ra_deg, dec_deg) in centers.items():
-            a, z = _radec_to_altaz(np.array([ra_deg]), np.array([dec_deg]), self._lat, self._lst)
-            if float(a[0]) > 8.0:
-                x, y = _project(float(a[0]), float(z[0]))
-                self._add_text(abbr, x, y, 0.048, lbl_c)
-
-    def _build_constellation_boundaries(self) -> None:
-        dat_path = str(Path(_DATA_DIR) / "constellations.dat")
-        if not Path(dat_path).exists():
-            return
-
-        from collections import defaultdict
-
-        strips = []
-        with open(dat_path) as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) == 4:
-                    strips.append((float(parts[0]), float(parts[1]), float(parts[2]), parts[3]))
-        strips.sort(key=lambda s: (s[2], s[0]))
-
-        dec_vals = sorted(set(s[2] for s in strips))
-        by_dec: dict = defaultdict(list)
-        for ra_l, ra_h, dec_l, abbr in strips:
-            by_dec[dec_l].append((ra_l, ra_h, abbr))
-        for dec in by_dec:
-            by_dec[dec].sort()
-
-        sun_alt   = next((s.alt for s in self._planets if s.name.lower() == "sun" and s.alt is not None), -18.0)
-        night_t   = max(0.0, min(1.0, (-sun_alt - 6.0) / 12.0))
-        bnd_alpha = 0.04 + 0.18 * night_t
-        c         = (1.0, 1.0, 1.0, bnd_alpha)
-
-        line_segs: list[list[float]] = []
-
-        def _proj_seg(ra1_h: float, d1: float, ra2_h: float, d2: float) -> None:
-            a1, z1 = _radec_to_altaz(np.array([ra1_h * 15.0]), np.array([d1]), self._lat, self._lst)
-            a2, z2 = _radec_to_altaz(np.array([ra2_h * 15.0]), np.array([d2]), self._lat, self._lst)
-            if float(a1[0]) > 0.0 and float(a2[0]) > 0.0:
-                x1, y1 = _project(float(a1[0]), float(z1[0]))
-                x2, y2 = _project(float(a2[0]), float(z2[0]))
-                line_segs.append([x1, y1, *c, x2, y2, *c])
-
-        # Horizontal boundaries: at each dec level, only draw where the constellation
-        # above differs from the constellation below (i.e. an actual boundary, not interior)
-        for i in range(1, len(dec_vals)):
-            dec      = dec_vals[i]
-            prev_dec = dec_vals[i - 1]
-            for ra_l, ra_h, abbr in by_dec[dec]:
-                for p_ra_l, p_ra_h, p_abbr in by_dec[prev_dec]:
-                    ol = max(ra_l, p_ra_l)
-                    oh = min(ra_h, p_ra_h)
-                    if ol < oh - 1e-4 and p_abbr != abbr:
-                        step, ra = 0.5, ol
-                        while ra < oh - 1e-4:
-                            nr = min(ra + step, oh)
-                            _proj_seg(ra, dec, nr, dec)
-                            ra = nr
-
-        # Vertical boundaries: adjacent strips at the same dec level with different constellations.
-        # Height of each vertical segment = from this dec to the next dec level.
-        for i, dec in enumerate(dec_vals):
-            next_dec = dec_vals[i + 1] if i + 1 < len(dec_vals) else dec + 2.0
-            for j in range(len(by_dec[dec]) - 1):
-                _, ra_h1, abbr1 = by_dec[dec][j]
-                ra_l2, _,  abbr2 = by_dec[dec][j + 1]
-                if abs(ra_h1 - ra_l2) < 1e-3 and abbr1 != abbr2:
-                    step, d = 1.0, dec
-                    while d < next_dec - 1e-4:
-                        nd = min(d + step, next_dec)
-                        _proj_seg(ra_h1, d, ra_h1, nd)
-                        d = nd
-
-        if line_segs:
-            data = np.array(line_segs, dtype="f4").reshape(-1, 6)
-            vbo  = self.ctx.buffer(data.tobytes())
-            self._const_boundary_vao: Optional[moderngl.VertexArray] = self.ctx.vertex_array(
-                self._line_prog, [(vbo, "2f 4f", "in_pos", "in_color")]
-            )
-            self._n_const_boundary = len(data)
-        else:
-            self._const_boundary_vao = None
-            self._n_const_boundary   = 0
-
     def _sky_color(self) -> tuple[float, float, float]:
-        sun_alt = next(
-            (s.alt for s in self._planets if s.name.lower() == "sun" and s.alt is not None), None
-        )
-        if sun_alt is None or sun_alt < -18.0:
+        sun_alt = self._sun_alt()
+        if sun_alt < -18.0:
             return (0.01, 0.01, 0.04)
         if sun_alt < -12.0:
             t = (sun_alt + 18.0) / 6.0
@@ -643,39 +731,62 @@ class DomeView(BaseGLWindow):
         return (0.56 + 0.14 * t, 0.57 + 0.23 * t, 0.65 + 0.25 * t)
 
     def on_render(self, time: float, frame_time: float) -> None:
+        self._bind_uniforms()
         r, g, b = self._sky_color()
         self.ctx.clear(r, g, b)
 
-        sun_alt = next(
-            (s.alt for s in self._planets if s.name.lower() == "sun" and s.alt is not None), -18.0
-        )
+        sun_alt           = self._sun_alt()
+        night_t           = max(0.0, min(1.0, (-sun_alt - 6.0) / 12.0))  # 0 at day, 1 at night
         star_brightness   = max(0.08, min(2.0, (-sun_alt) / 6.0 * self._brightness))
         planet_brightness = max(0.25, min(1.0, (-sun_alt + 6.0) / 12.0))
-        sky_lum = sum(self._sky_color()) / 3.0
-        self._line_prog["u_line_alpha"] = 1.0 + sky_lum * 3.5  # type: ignore
+        sky_lum    = sum(self._sky_color()) / 3.0
+        line_alpha = 1.0 + sky_lum * 3.5
+        ecl_alpha  = 0.12 + 0.53 * night_t
+        self._line_prog["u_line_alpha"] = line_alpha  # type: ignore
 
         self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE
-        self._star_prog["u_brightness"] = star_brightness  # type: ignore
-        self._star_vao.render(moderngl.POINTS, vertices=self._n_stars)
-        if self._planet_vao:
+        self._drain_lod()
+        self._request_lod()
+        if self._star_vao:
+            self._sky_star_prog["u_brightness"] = star_brightness  # type: ignore
+            self._sky_star_prog["u_mag_limit"]  = self._lod_mag  # type: ignore
+            self._star_vao.render(moderngl.POINTS, vertices=self._n_stars)
+        if self._n_planet_pts:
             self._star_prog["u_brightness"] = planet_brightness  # type: ignore
-            self._planet_vao.render(moderngl.POINTS)
-        if self._sun_vao:
+            self._planet_vao.render(moderngl.POINTS, vertices=self._n_planet_pts, first=self._n_sun_pts)
+        if self._n_sun_pts:
             self._star_prog["u_brightness"] = 1.0  # type: ignore
-            self._sun_vao.render(moderngl.POINTS)
+            self._planet_vao.render(moderngl.POINTS, vertices=self._n_sun_pts)
 
         self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
         self._horizon_vao.render(moderngl.LINES)
-        if self._const_boundary_vao:
-            self._const_boundary_vao.render(moderngl.LINES, vertices=self._n_const_boundary)
-        if self._ecliptic_vao:
-            self._ecliptic_vao.render(moderngl.LINES, vertices=self._n_ecliptic)
-        if self._sym_glyph_vao:
+        self._render_tracks()
+
+        # Sky lines are clipped per fragment at the horizon; label quads drop out below their minimum altitude
+        self._sky_line_prog["u_min_alt"] = 0.0  # type: ignore
+        self._sky_line_prog["u_line_alpha"] = (0.04 + 0.18 * night_t) * line_alpha  # type: ignore
+        self._const_boundary_vao.render(moderngl.LINES, vertices=self._n_const_boundary)
+        self._sky_line_prog["u_line_alpha"] = ecl_alpha * line_alpha  # type: ignore
+        self._ecliptic_vao.render(moderngl.LINES, vertices=self._n_ecliptic)
+
+        self._sky_glyph_prog["u_sdf"] = self.GLYPH_SDF  # type: ignore
+        if self._zodiac_vao:
             self._sym_atlas.texture.use()
-            self._sym_glyph_vao.render(moderngl.TRIANGLES)
-        if self._txt_glyph_vao:
+            self._sky_glyph_prog["u_min_alt"] = 3.0  # type: ignore
+            self._sky_glyph_prog["u_alpha"]   = min(1.0, ecl_alpha * 1.6 + 0.10)  # type: ignore
+            self._zodiac_vao.render(moderngl.TRIANGLES)
+        if self._label_vao:
             self._txt_atlas.texture.use()
-            self._txt_glyph_vao.render(moderngl.TRIANGLES)
+            self._sky_glyph_prog["u_min_alt"] = 8.0  # type: ignore
+            self._sky_glyph_prog["u_alpha"]   = 0.15 + 0.70 * night_t  # type: ignore
+            self._label_vao.render(moderngl.TRIANGLES)
+
+        self._render_glyphs()
+
+        if self._hover is not None:
+            self._hover_vao.render(moderngl.LINES)
+        if self._region_from is not None:
+            self._region_vao.render(moderngl.LINES)
 
         self._panel.render()
 
@@ -684,30 +795,28 @@ class DomeView(BaseGLWindow):
             self._save_screenshot(self._save_path)
             self.wnd.close()
 
+    # Drawn over the horizon ring, under the sky lines; the time-lapse view draws its planet tracks here
+    def _render_tracks(self) -> None:
+        pass
+
     def on_mouse_press_event(self, x: float, y: float, button: int) -> None:
         if button == 1 and self._shift_held:
             self._drag_pan = True
             return
+        if button == 2:
+            self._region_from = self._region_to = self._pixel_to_chart(x, y)
+            self._write_region()
+            return
         if button != 1:
             return
-        cx, cy       = self._pixel_to_chart(x, y)
-        star_click_r = _CLICK_RADIUS / self._zoom
-        plan_click_r = star_click_r * 2.5
-
-        for i, (px, py) in enumerate(self._planet_xy):
-            if math.hypot(cx - px, cy - py) < plan_click_r:
-                self._select_planet(self._planet_names[i])
-                return
 
-        if self._n_stars > 0:
-            diff = self._star_xy - np.array([cx, cy], dtype=np.float32)
-            dist = np.hypot(diff[:, 0], diff[:, 1])
-            idx  = int(np.argmin(dist))
-            if dist[idx] < star_click_r:
-                self._select_star(idx)
-                return
-
-        self._panel.dismiss()
+        hit = self._pick(*self._pixel_to_chart(x, y))
+        if hit is None:
+            self._panel.dismiss()
+        elif hit[0] == "planet":
+            self._select_planet(self._planet_names[hit[1]])
+        else:
+            self._select_star(hit[1])
 
     def on_key_event(self, key, action, modifiers) -> None:  # type: ignore
         self._shift_held = bool(modifiers.shift)
@@ -728,15 +837,13 @@ class DomeView(BaseGLWindow):
 
     def _select_star(self, idx: int) -> None:
         from atlas.utils.constellation import identify_constellation
-        name = self._star_names[idx]
-        con  = None
-        if idx < len(self._star_radec):
-            ra, dec = float(self._star_radec[idx, 0]), float(self._star_radec[idx, 1])
-            con = identify_constellation(ra, dec)
+        row  = self._stars.rows[int(self._star_row[idx])]  # type: ignore[union-attr]
+        name = row["name"].decode("ascii", errors="replace").strip()
+        con  = identify_constellation(float(row["ra"]), float(row["dec"]))
         extra = {
-            "mag":           f"{self._star_mags[idx]:.2f}",
-            "ci":            f"{self._star_ci[idx]:.3f}",
-            "spect":         self._star_spect[idx],
+            "mag":           f"{float(row['mag']):.2f}",
+            "ci":            f"{float(row['ci']):.3f}",
+            "spect":         row["spect"].decode("ascii", errors="replace").strip(),
             "constellation": con or "",
         }
         if self._fetch_fn and name and not name.startswith("HYG-"):
@@ -747,6 +854,19 @@ class DomeView(BaseGLWindow):
                 pass
         self._panel.show_raw({"name": name or "Unknown", "type": "star", **extra})
 
+    # Summary panel for a rectangle selection: star count and the brightest star in it
+    def _select_region(self, rows: np.ndarray) -> None:
+        if not len(rows):
+            self._panel.dismiss()
+            return
+        top = rows[0]
+        self._panel.show_raw({
+            "name":      f"{len(rows)} star{'s' if len(rows) != 1 else ''}",
+            "type":      "star",
+            "brightest": top["name"].decode("ascii", errors="replace").strip() or "—",
+            "mag":       f"{float(top['mag']):.2f} … {float(rows[-1]['mag']):.2f}",
+        })
+
     def _pixel_to_chart(self, px: float, py: float) -> tuple[float, float]:
         w, h  = self.wnd.size
         side  = min(w, h)
@@ -763,12 +883,30 @@ class DomeView(BaseGLWindow):
             self._pan_x - half, self._pan_x + half,
             self._pan_y - half, self._pan_y + half,
         )
-        for prog in (self._star_prog, self._line_prog, self._glyph_prog):
+        for prog in (self._star_prog, self._line_prog, self._glyph_prog, *self._sky_progs):
             prog["proj"].write(proj.tobytes())  # type: ignore
 
     def on_mouse_position_event(self, x: float, y: float, dx: float, dy: float) -> None:  # type: ignore
         self._mouse_x = x
         self._mouse_y = y
+        self._update_hover(*self._pixel_to_chart(x, y))
+
+    # Ring around the object under the cursor; the buffer is only rewritten when the target changes
+    def _update_hover(self, cx: float, cy: float) -> None:
+        hit = self._pick(cx, cy)
+        if hit is None:
+            self._hover = None
+            return
+        ring_r = (_CLICK_RADIUS * (1.2 if hit[0] == "planet" else 0.6)) / self._zoom
+        hover  = (hit[2], hit[3], ring_r)
+        if hover == self._hover:
+            return
+        self._hover = hover
+        ring = _circle_verts(ring_r, segments=_HOVER_SEGS) + np.array([hit[2], hit[3]], dtype="f4")
+        data = np.empty((len(ring), 6), dtype="f4")
+        data[:, :2] = ring
+        data[:, 2:] = (0.75, 0.82, 1.0, 0.7)
+        self._hover_vbo.write(data.tobytes())
 
     def on_mouse_scroll_event(self, x_offset: float, y_offset: float) -> None:  # type: ignore
         cx, cy   = self._pixel_to_chart(self._mouse_x, self._mouse_y)
@@ -793,6 +931,10 @@ class DomeView(BaseGLWindow):
     def on_mouse_drag_event(self, x: float, y: float, dx: float, dy: float) -> None:  # type: ignore
         self._mouse_x = x
         self._mouse_y = y
+        if self._region_from is not None:
+            self._region_to = self._pixel_to_chart(x, y)
+            self._write_region()
+            return
         if self._drag_pan:
             w, h  = self.wnd.size
             side  = min(w, h)
@@ -804,3 +946,274 @@ class DomeView(BaseGLWindow):
     def on_mouse_release_event(self, x: float, y: float, button: int) -> None:  # type: ignore
         if button == 1:
             self._drag_pan = False
+        if button == 2 and self._region_from is not None:
+            (x0, y0), (x1, y1) = self._region_from, self._region_to or self._region_from
+            self._region_from  = self._region_to = None
+            self._select_region(self.stars_in_rect(x0, y0, x1, y1))
+
+    def _write_region(self) -> None:
+        (x0, y0), (x1, y1) = self._region_from, self._region_to  # type: ignore[misc]
+        corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+        data    = np.empty((8, 6), dtype="f4")
+        data[:, :2] = [corners[((i + 1) // 2) % 4] for i in range(8)]  # edges 0-1, 1-2, 2-3, 3-0
+        data[:, 2:] = (0.75, 0.82, 1.0, 0.5)
+        self._region_vbo.write(data.tobytes())
+
+
+#---------------#
+# PLANET TRACKS #
+#---------------#
+
+class DomeTracks:
+    # Planet positions for every step of a range, precomputed as (n_steps, n_bodies) arrays: apparent RA/Dec of
+    # date from one celestial frame, then altitude, azimuth and dome-plane x, y for all steps in one batched
+    # rotation. Positions are geometric (no refraction), like the star field they are drawn against.
+
+    def __init__(
+        self,
+        atlas:    "Atlas",
+        targets:  list[str],
+        location: "Location",
+        zodiac:   str,
+        start_dt: datetime,
+        end_dt:   datetime,
+        step:     timedelta,
+    ):
+        if step <= timedelta(0):
+            raise ValueError(f"step must be positive, got {step}")
+        if end_dt < start_dt:
+            raise ValueError(f"range ends before it starts: {start_dt} → {end_dt}")
+        self.start_dt = start_dt
+        self.step     = step
+
+        # Probe each target once; unavailable bodies are dropped
+        available = []
+        for target in targets:
+            try:
+                atlas.build_celestial_state(dt=start_dt, location=location, target=target, zodiac=zodiac,
+                                            properties=["position"], systems=["equatorial"])
+                available.append(target)
+            except Exception:
+                logging.info("dome tracks: skipping %s (not available)", target)
+
+        frame = atlas.build_celestial_frame(
+            targets=available, start_dt=start_dt, end_dt=end_dt, step=step, location=location,
+            zodiac=zodiac, properties=["position"], systems=["equatorial"],
+        )
+        self.jd     = frame.jd
+        self.names  = list(frame.names)
+        self.glyphs = list(frame.glyphs)
+        self.unit   = radec_to_unit(frame["ra"], frame["dec"])   # true equator of date, (n_steps, n_bodies, 3)
+
+        # Magnitudes drift over days and phenomena cost several positions each: sample them on a coarser grid
+        # spanning the range (daily, at most _TRACK_MAG_SAMPLES times) and interpolate to every step
+        mag_step = max(step, _TRACK_MAG_STEP, (end_dt - start_dt) / _TRACK_MAG_SAMPLES)
+        mag_end  = start_dt + mag_step * math.ceil((end_dt - start_dt) / mag_step)
+        mags     = atlas.build_celestial_frame(
+            targets=available, start_dt=start_dt, end_dt=mag_end, step=mag_step, location=location,
+            zodiac=zodiac, properties=["phenomenon"],
+        )
+        self.app_mag = np.empty(frame.shape)
+        for j in range(len(available)):
+            self.app_mag[:, j] = np.interp(self.jd, mags.jd, mags["app_mag"][:, j])
+
+        # Equator of date → horizon for every step at once: sidereal rotation per step, then the fixed latitude tilt
+        lst = np.radians((np.array([swe.sidtime(jd) for jd in self.jd]) * 15.0 + location.lon) % 360.0)
+        c, s = np.cos(lst), np.sin(lst)
+        rz   = np.zeros((len(lst), 3, 3))
+        rz[:, 0, 0], rz[:, 0, 1], rz[:, 1, 0], rz[:, 1, 1], rz[:, 2, 2] = c, s, -s, c, 1.0
+        h    = np.einsum("tij,tbj->tbi", rot_y(math.radians(90.0 - location.lat)) @ rz, self.unit)
+
+        self.alt, self.x, self.y = _dome_xy(h)
+        self.az = np.degrees(np.arctan2(h[..., 1], -h[..., 0])) % 360.0
+
+    def __len__(self) -> int:
+        return len(self.jd)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self.jd), len(self.names))
+
+    # Datetime at a (fractional) step
+    def dt(self, pos: float) -> datetime:
+        return self.start_dt + self.step * pos
+
+
+#-----------------#
+# DOME TIME-LAPSE #
+#-----------------#
+
+class DomeTimelapse(DomeView):
+    # Animated dome over a precomputed DomeTracks range. Each frame only moves the clock: the sky is one uniform
+    # update, planets are interpolated between track steps (in the equator of date, then rotated with the sky),
+    # and each planet's track so far is a prefix of one static line buffer.
+
+    RECORD_FPS: int = 60   # window recordings keep every rendered frame
+    EXPORT_FPS: int = 30   # offscreen export: fixed timestep, rendered as fast as the machine allows
+
+    # Class-level config — set by configure_timelapse(), copied to instance in __init__
+    _cfg_tracks:     Optional[DomeTracks] = None
+    _cfg_speed:      float                = 10.0
+    _cfg_fetch_at:   Optional[Callable]   = None
+    _cfg_video_path: Optional[str]        = None
+
+    @classmethod
+    def configure_timelapse(
+        cls,
+        tracks:     DomeTracks,
+        location:   "Location",
+        fetch_at:   Optional[Callable] = None,
+        mag_limit:  float              = 6.5,
+        brightness: float              = 1.0,
+        speed:      float              = 10.0,
+        save_path:  Optional[str]      = None,
+        title:      str                = "",
+    ) -> None:
+        cls.configure(dt=tracks.start_dt, location=location, planets=[], mag_limit=mag_limit,
+                      brightness=brightness, title=title)
+        cls._cfg_tracks     = tracks
+        cls._cfg_speed      = max(speed, 0.01)
+        cls._cfg_fetch_at   = staticmethod(fetch_at) if fetch_at is not None else None
+        cls._cfg_video_path = save_path
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        cls = self.__class__
+        if cls._cfg_tracks is None:
+            raise ValueError("DomeTimelapse needs configure_timelapse() before use")
+        self._tracks     = cls._cfg_tracks
+        self._speed      = cls._cfg_speed
+        self._label      = self._title_str
+        self._video_path = cls._cfg_video_path
+        self._recorder: Optional[ScreenRecorder] = None
+        self._paused     = False
+        self._pos        = 0.0                 # fractional step of the range on screen
+        self._shown_pos  = -1.0
+        self._n_segments = 0
+
+        # Clicked bodies are looked up at the instant on screen
+        fetch_at = cls._cfg_fetch_at
+        if fetch_at is not None:
+            self._fetch_fn = lambda name: fetch_at(name, self._tracks.dt(self._pos))
+
+        self._upload_tracks()
+        self._seek(0.0)
+
+    @property
+    def _last_pos(self) -> float:
+        return float(max(0, len(self._tracks) - 1))
+
+    # Every body's whole track as line segments, body after body; segments below the horizon, or jumping
+    # further than a smooth arc would between two steps, are transparent
+    def _upload_tracks(self) -> None:
+        tr          = self._tracks
+        n, n_bodies = tr.shape
+        self._track_stride = max(0, n - 1) * 2
+        if n < 2 or not n_bodies:
+            self._track_vao = None
+            return
+
+        x, y, alt = tr.x.T, tr.y.T, tr.alt.T   # (n_bodies, n)
+        seg = np.empty((n_bodies, n - 1, 2, 6), dtype="f4")
+        seg[:, :, 0, 0], seg[:, :, 0, 1] = x[:, :-1], y[:, :-1]
+        seg[:, :, 1, 0], seg[:, :, 1, 1] = x[:, 1:],  y[:, 1:]
+        seg[..., 2:5] = np.array([_PLANET_COLORS.get(name.lower(), _DEFAULT_PLANET_COLOR)[:3] for name in tr.names])[:, None, None, :]
+
+        shown = (alt[:, :-1] >= 0) & (alt[:, 1:] >= 0) & (np.hypot(np.diff(x), np.diff(y)) < _TRACK_MAX_JUMP)
+        seg[..., 5] = np.where(shown, _TRACK_ALPHA, 0.0)[..., None]
+        self._track_vao = self._make_vao(self._line_prog, seg.reshape(-1, 6), "2f 4f", "in_pos", "in_color")
+
+    def _render_tracks(self) -> None:
+        if self._track_vao is None or not self._n_segments:
+            return
+        for j in range(self._tracks.shape[1]):
+            self._track_vao.render(moderngl.LINES, first=j * self._track_stride, vertices=2 * self._n_segments)
+
+    # Show the range at fractional step pos: sky uniforms, interpolated planets, title and track length
+    def _seek(self, pos: float) -> None:
+        tr  = self._tracks
+        pos = min(max(pos, 0.0), self._last_pos)
+        self._pos = pos
+        if pos == self._shown_pos:
+            return
+        self._shown_pos = pos
+
+        i = min(int(pos), max(0, len(tr) - 2))
+        j = min(i + 1, len(tr) - 1)
+        t = pos - i
+
+        self._jd = tr.jd[i] + (tr.jd[j] - tr.jd[i]) * t
+        self._update_sky()
+        if abs(self._jd - self._ecliptic_jd) > _ECLIPTIC_REBUILD_DAYS:
+            self._ecliptic_jd = self._jd
+            self._upload_sky()
+
+        unit = tr.unit[i] * (1.0 - t) + tr.unit[j] * t
+        unit /= np.linalg.norm(unit, axis=-1, keepdims=True)
+        alt, x, y = _dome_xy(unit @ self._local.T)
+        mag       = tr.app_mag[i] * (1.0 - t) + tr.app_mag[j] * t
+
+        stamp = tr.dt(pos).strftime("%Y-%m-%d  %H:%M")
+        self._title_str  = f"{self._label}  {stamp}" if self._label else stamp
+        self._n_segments = i
+        self._place_planets(tr.names, tr.glyphs, alt, x, y, mag)
+
+    def on_key_event(self, key, action, modifiers) -> None:  # type: ignore
+        super().on_key_event(key, action, modifiers)
+        if action != self.wnd.keys.ACTION_PRESS:
+            return
+        keys = self.wnd.keys
+        if key == keys.SPACE:
+            self._paused = not self._paused
+        elif key in (keys.RIGHT, keys.LEFT):
+            direction = 1 if key == keys.RIGHT else -1
+            if modifiers.shift:
+                self._speed = self._speed * 2.0 if direction > 0 else max(0.25, self._speed / 2.0)
+            else:
+                self._seek(round(self._pos) + direction)
+
+    def on_render(self, time: float, frame_time: float) -> None:
+        if not self._paused:
+            self._seek(self._pos + frame_time * self._speed)
+        super().on_render(time, frame_time)
+
+        if self._video_path:
+            self._record()
+            if self._pos >= self._last_pos:
+                self._finish_recording()
+                self.wnd.close()
+
+    def on_close(self) -> None:
+        self._finish_recording()
+
+    # Stream the frame just drawn to the encoder, opened on the first call at the current viewport size
+    def _record(self) -> None:
+        if self._recorder is None:
+            self._recorder = ScreenRecorder(self._video_path, fps=self.RECORD_FPS)  # type: ignore[arg-type]
+        if not self._recorder.capture(self.ctx):
+            self._recorder, self._video_path = None, None
+
+    def _finish_recording(self) -> None:
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder, self._video_path = None, None
+
+    # Fixed-timestep export into an offscreen framebuffer: speed steps per second of video at fps, the last
+    # frame landing on the end of the range — no window, no wall clock
+    def export(self, path: str, fbo: moderngl.Framebuffer, fps: Optional[int] = None) -> int:
+        fps    = fps or self.EXPORT_FPS
+        last   = self._last_pos
+        n      = math.ceil(last * fps / self._speed) + 1
+        frames = FrameReader(self.ctx, fbo.size)
+
+        with VideoWriter(path, fps=fps) as video:
+            for k in range(n):
+                self._seek(min(k * self._speed / fps, last))
+                fbo.use()
+                super().on_render(0.0, 0.0)
+                video.write(frames.read(fbo))
+            for frame in frames.flush():
+                video.write(frame)
+        frames.release()
+        return video.frames
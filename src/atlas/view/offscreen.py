@@ -0,0 +1,269 @@
+# atlas/src/view/offscreen.py
+# Headless rendering: one standalone GL context reused for many images, charts and domes drawn into offscreen framebuffers
+
+# Standard Modules
+import io
+import logging
+import queue
+import sys
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+# Internal Modules
+from atlas.view.base import BaseGLWindow
+
+# External Modules
+import moderngl
+import numpy as np
+from PIL import Image
+
+if TYPE_CHECKING:
+    from atlas.models.location import Location
+
+
+# EGL runs without a display server (Mesa llvmpipe on GPU-less boxes); elsewhere moderngl's platform default
+def _default_backend() -> Optional[str]:
+    return "egl" if sys.platform.startswith("linux") else None
+
+
+class OffscreenRenderer:
+    # Owns a headless moderngl_window context. Each view class is instantiated once on first use — shaders,
+    # glyph atlases and the chart skeleton are built then — and later images only swap the view's data and
+    # redraw into a framebuffer cached per output size. Not thread-safe: use one renderer per thread.
+
+    def __init__(self, backend: Optional[str] = "default", gl_version: tuple[int, int] = (3, 3)):
+        from moderngl_window.context.headless import Window
+
+        backend = _default_backend() if backend == "default" else backend
+        try:
+            self._wnd = Window(size=(64, 64), gl_version=gl_version, backend=backend)
+        except Exception:
+            if backend is None:
+                raise
+            logging.warning("offscreen: %s backend unavailable, falling back to the platform default", backend)
+            self._wnd = Window(size=(64, 64), gl_version=gl_version, backend=None)
+
+        self.ctx: moderngl.Context = self._wnd.ctx
+        self._views: dict[type, BaseGLWindow]                    = {}
+        self._fbos:  dict[tuple[int, int], moderngl.Framebuffer] = {}
+
+    # The renderer's instance of a view class, created on first request
+    def view(self, cls: type) -> BaseGLWindow:
+        if cls not in self._views:
+            view = cls(ctx=self.ctx, wnd=self._wnd, timer=None)
+            view._save_path = None   # class config may carry a --save path; offscreen images are returned instead
+            self._views[cls] = view
+        return self._views[cls]
+
+    # Framebuffer for a square side or a (width, height) size
+    def _framebuffer(self, size: int | tuple[int, int]) -> moderngl.Framebuffer:
+        key = (size, size) if isinstance(size, int) else size
+        if key not in self._fbos:
+            self._fbos[key] = self.ctx.simple_framebuffer(key)
+        return self._fbos[key]
+
+    # Largest framebuffer side this context can render into
+    @property
+    def max_size(self) -> int:
+        info = self.ctx.info
+        return min(info["GL_MAX_RENDERBUFFER_SIZE"], *info["GL_MAX_VIEWPORT_DIMS"])
+
+    # One frame of a view into a size × size image
+    def render(self, view: BaseGLWindow, size: int) -> Image.Image:
+        fbo = self._framebuffer(size)
+        fbo.use()
+        view.on_resize(size, size)
+        view.on_render(0.0, 0.0)
+        data = fbo.read(components=3)
+        return Image.frombytes("RGB", (size, size), data).transpose(Image.FLIP_TOP_BOTTOM)  # type: ignore
+
+    def render_chart(self, cusps: list[float], celestials: list, aspects: list = [], size: int = 900, title: str = "") -> Image.Image:
+        from atlas.view.chart import RadixChart
+        view = self.view(RadixChart)
+        view.set_chart(cusps, celestials, aspects, title)  # type: ignore
+        return self.render(view, size)
+
+    def render_transit(self, cusps: list[float], celestials: list, transit_cusps: list[float], transit_celestials: list,
+                       transit_aspects: list = [], size: int = 900, title: str = "") -> Image.Image:
+        from atlas.view.chart import TransitChart
+        view = self.view(TransitChart)
+        view.set_chart(cusps, celestials, [], title,  # type: ignore
+                       transit_cusps=transit_cusps, transit_celestials=transit_celestials, transit_aspects=transit_aspects)
+        return self.render(view, size)
+
+    def render_dome(self, dt: datetime, location: "Location", planets: list, size: int = 900, title: Optional[str] = None) -> Image.Image:
+        from atlas.view.experimental.dome import DomeView
+        view = self.view(DomeView)
+        if title is not None:
+            view._title_str = title  # type: ignore
+        view.set_time(dt, planets, location)  # type: ignore
+        return self.render(view, size)
+
+    # Many radix charts as one sheet: a grid of tile × tile viewports, cols wide, filled row by row. charts are
+    # (cusps, celestials, aspects[, title]) tuples; an untitled chart is drawn without a title rather than with
+    # the previous one's. The view, its programs and the static skeleton are shared; per chart only the dynamic
+    # layer is rebuilt and drawn into its viewport. Sheets taller than the context's framebuffer limit are
+    # rendered in bands of whole rows.
+    def render_chart_grid(self, charts: list[tuple], cols: int = 4, tile: int = 600) -> Image.Image:
+        from atlas.view.chart import RadixChart
+
+        cols = max(1, min(cols, len(charts) or 1))
+        rows = -(-len(charts) // cols)
+        if cols * tile > self.max_size:
+            raise ValueError(f"{cols} columns of {tile}px exceed the {self.max_size}px framebuffer limit")
+
+        view  = self.view(RadixChart)
+        width = cols * tile
+        band  = max(1, min(rows, self.max_size // tile))
+        fbo   = self._framebuffer((width, band * tile))
+        sheet = np.empty((rows * tile, width, 3), dtype=np.uint8)
+
+        for top in range(0, rows, band):
+            n_rows = min(band, rows - top)
+            fbo.use()
+            fbo.clear(0.0, 0.0, 0.0, 1.0)
+            for i, chart in enumerate(charts[top * cols:(top + n_rows) * cols]):
+                view.set_chart(*chart[:3], title=chart[3] if len(chart) > 3 else "")  # type: ignore
+                col, row = i % cols, i // cols
+                self.ctx.viewport = (col * tile, (band - 1 - row) * tile, tile, tile)   # GL rows run bottom-up
+                view._bind_uniforms()
+                view._draw()  # type: ignore
+            h    = n_rows * tile
+            data = fbo.read(viewport=(0, (band - n_rows) * tile, width, h), components=3)
+            sheet[top * tile:top * tile + h] = np.frombuffer(data, dtype=np.uint8).reshape(h, width, 3)[::-1]
+        return Image.fromarray(sheet)
+
+    # PlaybackChart as configured by configure_playback() → video file; returns the frame count.
+    # A fresh view per export, since playback state (cursor, speed) is per run
+    def render_playback(self, path: str, size: int = 900, fps: Optional[int] = None) -> int:
+        from atlas.view.chart import PlaybackChart
+        view = PlaybackChart(ctx=self.ctx, wnd=self._wnd, timer=None)
+        view._save_path = None
+        return view.export(path, self._framebuffer(size), fps)
+
+    # DomeTimelapse as configured by configure_timelapse() → video file; returns the frame count.
+    # A fresh view per export, since the time-lapse cursor and speed are per run
+    def render_dome_timelapse(self, path: str, size: int = 900, fps: Optional[int] = None) -> int:
+        from atlas.view.experimental.dome import DomeTimelapse
+        view = DomeTimelapse(ctx=self.ctx, wnd=self._wnd, timer=None)
+        view._save_path = None
+        return view.export(path, self._framebuffer(size), fps)
+
+    def release(self) -> None:
+        for fbo in self._fbos.values():
+            fbo.release()
+        self._fbos.clear()
+        self._views.clear()
+        self._wnd.destroy()
+
+
+class RendererPool:
+    # A GL context is current on one thread only, so each renderer lives on its own worker thread and jobs
+    # reach it through a shared queue. Contexts are created by the workers on start and kept for the pool's life.
+
+    def __init__(self, size: int = 2, backend: Optional[str] = "default"):
+        self._jobs:    queue.Queue = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._worker, args=(backend,), name=f"atlas-render-{i}", daemon=True)
+            for i in range(max(1, size))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _worker(self, backend: Optional[str]) -> None:
+        try:
+            renderer: Optional[OffscreenRenderer] = OffscreenRenderer(backend)
+            error:    Optional[BaseException]     = None
+        except Exception as e:
+            logging.error("offscreen: could not create a render context: %s", e)
+            renderer, error = None, e
+
+        while (job := self._jobs.get()) is not None:
+            fn, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if renderer is None:
+                    raise RuntimeError("no headless GL context available") from error
+                future.set_result(fn(renderer))
+            except BaseException as e:
+                future.set_exception(e)
+
+        if renderer is not None:
+            renderer.release()
+
+    # Run fn(renderer) on the next free context
+    def submit(self, fn: Callable[[OffscreenRenderer], Any]) -> Future:
+        future: Future = Future()
+        self._jobs.put((fn, future))
+        return future
+
+    def run(self, fn: Callable[[OffscreenRenderer], Any], timeout: Optional[float] = None) -> Any:
+        return self.submit(fn).result(timeout)
+
+    def close(self) -> None:
+        for _ in self._threads:
+            self._jobs.put(None)
+        for t in self._threads:
+            t.join()
+
+
+_renderer: Optional[OffscreenRenderer] = None
+
+
+# Process-wide renderer for the module-level helpers, created on first use
+def default_renderer() -> OffscreenRenderer:
+    global _renderer
+    if _renderer is None:
+        _renderer = OffscreenRenderer()
+    return _renderer
+
+
+def encode_png(img: Image.Image, path: Optional[str] = None) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    if path:
+        with open(path, "wb") as f:
+            f.write(buf.getvalue())
+        logging.info("saved: %s", path)
+    return buf.getvalue()
+
+
+# Radix chart → PNG bytes (also written to path when given)
+def render_chart_png(cusps: list[float], celestials: list, aspects: list = [], size: int = 900,
+                     title: str = "", path: Optional[str] = None) -> bytes:
+    return encode_png(default_renderer().render_chart(cusps, celestials, aspects, size, title), path)
+
+
+def render_transit_png(cusps: list[float], celestials: list, transit_cusps: list[float], transit_celestials: list,
+                       transit_aspects: list = [], size: int = 900, title: str = "", path: Optional[str] = None) -> bytes:
+    return encode_png(default_renderer().render_transit(cusps, celestials, transit_cusps, transit_celestials,
+                                                  transit_aspects, size, title), path)
+
+
+def render_dome_png(dt: datetime, location: "Location", planets: list, size: int = 900,
+                    title: Optional[str] = None, path: Optional[str] = None) -> bytes:
+    return encode_png(default_renderer().render_dome(dt, location, planets, size, title), path)
+
+
+# Charts → one grid sheet PNG, or with tile_paths one PNG per chart cut from the same sheet (path then optional).
+# tile_paths are formatted with the chart's index, e.g. "family_{:02d}.png"
+def render_chart_grid_png(charts: list[tuple], cols: int = 4, tile: int = 600, path: Optional[str] = None,
+                          tile_paths: Optional[str] = None) -> bytes:
+    sheet = default_renderer().render_chart_grid(charts, cols, tile)
+    if tile_paths:
+        cols = sheet.width // tile
+        for i in range(len(charts)):
+            x, y = (i % cols) * tile, (i // cols) * tile
+            encode_png(sheet.crop((x, y, x + tile, y + tile)), tile_paths.format(i))
+    return encode_png(sheet, path)
+
+
+def render_playback_video(path: str, size: int = 900, fps: Optional[int] = None) -> int:
+    return default_renderer().render_playback(path, size, fps)
+
+
+def render_dome_video(path: str, size: int = 900, fps: Optional[int] = None) -> int:
+    return default_renderer().render_dome_timelapse(path, size, fps)
@@ -4,10 +4,15 @@ in vec2 v_uv;
 in vec4 v_color;
 
 uniform sampler2D tex;
+uniform bool      u_sdf;   // atlas alpha is a distance field with the outline at 0.5
 
 out vec4 out_color;
 
 void main() {
     float alpha = texture(tex, v_uv).a;
+    if (u_sdf) {
+        float w = max(fwidth(alpha), 1e-4);
+        alpha   = smoothstep(0.5 - w, 0.5 + w, alpha);
+    }
     out_color = vec4(v_color.rgb, v_color.a * alpha);
 }
@@ -1,8 +1,13 @@
 #version 330 core
 
-in vec2 in_pos;
-in vec2 in_uv;
-in vec4 in_color;
+// Per vertex: corner of the unit quad
+in vec2 in_corner;
+
+// Per instance: one glyph
+in vec2  in_center;
+in float in_size;
+in vec4  in_uv_rect;   // u0, v0, u1, v1
+in vec4  in_color;
 
 uniform mat4 proj;
 
@@ -10,7 +15,7 @@ out vec2 v_uv;
 out vec4 v_color;
 
 void main() {
-    gl_Position = proj * vec4(in_pos, 0.0, 1.0);
-    v_uv = in_uv;
+    gl_Position = proj * vec4(in_center + (in_corner - 0.5) * in_size, 0.0, 1.0);
+    v_uv = mix(in_uv_rect.xy, in_uv_rect.zw, in_corner);
     v_color = in_color;
 }
@@ -0,0 +1,17 @@
+#version 330 core
+
+// Per vertex: end of the unit segment (x = 0 start, 1 end)
+in vec2 in_end;
+
+// Per instance: one segment
+in vec4 in_points;   // x1, y1, x2, y2
+in vec4 in_color;
+
+uniform mat4 proj;
+
+out vec4 v_color;
+
+void main() {
+    gl_Position = proj * vec4(mix(in_points.xy, in_points.zw, in_end.x), 0.0, 1.0);
+    v_color = in_color;
+}
@@ -0,0 +1,33 @@
+#version 330 core
+
+in vec3 in_unit;
+in vec2 in_offset;
+in vec2 in_uv;
+in vec4 in_color;
+
+uniform mat4  proj;
+uniform mat3  sky;     // J2000 → horizon frame (x = south, y = east, z = zenith)
+uniform float dome_r;
+uniform float u_min_alt;
+uniform float u_alpha;
+
+out vec2 v_uv;
+out vec4 v_color;
+
+// Azimuthal equidistant dome: zenith at the centre, horizon at dome_r, north up, east left
+vec2 dome_xy(vec3 h, out float alt) {
+    alt         = degrees(asin(clamp(h.z, -1.0, 1.0)));
+    float rho   = max(length(h.xy), 1e-9);
+    float r     = (90.0 - alt) / 90.0 * dome_r;
+    return vec2(-r * h.y, -r * h.x) / rho;
+}
+
+void main() {
+    float alt;
+    vec2  xy = dome_xy(sky * in_unit, alt);
+
+    // Labels are anchored to a sky point; the whole quad is dropped once its anchor sinks below u_min_alt
+    gl_Position = alt > u_min_alt ? proj * vec4(xy + in_offset, 0.0, 1.0) : vec4(2.0, 2.0, 2.0, 1.0);
+    v_uv        = in_uv;
+    v_color     = vec4(in_color.rgb, in_color.a * u_alpha);
+}
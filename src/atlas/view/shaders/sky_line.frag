@@ -0,0 +1,13 @@
+#version 330 core
+
+uniform float u_line_alpha;
+uniform float u_min_alt;
+
+in vec4  v_color;
+in float v_alt;
+out vec4 out_color;
+
+void main() {
+    if (v_alt < u_min_alt) discard;
+    out_color = vec4(v_color.rgb, v_color.a * u_line_alpha);
+}
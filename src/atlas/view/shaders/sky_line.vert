@@ -0,0 +1,25 @@
+#version 330 core
+
+in vec3 in_unit;
+in vec4 in_color;
+
+uniform mat4  proj;
+uniform mat3  sky;     // J2000 → horizon frame (x = south, y = east, z = zenith)
+uniform float dome_r;
+
+out vec4  v_color;
+out float v_alt;
+
+// Azimuthal equidistant dome: zenith at the centre, horizon at dome_r, north up, east left
+vec2 dome_xy(vec3 h, out float alt) {
+    alt         = degrees(asin(clamp(h.z, -1.0, 1.0)));
+    float rho   = max(length(h.xy), 1e-9);
+    float r     = (90.0 - alt) / 90.0 * dome_r;
+    return vec2(-r * h.y, -r * h.x) / rho;
+}
+
+void main() {
+    vec2 xy     = dome_xy(sky * in_unit, v_alt);
+    gl_Position = proj * vec4(xy, 0.0, 1.0);
+    v_color     = in_color;
+}
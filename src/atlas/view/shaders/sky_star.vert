@@ -0,0 +1,31 @@
+#version 330 core
+
+in vec3  in_unit;
+in float in_size;
+in vec3  in_color;
+in float in_mag;
+
+uniform mat4  proj;
+uniform mat3  sky;     // J2000 → horizon frame (x = south, y = east, z = zenith)
+uniform float dome_r;
+uniform float u_mag_limit;   // level-of-detail cutoff: streamed-in faint stars hide again when zoomed out
+
+out vec3 v_color;
+
+// Azimuthal equidistant dome: zenith at the centre, horizon at dome_r, north up, east left
+vec2 dome_xy(vec3 h, out float alt) {
+    alt         = degrees(asin(clamp(h.z, -1.0, 1.0)));
+    float rho   = max(length(h.xy), 1e-9);
+    float r     = (90.0 - alt) / 90.0 * dome_r;
+    return vec2(-r * h.y, -r * h.x) / rho;
+}
+
+void main() {
+    float alt;
+    vec2  xy = dome_xy(sky * in_unit, alt);
+    bool  up = alt > -0.5 && in_mag <= u_mag_limit;
+
+    gl_Position  = up ? proj * vec4(xy, 0.0, 1.0) : vec4(2.0, 2.0, 2.0, 1.0);
+    gl_PointSize = up ? in_size : 0.0;
+    v_color      = in_color;
+}
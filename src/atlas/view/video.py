@@ -0,0 +1,128 @@
+# atlas/src/view/video.py
+# Streaming video export: asynchronous framebuffer readback through pixel-buffer objects, encoding on a writer thread
+
+# Standard Modules
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Optional
+
+# External Modules
+import moderngl
+import numpy as np
+
+
+class FrameReader:
+    # Ring of pixel-buffer objects: read_into() queues the copy into a PBO and returns without waiting for the
+    # GPU, and a frame's bytes are mapped `depth - 1` frames later, once that copy has long finished
+
+    def __init__(self, ctx: moderngl.Context, size: tuple[int, int], depth: int = 3):
+        self.size  = size
+        w, h       = size
+        self._pbos = [ctx.buffer(reserve=w * h * 3, dynamic=True) for _ in range(max(2, depth))]
+        self._next = 0
+        self._pending: deque[moderngl.Buffer] = deque()
+
+    # Start reading the viewport of fbo; returns the oldest finished frame (rows bottom-up) once the ring is full
+    def read(self, fbo: moderngl.Framebuffer, viewport: Optional[tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+        out = self._take() if len(self._pending) == len(self._pbos) else None
+        pbo = self._pbos[self._next]
+        self._next = (self._next + 1) % len(self._pbos)
+        x, y = viewport[:2] if viewport else (0, 0)
+        fbo.read_into(pbo, viewport=(x, y, *self.size), components=3, alignment=1)
+        self._pending.append(pbo)
+        return out
+
+    def _take(self) -> np.ndarray:
+        w, h = self.size
+        return np.frombuffer(self._pending.popleft().read(), dtype=np.uint8).reshape(h, w, 3)
+
+    # Frames still in flight, oldest first
+    def flush(self) -> list[np.ndarray]:
+        return [self._take() for _ in range(len(self._pending))]
+
+    def release(self) -> None:
+        self._pending.clear()
+        for pbo in self._pbos:
+            pbo.release()
+
+
+class VideoWriter:
+    # Frames reach the encoder through a bounded queue on a writer thread: memory stays at `depth` frames however
+    # long the recording, and the render loop only blocks when the encoder falls behind
+
+    def __init__(self, path: str, fps: float, depth: int = 8):
+        import imageio  # type: ignore  # fail here, on the caller's thread, if the encoder is missing
+
+        self.path    = path
+        self.frames  = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, args=(imageio, path, fps), name="atlas-video", daemon=True)
+        self._thread.start()
+
+    def _run(self, imageio, path: str, fps: float) -> None:
+        try:
+            with imageio.get_writer(path, fps=fps, macro_block_size=None) as writer:
+                while (frame := self._queue.get()) is not None:
+                    writer.append_data(np.ascontiguousarray(frame[::-1]))  # GL rows are bottom-up
+        except Exception as e:
+            self._error = e
+            while self._queue.get() is not None:   # keep draining so write() never blocks on a dead encoder
+                pass
+
+    # Queue one frame (h, w, 3) uint8 as read from GL; blocks while the queue is full
+    def write(self, frame: Optional[np.ndarray]) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"video encoder failed: {self._error}") from self._error
+        if frame is not None:
+            self._queue.put(frame)
+            self.frames += 1
+
+    # Flush the queue and finish the file
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise RuntimeError(f"video encoder failed: {self._error}") from self._error
+        logging.info("video saved: %s (%d frames)", self.path, self.frames)
+
+    def __enter__(self) -> "VideoWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ScreenRecorder:
+    # Window recording: each frame drawn to the screen is read from its viewport and streamed to a VideoWriter.
+    # The encoder and readback ring open on the first capture, at the viewport size of that frame.
+
+    def __init__(self, path: str, fps: float):
+        self.path = path
+        self._fps = fps
+        self._frames: Optional[FrameReader] = None
+        self._video:  Optional[VideoWriter] = None
+
+    # Queue the frame just drawn; False if the encoder is unavailable (recording is then abandoned)
+    def capture(self, ctx: moderngl.Context) -> bool:
+        x, y, w, h = ctx.viewport
+        if self._video is None:
+            try:
+                self._video = VideoWriter(self.path, fps=self._fps)
+            except ImportError:
+                logging.error("imageio required for video export: pip install imageio[ffmpeg]")
+                return False
+            self._frames = FrameReader(ctx, (w, h))
+        self._video.write(self._frames.read(ctx.screen, (x, y, w, h)))  # type: ignore[union-attr]
+        return True
+
+    def close(self) -> None:
+        if self._video is None or self._frames is None:
+            return
+        for frame in self._frames.flush():
+            self._video.write(frame)
+        self._frames.release()
+        self._video.close()
+        self._video, self._frames = None, None
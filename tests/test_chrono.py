@@ -0,0 +1,15 @@
+# Standard libraries
+from datetime import datetime, timedelta
+
+# Internal libraries
+from atlas.models.event import Event
+from atlas.utils.chrono import datetime_to_jd, jd_to_datetime
+
+
+# Every whole minute of a day survives datetime → JD → datetime, directly and through Event
+def test_jd_round_trip_minutes():
+    day = datetime(2024, 1, 1)
+    for m in range(1440):
+        t = day + timedelta(minutes=m)
+        assert jd_to_datetime(datetime_to_jd(t)) == t
+        assert Event(type="phase", at=t, body="Moon", detail="full", glyph="○").at == t
@@ -0,0 +1,43 @@
+# Standard libraries
+import random
+
+# Internal libraries
+from atlas.utils.constellation import _NAMES, _precess_to_b1875, identify_constellation, identify_constellations, load_constellation_data
+
+# External libraries
+import numpy as np
+
+
+# Reference lookup: first Roman strip (file order, descending dec_low) containing the B1875 position
+def _strip_scan(ra_deg: float, dec_deg: float):
+    ra_1875, dec_1875 = _precess_to_b1875(ra_deg, dec_deg)
+    for ra_low, ra_high, dec_low, abbr in load_constellation_data()["strips"].tolist():
+        if dec_1875 >= dec_low and ra_low <= ra_1875 / 15.0 < ra_high:
+            return _NAMES.get(abbr, abbr)
+    return None
+
+
+def _check(ra: np.ndarray, dec: np.ndarray) -> None:
+    names = identify_constellations(ra, dec)
+    for r, d, name in zip(ra.tolist(), dec.tolist(), names.tolist()):
+        expected = _strip_scan(r, d)
+        assert name == expected, (r, d)
+        assert identify_constellation(r, d) == expected, (r, d)
+
+
+# Uniform points on the sphere agree with the strip scan, through both the scalar and the vectorized lookup
+def test_vectorized_matches_strip_scan():
+    rng = random.Random(1875)
+    ra  = np.array([rng.uniform(0.0, 360.0) for _ in range(5000)])
+    dec = np.degrees(np.arcsin(np.array([rng.uniform(-1.0, 1.0) for _ in range(5000)])))
+    _check(ra, dec)
+
+
+# Both celestial poles and the RA seam, where 0° and 360° name the same meridian
+def test_poles_and_seam():
+    decs = np.array([-90.0, -89.999, -60.0, -30.0, 0.0, 30.0, 60.0, 89.999, 90.0])
+    for ra in (0.0, 1e-9, 359.999999, 360.0):
+        _check(np.full(len(decs), ra), decs)
+    assert identify_constellation(0.0, 90.0) == "Ursa Minor"
+    assert identify_constellation(0.0, -90.0) == "Octans"
+    assert identify_constellations(np.array([0.0]), decs).tolist() == identify_constellations(np.array([360.0]), decs).tolist()
@@ -0,0 +1,58 @@
+# Internal libraries
+from atlas.utils.interpolate import AngleHermite
+
+# External libraries
+import numpy as np
+
+
+def _hermite(p0, v0, p1, v1, h: float) -> AngleHermite:
+    interp = AngleHermite(len(p0))
+    interp.set(np.array(p0, dtype=float), np.array(v0, dtype=float), np.array(p1, dtype=float), np.array(v1, dtype=float), h)
+    return interp
+
+
+# Signed angular difference a - b in (-180, 180]
+def _wrap(a: np.ndarray, b) -> np.ndarray:
+    return (np.asarray(a) - np.asarray(b) + 180.0) % 360.0 - 180.0
+
+
+# The curve starts at p0 and ends at p1 (mod 360), including across the 0°/360° seam and for retrograde motion
+def test_endpoints():
+    p0 = [10.0, 359.5, 0.5,  200.0, 45.0]
+    p1 = [11.0,   0.5, 359.5, 199.0, 45.0]
+    v0 = [1.0,    1.0, -1.0,  -1.0,  0.0]
+    interp = _hermite(p0, v0, p1, v0, 1.0)
+    assert np.allclose(_wrap(interp(0.0), p0), 0.0, atol=1e-12)
+    assert np.allclose(_wrap(interp(1.0), p1), 0.0, atol=1e-12)
+    assert np.all((interp(0.5) >= 0.0) & (interp(0.5) < 360.0))
+
+
+# A body covering more than 180° per step (the Moon at a 15-day step) unwraps along its direction of travel,
+# not the short way round
+def test_fast_body_unwraps_forward():
+    v      = 13.2
+    h      = 15.0
+    p0     = 100.0
+    p1     = (p0 + v * h) % 360.0   # 198° ahead, which the short way would read as 162° behind
+    interp = _hermite([p0], [v], [p1], [v], h)
+    assert abs(interp.d[0] - v * h) < 1e-9
+    for t in np.linspace(0.0, 1.0, 11):
+        assert abs(_wrap(interp(t)[0], p0 + v * h * t)) < 1e-9
+
+    # Retrograde the same way round
+    interp = _hermite([p0], [-v], [(p0 - v * h) % 360.0], [-v], h)
+    assert abs(interp.d[0] + v * h) < 1e-9
+
+
+# Missing speeds fall back to the chord slope, so the motion is linear between the keyframes
+def test_nan_speed_uses_chord():
+    interp = _hermite([350.0, 20.0], [np.nan, np.nan], [10.0, 14.0], [np.nan, np.nan], 2.0)
+    assert np.allclose(interp.v0, [10.0, -3.0])
+    assert np.allclose(interp.v1, [10.0, -3.0])
+    for t in np.linspace(0.0, 1.0, 9):
+        assert np.allclose(_wrap(interp(t), [350.0 + 20.0 * t, 20.0 - 6.0 * t]), 0.0, atol=1e-12)
+
+    # One missing end: only that end takes the chord slope
+    interp = _hermite([0.0], [np.nan], [4.0], [1.0], 2.0)
+    assert interp.v0[0] == 2.0 and interp.v1[0] == 1.0
+    assert np.allclose(_wrap(interp(1.0), 4.0), 0.0, atol=1e-12)
@@ -0,0 +1,59 @@
+# Standard libraries
+import random
+
+# Internal libraries
+from atlas.view.chart import _LabelLayout, _spread_labels
+
+# External libraries
+import numpy as np
+
+
+# Smallest circular distance between any two labels
+def _min_gap(out: np.ndarray) -> float:
+    x = np.sort(out)
+    return float(np.min(np.diff(x, append=x[0] + 360.0)))
+
+
+# Random rings — sparse, crowded and clumped — end with every neighbouring pair at least tolerance apart
+def test_spread_min_gap():
+    rng = random.Random(46)
+    for _ in range(500):
+        n    = rng.randint(2, 40)
+        tol  = rng.choice((2.0, 5.0, 8.0))
+        base = rng.uniform(0.0, 360.0)
+        lons = np.array([(base + rng.gauss(0.0, rng.choice((3.0, 30.0, 180.0)))) % 360.0 for _ in range(n)])
+        out  = _spread_labels(lons, tol)[0]
+        assert _min_gap(out) >= min(tol, 360.0 / n) - 1e-9
+        assert np.all((out >= 0.0) & (out < 360.0))
+
+
+# A cluster straddling 0°/360° spreads across the seam instead of being split at it
+def test_spread_wraps_seam():
+    lons = np.array([359.0, 0.0, 1.0, 358.5, 0.5])
+    out  = _spread_labels(lons, 5.0)[0]
+    assert _min_gap(out) >= 5.0 - 1e-9
+    rel  = np.sort((out - 359.8 + 180.0) % 360.0 - 180.0)  # offsets from the cluster's mean, -0.2°
+    assert np.allclose(rel, [-10.0, -5.0, 0.0, 5.0, 10.0])
+
+
+# More labels than fit at the tolerance: the ring fills evenly at 360 / n
+def test_spread_fully_crowded_ring():
+    for lons in (np.zeros(90), np.linspace(0.0, 359.0, 120), np.array([10.0] * 50 + [200.0] * 50)):
+        out = _spread_labels(lons, 5.0)[0]
+        assert abs(_min_gap(out) - 360.0 / len(lons)) < 1e-9
+
+
+# Within REUSE_DEG of the last full solve, the cached layout equals a cold solve of the new longitudes
+def test_layout_cache_matches_cold_solve():
+    rng = random.Random(7)
+    for _ in range(200):
+        n      = rng.randint(2, 20)
+        lons   = np.array([rng.uniform(0.0, 360.0) for _ in range(n)])
+        layout = _LabelLayout(5.0)
+        assert np.allclose(layout.solve(lons), _spread_labels(lons, 5.0)[0])
+
+        # A common drift keeps every gap, so the cluster structure cannot change
+        moved  = (lons + rng.uniform(-_LabelLayout.REUSE_DEG, _LabelLayout.REUSE_DEG)) % 360.0
+        cached = layout.solve(moved)
+        cold   = _spread_labels(moved, 5.0)[0]
+        assert np.allclose((cached - cold + 180.0) % 360.0 - 180.0, 0.0, atol=1e-9)
@@ -0,0 +1,24 @@
+# Internal libraries
+from atlas.utils.chrono import J2000_JD
+from atlas.utils.precession import precess_radec, precession_matrix
+
+# External libraries
+import numpy as np
+
+
+# Meeus, Astronomical Algorithms, example 21.b: θ Persei from J2000.0 to 2028 Nov 13.19 TD
+# (proper motion already applied to the starting position, as in the worked example)
+def test_precession_meeus_21b():
+    ra0  = (2 + 44 / 60 + 12.975 / 3600) * 15.0
+    dec0 = 49 + 13 / 60 + 39.896 / 3600
+    ra, dec = precess_radec(np.array([ra0]), np.array([dec0]), J2000_JD, 2462088.69)
+    assert abs(ra[0]  - (2 + 46 / 60 + 11.331 / 3600) * 15.0) < 1e-5
+    assert abs(dec[0] - (49 + 20 / 60 + 54.54 / 3600)) < 1e-5
+
+
+# The matrix is a rotation, and precessing back recovers the identity
+def test_precession_matrix_inverse():
+    m    = precession_matrix(J2000_JD, 2462088.69)
+    back = precession_matrix(2462088.69, J2000_JD)
+    assert np.allclose(m @ m.T, np.eye(3), atol=1e-14)
+    assert np.allclose(back @ m, np.eye(3), atol=1e-9)
@@ -0,0 +1,88 @@
+# Standard libraries
+import random
+
+# Internal libraries
+from atlas.utils.spatial import PointGrid
+
+# External libraries
+import numpy as np
+
+
+CELL = 10.0
+
+
+# Random points plus points sitting exactly on, and a hair either side of, cell edges, and points hugging
+# both sides of the RA seam (x = 0 and x = 360 are far apart on a flat grid)
+def _points(rng: random.Random) -> np.ndarray:
+    pts  = [(rng.uniform(0.0, 360.0), rng.uniform(-90.0, 90.0)) for _ in range(400)]
+    pts += [(CELL * rng.randint(0, 36) + e, CELL * rng.randint(-9, 9) + f)
+            for e in (0.0, 1e-9, -1e-9) for f in (0.0, 1e-9, -1e-9) for _ in range(10)]
+    pts += [(x, rng.uniform(-90.0, 90.0)) for x in (0.0, 1e-6, 0.5, 359.5, 360.0 - 1e-6, 360.0) for _ in range(5)]
+    return np.array(pts)
+
+
+def _queries(rng: random.Random) -> list[tuple[float, float]]:
+    qs  = [(rng.uniform(-20.0, 380.0), rng.uniform(-110.0, 110.0)) for _ in range(200)]
+    qs += [(CELL * rng.randint(0, 36), CELL * rng.randint(-9, 9)) for _ in range(50)]
+    qs += [(x, y) for x in (0.0, 360.0, -0.5, 360.5) for y in (-90.0, 0.0, 90.0)]
+    return qs
+
+
+def test_within_rect_matches_brute_force():
+    rng  = random.Random(37)
+    xy   = _points(rng)
+    grid = PointGrid(xy, CELL)
+    for x, y in _queries(rng):
+        w, h   = rng.choice((0.0, 1e-9, 3.0, CELL, 25.0, 400.0)), rng.choice((0.0, 1e-9, 3.0, CELL, 25.0, 200.0))
+        x1, y1 = x + rng.choice((-1, 1)) * w, y + rng.choice((-1, 1)) * h
+        lo_x, hi_x, lo_y, hi_y = min(x, x1), max(x, x1), min(y, y1), max(y, y1)
+        brute  = np.flatnonzero((xy[:, 0] >= lo_x) & (xy[:, 0] <= hi_x) & (xy[:, 1] >= lo_y) & (xy[:, 1] <= hi_y))
+        assert sorted(grid.within_rect(x, y, x1, y1).tolist()) == brute.tolist()
+
+
+def test_within_radius_matches_brute_force():
+    rng  = random.Random(38)
+    xy   = _points(rng)
+    grid = PointGrid(xy, CELL)
+    for x, y in _queries(rng):
+        r     = rng.choice((0.0, 1e-9, 2.0, CELL, 17.0, 500.0))
+        dist  = np.hypot(xy[:, 0] - x, xy[:, 1] - y)
+        hits  = grid.within_radius(x, y, r)
+        assert sorted(hits.tolist()) == np.flatnonzero(dist <= r).tolist()
+        assert np.all(np.diff(dist[hits]) >= 0.0)
+
+
+def test_nearest_matches_brute_force():
+    rng  = random.Random(39)
+    xy   = _points(rng)
+    grid = PointGrid(xy, CELL)
+    for x, y in _queries(rng):
+        dist = np.hypot(xy[:, 0] - x, xy[:, 1] - y)
+        best = float(dist.min())
+
+        # Unbounded: some closest point (ties may resolve to any of them)
+        i = grid.nearest(x, y)
+        assert i is not None and dist[i] == best
+
+        # Bounded: None exactly when nothing lies within the radius
+        for r in (1e-9, 1.0, CELL, 30.0):
+            i = grid.nearest(x, y, r)
+            assert (i is None) == (best > r)
+            if i is not None:
+                assert dist[i] == best
+
+
+# Points at RA 0 and RA 360 are the two ends of the grid, not neighbours
+def test_seam_is_flat():
+    grid = PointGrid(np.array([[0.5, 0.0], [359.5, 0.0], [180.0, 0.0]]), CELL)
+    assert grid.nearest(0.0, 0.0) == 0
+    assert grid.nearest(360.0, 0.0) == 1
+    assert grid.within_radius(0.0, 0.0, 1.0).tolist() == [0]
+    assert grid.nearest(0.0, 0.0, 0.1) is None
+
+
+def test_empty_grid():
+    grid = PointGrid(np.empty((0, 2)), CELL)
+    assert grid.nearest(0.0, 0.0) is None
+    assert grid.within_radius(0.0, 0.0, 10.0).tolist() == []
+    assert grid.within_rect(-1.0, -1.0, 1.0, 1.0).tolist() == []